@@ -7,7 +7,9 @@ from .extensions import mongo, jwt, cors, scheduler as apscheduler
 from .auth.routes import auth_bp
 from .news.routes import news_bp
 from .comments.routes import comments_bp
+from .monitoring.routes import monitoring_bp
 from .scheduler import register_jobs
+from .indexes import ensure_in_background
 
 
 def create_app(start_scheduler=True) -> Flask:
@@ -17,9 +19,11 @@ def create_app(start_scheduler=True) -> Flask:
     # ── Extensions ─────────────────────────────
     mongo.init_app(app)
     jwt.init_app(app)
-    cors.init_app(app, resources={r"/*": {"origins": "*"}})
+    cors.init_app(app, resources={r"/*": {"origins": "*"}}, expose_headers=["X-Next-Cursor"])
+    if app.config["ENSURE_INDEXES"]:
+        ensure_in_background(app)
     apscheduler.init_app(app)
-    register_jobs(apscheduler)
+    register_jobs(apscheduler, app.config["INGEST_MODE"])
     if start_scheduler:
         apscheduler.start()
 
@@ -27,6 +31,7 @@ def create_app(start_scheduler=True) -> Flask:
     app.register_blueprint(auth_bp, url_prefix="")
     app.register_blueprint(news_bp, url_prefix="/api")
     app.register_blueprint(comments_bp, url_prefix="/api")
+    app.register_blueprint(monitoring_bp, url_prefix="")
 
     # ── Error handlers ─────────────────────────
     @app.errorhandler(400)
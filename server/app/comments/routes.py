@@ -3,7 +3,7 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 from marshmallow import ValidationError
 
 from ..schemas import CommentSchema
-from ..models import add_comment, get_news
+from ..models import add_comment, news_exists
 from ..utils import required
 
 comments_bp = Blueprint("comments", __name__)
@@ -13,7 +13,7 @@ _comment_schema = CommentSchema()
 @comments_bp.post("/news/<news_id>/add_comment")
 @jwt_required()
 def add_comment_route(news_id): # pragma: no cover
-    if not get_news(news_id):
+    if not news_exists(news_id):
         return jsonify({"error": "News not found"}), 404
 
     data = request.get_json(force=True, silent=True) or {}
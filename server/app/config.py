@@ -13,3 +13,10 @@ class Config:
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY") or "please_change_me"
     JWT_ACCESS_TOKEN_EXPIRES = 60 * 60 * 24     # 24 h
     SCHEDULER_API_ENABLED = os.getenv("SCHEDULER_API_ENABLED", "True") == "True"
+    # "inline": scheduled jobs run in the web process; "queue": they are only
+    # enqueued on `Jobs` for `python -m app.worker` to run.
+    INGEST_MODE = os.getenv("INGEST_MODE", "inline")
+    # build the indexes in app/indexes.py on a background thread at startup
+    ENSURE_INDEXES = os.getenv("ENSURE_INDEXES", "True") == "True"
+    # serve repeated GET /api/news pages from memory (app/services/feed_cache.py)
+    FEED_CACHE_ENABLED = os.getenv("FEED_CACHE_ENABLED", "True") == "True"
@@ -0,0 +1,167 @@
+"""
+Index bootstrap and index-usage check for every collection the app queries.
+
+    python -m app.indexes            # build missing indexes (idempotent)
+    python -m app.indexes --check    # explain() every model query, fail on COLLSCAN
+
+create_app() also builds them on a background thread at startup (set
+ENSURE_INDEXES=False to skip, e.g. in tests). Building is idempotent:
+create_indexes() is a no-op for indexes that already exist. One that
+cannot be built – an older index with the same keys but other options, or
+duplicate keys under a unique index – is logged and skipped, never fatal.
+
+The feed indexes follow equality → sort → range order, so a category +
+positivity page – including a keyset page after a cursor – is read
+straight off the index, newest first, with no in-memory sort.
+"""
+
+from __future__ import annotations
+import argparse, logging, sys, threading
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+from .extensions import mongo
+
+INDEXES: Dict[str, List[IndexModel]] = {
+    "News_reserve": [
+        IndexModel([("category", ASCENDING), ("created_date", DESCENDING), ("_id", DESCENDING),
+                    ("positivity", ASCENDING)], name="category_feed"),
+        IndexModel([("created_date", DESCENDING), ("_id", DESCENDING), ("positivity", ASCENDING)],
+                   name="feed"),
+        IndexModel([("source_url", ASCENDING)], name="source_url", unique=True, sparse=True),
+    ],
+    "Comments": [
+        IndexModel([("news_id", ASCENDING), ("created_date", DESCENDING)], name="news_comments"),
+    ],
+    "Reactions": [
+        IndexModel([("news_id", ASCENDING), ("reaction_type", ASCENDING)], name="news_reactions"),
+    ],
+    "Users": [
+        IndexModel([("email", ASCENDING)], name="email", unique=True),
+    ],
+}
+
+
+def build(name: str) -> List[str]:
+    """Build the indexes declared for one collection; returns the ones that failed."""
+    failed = []
+    for model in INDEXES.get(name, []):  # one at a time, so one conflict doesn't block the rest
+        try:
+            mongo.db[name].create_indexes([model])
+        except OperationFailure as exc:
+            index = model.document["name"]
+            logging.error("Index %s.%s not built: %s", name, index, exc)
+            failed.append(index)
+    return failed
+
+
+def ensure_indexes() -> Dict[str, List[str]]:
+    """Build every declared index; returns {collection: [failed index names]}."""
+    from .services import analysis_cache, fingerprint
+    from .services.ingest import REANALYSIS_QUEUE
+    from .services.jobs import JOBS
+
+    failed = {name: build(name) for name in INDEXES}
+
+    # indexes owned by the services
+    analysis_cache.ensure_index()
+    fingerprint.ensure_index()
+    REANALYSIS_QUEUE.ensure_indexes()
+    JOBS.ensure_indexes()
+    return {name: names for name, names in failed.items() if names}
+
+
+def ensure_in_background(app) -> threading.Thread:
+    """Build indexes without holding up startup."""
+
+    def run() -> None:
+        with app.app_context():
+            try:
+                failed = ensure_indexes()
+            except Exception:  # e.g. Mongo unreachable – the app still serves
+                logging.exception("Index bootstrap failed")
+                return
+            logging.info("Indexes ready%s", f" except {failed}" if failed else "")
+
+    t = threading.Thread(target=run, name="index-bootstrap", daemon=True)
+    t.start()
+    return t
+
+
+# ── check mode ─────────────────────────────────────────────
+def model_queries() -> Iterator[Tuple[str, str, Dict[str, Any], Optional[List[Tuple[str, int]]]]]:
+    """(label, collection, filter, sort) for each query the models / ingest run."""
+    from .models import NEWS_SORT, news_filter
+
+    after = (datetime(2025, 1, 1), ObjectId("0" * 24))
+    for label, kwargs in (
+        ("list_news", {}),
+        ("list_news(positivity)", {"positivity": 60}),
+        ("list_news(category)", {"category": "tech"}),
+        ("list_news(positivity, category)", {"positivity": 60, "category": "tech"}),
+        ("list_news(after)", {"after": after}),
+        ("list_news(positivity, category, after)", {"positivity": 60, "category": "tech", "after": after}),
+    ):
+        yield label, "News_reserve", news_filter(**kwargs), NEWS_SORT
+    yield "ingest upsert", "News_reserve", {"source_url": "https://example.com/a"}, None
+    yield "list_comments", "Comments", {"news_id": "0" * 24}, [("created_date", DESCENDING)]
+    yield "get_reaction", "Reactions", {"news_id": "0" * 24, "reaction_type": "1"}, None
+    yield "get_user_by_email", "Users", {"email": "someone@example.com"}, None
+
+
+def _stages(plan: Any) -> Iterator[str]:
+    """Every `stage` in an explain() plan tree (classic or SBE layout)."""
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            yield plan["stage"]
+        for value in plan.values():
+            yield from _stages(value)
+    elif isinstance(plan, list):
+        for value in plan:
+            yield from _stages(value)
+
+
+def check() -> List[str]:
+    """Labels of model queries whose winning plan scans a whole collection."""
+    scans = []
+    for label, name, query, sort in model_queries():
+        cursor = mongo.db[name].find(query).limit(20)
+        if sort:
+            cursor = cursor.sort(sort)
+        plan = cursor.explain().get("queryPlanner", {}).get("winningPlan", {})
+        stages = set(_stages(plan))
+        logging.info("%-32s %s", label, ", ".join(sorted(stages)))
+        if "COLLSCAN" in stages:
+            scans.append(label)
+    return scans
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--check", action="store_true",
+                        help="explain() the model queries; exit 1 on any COLLSCAN")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    from . import create_app
+
+    app = create_app(start_scheduler=False)
+    with app.app_context():
+        if args.check:
+            scans = check()
+            if scans:
+                logging.error("Collection scans: %s", ", ".join(scans))
+                sys.exit(1)
+            logging.info("Every model query uses an index")
+        else:
+            failed = ensure_indexes()
+            if failed:
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""
+Bulk-load NDJSON/JSONL exports into News_reserve, Users, Comments or Reactions.
+
+    python -m app.loader news     data/sample_news.jsonl [more.jsonl.gz ...]
+    python -m app.loader users    data/sample_users.jsonl [--hash-workers 8] [--rounds 12]
+    python -m app.loader comments comments.jsonl.gz
+                         [--batch 5000] [--drop] [--limit N]
+
+One JSON object per line; `.gz` files are decompressed on the fly and `-`
+reads stdin. Extended JSON ({"$date": ...}, {"$oid": ...}) is understood,
+and ISO-8601 strings in created_date / published_at become datetimes.
+
+Files are streamed: a reader thread parses batches of --batch lines while
+the previous batch is written, so memory stays flat whatever the input
+size. Each batch is one unordered insert_many; rows that collide with an
+existing document on the collection's key (news: source_url, users: email,
+comments and reactions: _id) are then applied as one unordered bulk $set instead, so
+re-loading a file updates rather than duplicates. The collection's indexes
+(app/indexes.py) are built first; without the unique one on the key (e.g.
+duplicates already stored) every row goes through an upsert, which is
+correct but much slower.
+
+Users are given as plain `password`s and hashed with bcrypt on
+--hash-workers processes (already-hashed `$2…$` values are kept). Missing
+created_date defaults to the load time. The scheduler is never started.
+"""
+
+from __future__ import annotations
+import argparse, gzip, io, json, logging, os, sys, time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from bson import json_util
+from passlib.hash import bcrypt
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from .extensions import mongo
+from .indexes import build
+from .services import feed_cache
+from .services.pipeline import run_pipeline
+
+COLLECTIONS = {
+    # kind: (collection, key, unique index on key)
+    "news":     ("News_reserve", "source_url", True),
+    "users":    ("Users",        "email",      True),
+    "comments": ("Comments",     "_id",        False),
+    "reactions": ("Reactions",   "_id",        False),
+}
+_DATE_FIELDS = ("created_date", "published_at")
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+
+# ── reading ────────────────────────────────────────────────
+def _open(path: str) -> io.TextIOBase:
+    if path == "-":
+        return sys.stdin
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def _parse_date(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return value
+        if dt.tzinfo is not None:  # stored naive UTC, like everything else
+            dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+        return dt
+    return value
+
+
+def read_docs(paths: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Every JSON object in `paths`, in order; blank lines are skipped."""
+    for path in paths:
+        with _open(path) as fh:
+            for n, line in enumerate(fh, 1):
+                if not line.strip():
+                    continue
+                try:
+                    doc = json.loads(line, object_hook=json_util.object_hook)
+                except ValueError as exc:
+                    raise ValueError(f"{path}:{n}: {exc}") from None
+                for field in _DATE_FIELDS:
+                    if field in doc:
+                        doc[field] = _parse_date(doc[field])
+                yield doc
+
+
+def batched(docs: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    it = iter(docs)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+# ── per-collection preparation ─────────────────────────────
+def _hash(args: Tuple[str, int]) -> str:
+    password, rounds = args
+    return bcrypt.using(rounds=rounds).hash(password)
+
+
+def prepare(kind: str, docs: List[Dict[str, Any]], pool: Optional[Executor] = None,
+            rounds: int = 12) -> List[Dict[str, Any]]:
+    """Normalise a batch in place: defaults, lower-cased emails, hashed passwords."""
+    now = datetime.utcnow()
+    for doc in docs:
+        doc.setdefault("created_date", now)
+    if kind != "users":
+        return docs
+
+    todo = []
+    for doc in docs:
+        doc["email"] = doc["email"].lower()
+        if not str(doc.get("password", "")).startswith(_BCRYPT_PREFIXES):
+            todo.append(doc)
+    jobs = [(doc["password"], rounds) for doc in todo]
+    hashed = map(_hash, jobs) if pool is None else pool.map(_hash, jobs, chunksize=16)
+    for doc, pw in zip(todo, hashed):
+        doc["password"] = pw
+    return docs
+
+
+# ── writing ────────────────────────────────────────────────
+def _as_update(doc: Dict[str, Any], key: str) -> UpdateOne:
+    fields = {k: v for k, v in doc.items() if k not in ("_id", "created_date", key)}
+    update: Dict[str, Any] = {"$setOnInsert": {"created_date": doc["created_date"]}}
+    if fields:
+        update["$set"] = fields
+    return UpdateOne({key: doc[key]}, update, upsert=True)
+
+
+def _upsert(col, docs: List[Dict[str, Any]], key: str) -> Tuple[int, int]:
+    res = col.bulk_write([_as_update(d, key) for d in docs], ordered=False)
+    return res.upserted_count, res.modified_count
+
+
+def write_batch(col, docs: List[Dict[str, Any]], key: str, unique: bool) -> Tuple[int, int]:
+    """
+    Store one batch; returns (inserted, updated).
+    Documents without the key are plain inserts.
+    """
+    if not unique and key != "_id":
+        keyed = [d for d in docs if d.get(key) is not None]
+        plain = [d for d in docs if d.get(key) is None]
+        inserted, updated = _upsert(col, keyed, key) if keyed else (0, 0)
+        if plain:
+            inserted += len(col.insert_many(plain, ordered=False).inserted_ids)
+        return inserted, updated
+
+    had_id = {id(d) for d in docs if "_id" in d}
+    try:
+        return len(col.insert_many(docs, ordered=False).inserted_ids), 0
+    except BulkWriteError as exc:
+        errors = exc.details.get("writeErrors", [])
+        if any(e.get("code") != 11000 for e in errors):
+            raise
+        clashes = []
+        for e in errors:
+            doc = docs[e["index"]]
+            if id(doc) not in had_id:
+                doc.pop("_id", None)  # insert_many assigned one; it never got stored
+            if doc.get(key) is not None:
+                clashes.append(doc)
+        inserted = exc.details.get("nInserted", 0)
+        return inserted, _upsert(col, clashes, key)[1] if clashes else 0
+
+
+def load(kind: str, paths: List[str], batch_size: int = 5000, drop: bool = False,
+         hash_workers: Optional[int] = None, rounds: int = 12,
+         limit: Optional[int] = None) -> Dict[str, Any]:
+    """Stream `paths` into the collection for `kind`; returns counters."""
+    name, key, unique = COLLECTIONS[kind]
+    col = mongo.db[name]
+    if drop:
+        col.drop()
+    if unique and build(name):  # see app/indexes.py
+        logging.warning("No unique index on %s.%s – falling back to upserts", name, key)
+        unique = False
+
+    stats = {"read": 0, "inserted": 0, "updated": 0}
+    start = time.monotonic()
+
+    def write(docs: List[Dict[str, Any]]) -> None:
+        inserted, updated = write_batch(col, docs, key, unique)
+        stats["read"] += len(docs)
+        stats["inserted"] += inserted
+        stats["updated"] += updated
+        rate = stats["read"] / max(time.monotonic() - start, 1e-9)
+        logging.info("%s: %d read, %d inserted, %d updated (%.0f docs/s)",
+                     name, stats["read"], stats["inserted"], stats["updated"], rate)
+
+    docs = read_docs(paths)
+    if limit is not None:
+        docs = islice(docs, limit)
+    pool = None
+    if kind == "users" and hash_workers != 0:
+        pool = ProcessPoolExecutor(hash_workers or os.cpu_count())
+    try:
+        run_pipeline(
+            batched(docs, batch_size),
+            [lambda b: prepare(kind, b, pool, rounds), write],
+        )
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if kind == "news" and stats["read"]:
+            feed_cache.bump()
+    stats["seconds"] = time.monotonic() - start
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("kind", choices=sorted(COLLECTIONS))
+    parser.add_argument("paths", nargs="+", help="JSONL files (.gz ok, - for stdin)")
+    parser.add_argument("--batch", type=int, default=5000, help="docs per insert_many")
+    parser.add_argument("--drop", action="store_true", help="drop the collection first")
+    parser.add_argument("--limit", type=int, default=None, help="stop after N docs")
+    parser.add_argument("--hash-workers", type=int, default=None,
+                        help="bcrypt processes for users (default: CPU count, 0 = in-process)")
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost for users")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    from . import create_app
+
+    app = create_app(start_scheduler=False)
+    with app.app_context():
+        stats = load(args.kind, args.paths, args.batch, args.drop,
+                     args.hash_workers, args.rounds, args.limit)
+    logging.info(
+        "Loaded %d %s docs in %.1fs – %d inserted, %d updated",
+        stats["read"], args.kind, stats["seconds"], stats["inserted"], stats["updated"],
+    )
+
+
+if __name__ == "__main__":
+    main()
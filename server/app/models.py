@@ -3,7 +3,7 @@ All direct DB access lives here (pure functions, no Flask).
 Each function returns plain dicts with ObjectIds converted to str.
 """
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from bson import ObjectId
 from passlib.hash import bcrypt
@@ -36,6 +36,15 @@ def verify_password(raw: str, hashed: str) -> bool:
 
 
 # ─────────────────────────── NEWS ─────────────────────────────
+# Projections: each query fetches only the fields its caller returns.
+CARD = {                     # feed cards (GET /api/news)
+    "headline": 1, "excerpt": 1, "positivity": 1, "category": 1,
+    "source_url": 1, "orig_headline": 1, "created_date": 1, "published_at": 1,
+}
+DETAIL = {**CARD, "full_body": 1}  # article page (GET /api/news/<id>)
+EXISTENCE = {"_id": 1}             # answered from the _id index alone
+
+
 def create_news(**kwargs) -> str:
     """
     kwargs: headline, excerpt, positivity(int), category, full_body
@@ -45,40 +54,74 @@ def create_news(**kwargs) -> str:
     return str(_id)
 
 
-def list_news(
+# newest first; _id breaks ties so every article has one place in the feed
+NEWS_SORT = [("created_date", -1), ("_id", -1)]
+
+
+def news_filter(
     positivity: Optional[int] = None,
     category: Optional[str] = None,
-    limit: int = 20,
-    offset: int = 0,
-) -> List[Dict]:
+    after: Optional[Tuple[datetime, ObjectId]] = None,
+) -> Dict[str, Any]:
+    """
+    Feed query (also explained by `python -m app.indexes --check`).
+    `after` = (created_date, _id) of the last article already seen: only
+    older ones match, as a range on the feed index rather than a skip.
+    """
     query: Dict[str, Any] = {}
     if positivity is not None:
         query["positivity"] = {"$gte": positivity}
     if category:
         query["category"] = category
+    if after is not None:
+        created, oid = after
+        query["created_date"] = {"$lte": created}  # bounds the index scan
+        query["$or"] = [{"created_date": {"$lt": created}}, {"_id": {"$lt": oid}}]
+    return query
+
+
+def list_news(
+    positivity: Optional[int] = None,
+    category: Optional[str] = None,
+    limit: int = 20,
+    offset: int = 0,
+    after: Optional[Tuple[datetime, ObjectId]] = None,
+) -> List[Dict]:
+    """
+    One feed page, newest first. Pass the previous page's last
+    (created_date, _id) as `after` for constant-cost paging; `offset` is
+    kept for older clients and costs O(offset).
+    """
+    query = news_filter(positivity, category, after)
 
     cursor = (
-        mongo.db.News_reserve.find(query)
+        mongo.db.News_reserve.find(query, CARD)
         .skip(offset)
         .limit(limit)
-        .sort("created_date", -1)
+        .sort(NEWS_SORT)
     )
     res = []
     for doc in cursor:
         doc["news_id"] = str(doc.pop("_id"))
-        doc.pop("full_body", None)  # keep response light
         res.append(doc)
     return res
 
 
 def get_news(news_id: str) -> Optional[Dict]:
-    doc = mongo.db.News_reserve.find_one({"_id": ObjectId(news_id)})
+    doc = mongo.db.News_reserve.find_one({"_id": ObjectId(news_id)}, DETAIL)
     if not doc:
         return None
     doc["news_id"] = str(doc.pop("_id"))
     return doc
 
 
+def news_exists(news_id: str) -> bool:
+    """True if the article exists (a covered _id lookup; invalid ids → False)."""
+    if not ObjectId.is_valid(news_id):
+        return False
+    return mongo.db.News_reserve.find_one({"_id": ObjectId(news_id)}, EXISTENCE) is not None
+
+
 # ───────────────────────── COMMENTS ───────────────────────────
 def add_comment(user_id: str, news_id: str, content: str) -> str:
     comment = {
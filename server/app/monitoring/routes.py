@@ -0,0 +1,10 @@
+from flask import Blueprint, Response
+from ..services import metrics
+
+
+monitoring_bp = Blueprint("monitoring", __name__)
+
+
+@monitoring_bp.get("/metrics")
+def prometheus_metrics():
+    return Response(metrics.render(), content_type=metrics.CONTENT_TYPE)
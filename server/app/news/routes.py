@@ -1,6 +1,8 @@
-from flask import Blueprint, request, jsonify, abort
+from flask import Blueprint, current_app, request, jsonify, abort
 from ..models import list_news, get_news, list_comments, add_reaction, get_reaction
-from ..utils import obj_id
+from ..services.feed_cache import FEED_CACHE
+from ..utils import obj_id, encode_cursor, decode_cursor
+from bson import ObjectId
 
 
 news_bp = Blueprint("news", __name__)
@@ -15,14 +17,41 @@ def _as_int(arg, default=None):
 
 @news_bp.get("/news")
 def news_list(): # pragma: no cover
+    """
+    A feed page. A full page carries X-Next-Cursor; send it back as
+    ?cursor= for the next one (constant cost however deep, and stable
+    while new articles arrive). ?offset= still works but costs O(offset).
+    """
     qp = request.args
+    after = decode_cursor(qp["cursor"]) if qp.get("cursor") else None
+    positivity, category = _as_int(qp.get("positivity")), qp.get("category")
+    limit = max(1, min(100, _as_int(qp.get("limit"), 20)))
+    offset = 0 if after else max(0, _as_int(qp.get("offset"), 0))
+
+    cached = current_app.config["FEED_CACHE_ENABLED"]
+    if cached:
+        key = (positivity, category, limit, qp.get("cursor"), offset)
+        hit = FEED_CACHE.get(key)
+        if hit:
+            return current_app.response_class(hit[0], 200, hit[1], mimetype="application/json")
+        generation = FEED_CACHE.generation
+
     docs = list_news(
-        positivity=_as_int(qp.get("positivity")),
-        category=qp.get("category"),
-        limit=max(1, min(100, _as_int(qp.get("limit"), 20))),
-        offset=max(0, _as_int(qp.get("offset"), 0)),
+        positivity=positivity,
+        category=category,
+        limit=limit,
+        offset=offset,
+        after=after,
     )
-    return jsonify(docs), 200
+    headers = {}
+    if len(docs) == limit and docs[-1].get("created_date"):
+        last = docs[-1]
+        headers["X-Next-Cursor"] = encode_cursor(last["created_date"], ObjectId(last["news_id"]))
+    response = jsonify(docs)
+    response.headers.update(headers)
+    if cached:
+        FEED_CACHE.put(key, (response.get_data(), headers), generation)
+    return response, 200
 
 
 @news_bp.get("/news/<news_id>")
@@ -0,0 +1,226 @@
+"""
+Re-score existing News_reserve articles with the current LLM_MODEL /
+PROMPT_VERSION (e.g. after changing either).
+
+    python -m app.rescore [--batch 50] [--workers 4] [--dry-run] [--restart]
+
+Walks the collection in _id order, picking only documents not already
+stamped with the current (llm_model, prompt_version). Batches flow through
+a read → analyse → write pipeline; results go back with one unordered bulk
+update per batch, and the last _id written is saved in `Ingest_state`
+(_id "rescore") after every batch, so a crashed run resumes where it
+stopped. Articles the LLM still cannot score are left untouched.
+"""
+
+from __future__ import annotations
+import argparse, logging, os, time
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from pymongo import UpdateOne
+
+from .extensions import mongo
+from .services import analysis_cache, feed_cache, ingest
+from .services.circuit import CLOSED
+from .services.pipeline import run_pipeline
+from .services.throttle import RateLimiter
+
+CHECKPOINT_ID = "rescore"
+
+
+def _stale_filter() -> Dict[str, Any]:
+    return {
+        "$or": [
+            {"llm_model": {"$ne": ingest.LLM_MODEL}},
+            {"prompt_version": {"$ne": ingest.PROMPT_VERSION}},
+        ]
+    }
+
+
+def _load_checkpoint(restart: bool) -> Dict[str, Any]:
+    state = mongo.db.Ingest_state.find_one({"_id": CHECKPOINT_ID}) or {}
+    same_target = (
+        state.get("llm_model") == ingest.LLM_MODEL
+        and state.get("prompt_version") == ingest.PROMPT_VERSION
+    )
+    if restart or not same_target or state.get("done"):
+        state = {
+            "_id": CHECKPOINT_ID,
+            "llm_model": ingest.LLM_MODEL,
+            "prompt_version": ingest.PROMPT_VERSION,
+            "last_id": None,
+            "started_at": datetime.utcnow(),
+            "done": False,
+        }
+    return state
+
+
+def _save_checkpoint(state: Dict[str, Any]) -> None:
+    mongo.db.Ingest_state.replace_one({"_id": CHECKPOINT_ID}, state, upsert=True)
+
+
+def _batches(last_id, batch_size: int, limit: Optional[int]) -> Iterator[List[Dict[str, Any]]]:
+    """Stale docs after `last_id`, batch_size at a time (keyset on _id)."""
+    seen = 0
+    while limit is None or seen < limit:
+        query = _stale_filter()
+        if last_id is not None:
+            query["_id"] = {"$gt": last_id}
+        size = batch_size if limit is None else min(batch_size, limit - seen)
+        docs = list(
+            mongo.db.News_reserve.find(
+                query, {"source_url": 1, "orig_headline": 1, "headline": 1, "full_body": 1}
+            ).sort("_id", 1).limit(size)
+        )
+        if not docs:
+            return
+        seen += len(docs)
+        last_id = docs[-1]["_id"]
+        yield docs
+
+
+def _analyse(docs: List[Dict[str, Any]], workers: int, limiter: RateLimiter, batch_size: int):
+    items = []
+    for d in docs:
+        title = d.get("orig_headline") or d.get("headline") or ""
+        body = d.get("full_body") or ""
+        items.append({
+            "_id": d["_id"],
+            "title": title,
+            "body": body,
+            "key": analysis_cache.cache_key(ingest.LLM_MODEL, ingest.PROMPT_VERSION, title, body),
+        })
+
+    cached = analysis_cache.lookup(it["key"] for it in items)
+    todo = [it for it in items if it["key"] not in cached]
+    fresh = {}
+    for it, res in zip(todo, ingest._analyse_many(todo, workers, limiter, batch_size)):
+        if res is not None:
+            fresh[it["key"]] = res
+    analysis_cache.store(fresh, ingest.LLM_MODEL, ingest.PROMPT_VERSION)
+    for it in items:
+        it["analysis"] = cached.get(it["key"]) or fresh.get(it["key"])
+    return items
+
+
+def _write(items: List[Dict[str, Any]]) -> int:
+    ops = [
+        UpdateOne(
+            {"_id": it["_id"]},
+            {
+                "$set": {
+                    "headline":       it["analysis"][0],
+                    "excerpt":        it["analysis"][1],
+                    "positivity":     it["analysis"][2],
+                    "category":       it["analysis"][3],
+                    "content_hash":   it["key"],
+                    "llm_model":      ingest.LLM_MODEL,
+                    "prompt_version": ingest.PROMPT_VERSION,
+                },
+                "$unset": {"needs_reanalysis": ""},
+            },
+        )
+        for it in items
+        if it["analysis"]
+    ]
+    if ops:
+        mongo.db.News_reserve.bulk_write(ops, ordered=False)
+    return len(ops)
+
+
+def run(
+    batch_size: int = 50,
+    workers: int | None = None,
+    dry_run: bool = False,
+    restart: bool = False,
+    limit: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Re-score stale articles; returns the final stats."""
+    workers = workers or int(os.getenv("LLM_WORKERS", 4))
+    rps = float(os.getenv("LLM_RPS", 2))
+    llm_batch = int(os.getenv("LLM_BATCH_SIZE", 1))
+    state = _load_checkpoint(restart)
+
+    remaining_q = _stale_filter()
+    if state["last_id"] is not None:
+        remaining_q["_id"] = {"$gt": state["last_id"]}
+    total = mongo.db.News_reserve.count_documents(remaining_q)
+    if limit is not None:
+        total = min(total, limit)
+    logging.info(
+        "Re-scoring %d docs with %s / prompt v%s%s",
+        total, ingest.LLM_MODEL, ingest.PROMPT_VERSION,
+        f" (resuming after {state['last_id']})" if state["last_id"] else "",
+    )
+
+    stats = {"total": total, "processed": 0, "rescored": 0, "failed": 0}
+    if dry_run:
+        calls = -(-total // max(1, llm_batch))
+        stats["estimated_seconds"] = calls / rps if rps > 0 else None
+        logging.info(
+            "Dry run – %d docs, ~%d LLM calls, ~%s at LLM_RPS=%s",
+            total, calls,
+            f"{stats['estimated_seconds']:.0f}s" if rps > 0 else "unbounded", rps,
+        )
+        return stats
+
+    limiter = RateLimiter(rps)
+    start = time.monotonic()
+
+    def write(items) -> None:
+        done = _write(items)
+        stats["processed"] += len(items)
+        stats["rescored"] += done
+        stats["failed"] += len(items) - done
+        state["last_id"] = items[-1]["_id"]
+        _save_checkpoint(state)
+
+        rate = stats["processed"] / max(1e-9, time.monotonic() - start)
+        eta = (total - stats["processed"]) / rate if rate else float("inf")
+        logging.info(
+            "Re-score %d/%d – %.1f docs/s, ETA %.0fs (%d failed)",
+            stats["processed"], total, rate, eta, stats["failed"],
+        )
+        if ingest.LLM_BREAKER.state != CLOSED:
+            raise RuntimeError("LLM circuit open – stopping; re-run to resume")
+
+    _save_checkpoint(state)
+    try:
+        run_pipeline(
+            _batches(state["last_id"], batch_size, limit),
+            [lambda docs: _analyse(docs, workers, limiter, llm_batch), write],
+        )
+    finally:
+        if stats["rescored"]:
+            feed_cache.bump()
+
+    if limit is None:
+        state["done"] = True
+        _save_checkpoint(state)
+    stats["seconds"] = time.monotonic() - start
+    logging.info(
+        "Re-score finished – %d re-scored, %d failed in %.0fs",
+        stats["rescored"], stats["failed"], stats["seconds"],
+    )
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--batch", type=int, default=50, help="docs per batch")
+    parser.add_argument("--workers", type=int, default=None, help="concurrent LLM calls")
+    parser.add_argument("--limit", type=int, default=None, help="stop after N docs")
+    parser.add_argument("--dry-run", action="store_true", help="count & estimate only")
+    parser.add_argument("--restart", action="store_true", help="ignore the saved checkpoint")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    from . import create_app
+
+    app = create_app(start_scheduler=False)
+    with app.app_context():
+        run(args.batch, args.workers, args.dry_run, args.restart, args.limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,40 @@
-import logging
-from .services.ingest import ingest_once
+import logging, os
+from .services import jobs
+from .services.lease import LeaseLost
+from .services.reanalysis import drain
 
 def fetch_news():
     try:
-        n = ingest_once()
-        logging.info("⏰ ingest_once() OK – %d new docs", n)
+        n = jobs.run_ingest()
+        if n is not None:
+            logging.info("⏰ ingest_once() OK – %d new docs", n)
+    except LeaseLost:
+        logging.warning("⏰ ingest_once() stopped – lease lost to another process")
     except Exception:                    # catch-all so the job never dies
         logging.exception("⏰ ingest_once() crashed")
 
-def register_jobs(sched):
+def reanalyse_news():
+    try:
+        n = drain()
+        if n:
+            logging.info("⏰ reanalysis drain OK – %d docs re-scored", n)
+    except Exception:                    # catch-all so the job never dies
+        logging.exception("⏰ reanalysis drain crashed")
+
+def _enqueuer(task):
+    """Queue mode: the web process only hands the task to app.worker."""
+    def enqueue():
+        try:
+            jobs.enqueue(task)
+        except Exception:                # catch-all so the job never dies
+            logging.exception("⏰ enqueue %s failed", task)
+    return enqueue
+
+def register_jobs(sched, mode="inline"):
+    queued = mode == "queue"
     sched.add_job(
         id="news_ingest_job",
-        func=fetch_news,
+        func=_enqueuer("ingest") if queued else fetch_news,
         trigger="interval",
         hours=2,
         replace_existing=True,
@@ -19,3 +42,12 @@ def register_jobs(sched):
         coalesce=True,
         misfire_grace_time=600,
     )
+    sched.add_job(
+        id="news_reanalysis_job",
+        func=_enqueuer("reanalyse") if queued else reanalyse_news,
+        trigger="interval",
+        minutes=int(os.getenv("REANALYSIS_INTERVAL_MIN", 10)),
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
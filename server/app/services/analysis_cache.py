@@ -0,0 +1,78 @@
+"""
+Persistent cache of LLM analyses (Mongo collection `Analysis_cache`).
+
+Key = sha256(model | prompt version | title | cleaned body), so an article
+whose text has not changed is never sent to the LLM twice, while a new
+model or prompt version naturally misses. Entries expire through a TTL
+index on `last_used`, which every hit refreshes (LRU-style eviction).
+"""
+
+from __future__ import annotations
+import os, hashlib
+from datetime import datetime
+from typing import Dict, Iterable, Tuple
+
+from pymongo import UpdateOne
+
+from ..extensions import mongo
+
+CACHE_TTL = int(os.getenv("ANALYSIS_CACHE_TTL_DAYS", 30)) * 24 * 3600  # s
+
+Analysis = Tuple[str, str, int, str]
+
+
+def cache_key(model: str, prompt_version: str, title: str, body: str) -> str:
+    h = hashlib.sha256()
+    for part in (model, prompt_version, title, body):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x1f")
+    return h.hexdigest()
+
+
+def ensure_index() -> None:
+    """TTL index (idempotent)."""
+    mongo.db.Analysis_cache.create_index("last_used", expireAfterSeconds=CACHE_TTL)
+
+
+def lookup(keys: Iterable[str]) -> Dict[str, Analysis]:
+    """Return {key: (headline, summary, positivity, category)} for cached keys."""
+    keys = list(set(keys))
+    if not keys:
+        return {}
+    hits = {
+        doc["_id"]: (doc["headline"], doc["excerpt"], doc["positivity"], doc["category"])
+        for doc in mongo.db.Analysis_cache.find({"_id": {"$in": keys}})
+    }
+    if hits:
+        mongo.db.Analysis_cache.update_many(
+            {"_id": {"$in": list(hits)}}, {"$set": {"last_used": datetime.utcnow()}}
+        )
+    return hits
+
+
+def store(entries: Dict[str, Analysis], model: str, prompt_version: str) -> None:
+    """Upsert fresh LLM results (never store fallbacks here)."""
+    if not entries:
+        return
+    now = datetime.utcnow()
+    mongo.db.Analysis_cache.bulk_write(
+        [
+            UpdateOne(
+                {"_id": key},
+                {
+                    "$set": {
+                        "headline":       head,
+                        "excerpt":        summ,
+                        "positivity":     pos,
+                        "category":       cat,
+                        "model":          model,
+                        "prompt_version": prompt_version,
+                        "last_used":      now,
+                    }
+                },
+                upsert=True,
+            )
+            for key, (head, summ, pos, cat) in entries.items()
+        ],
+        ordered=False,
+    )
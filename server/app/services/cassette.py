@@ -0,0 +1,61 @@
+"""
+Record real provider responses to a JSONL "cassette" for offline replay.
+
+With PROVIDER_RECORD=<file.jsonl> set, every successful NewsAPI page and LLM
+completion is appended as one line:
+
+{ "provider": "newsapi" | "together", "key": str,
+  "request": {...}, "response": {...}, "recorded_at": iso8601 }
+
+API tokens are never written. Replay by serving the file from the local
+stand-ins (python -m app.stubs --cassette <file>), which answer recorded
+requests by key and synthesise anything the cassette lacks.
+
+Keys ignore what changes from run to run: NewsAPI pages are keyed by their
+query minus the token and the published_after/before window (the window
+moves with the checkpoint, the page number does not), completions by a hash
+of model + prompt.
+"""
+
+from __future__ import annotations
+import hashlib, json, os, threading
+from datetime import datetime
+from typing import Any, Dict, Tuple
+
+_LOCK = threading.Lock()
+_VOLATILE = {"api_token", "published_after", "published_before"}
+
+
+def newsapi_key(params: Dict[str, Any]) -> str:
+    return "&".join(f"{k}={params[k]}" for k in sorted(params) if k not in _VOLATILE)
+
+
+def together_key(model: str, prompt: str) -> str:
+    return hashlib.sha256(f"{model}\x1f{prompt}".encode()).hexdigest()
+
+
+def record(provider: str, key: str, request: Dict[str, Any], response: Dict[str, Any]) -> None:
+    """Append one exchange to $PROVIDER_RECORD (no-op when unset)."""
+    path = os.getenv("PROVIDER_RECORD")
+    if not path:
+        return
+    line = json.dumps({
+        "provider": provider,
+        "key": key,
+        "request": {k: v for k, v in request.items() if k != "api_token"},
+        "response": response,
+        "recorded_at": datetime.utcnow().isoformat(),
+    }, default=str)
+    with _LOCK, open(path, "a", encoding="utf-8") as fh:
+        fh.write(line + "\n")
+
+
+def load(path: str) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """{(provider, key): response}; later recordings of a key win."""
+    out: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                row = json.loads(line)
+                out[(row["provider"], row["key"])] = row["response"]
+    return out
@@ -0,0 +1,118 @@
+"""
+Ingest high-watermark checkpoint (one document in `Ingest_state`).
+
+{
+  "_id": "newsapi",
+  "last_published_at": datetime,     # newest article written so far
+  "last_url": str,                   # …and its URL (tie-break)
+  "backfill": {                      # present only while a backfill runs
+      "before": datetime,            # fixed anchor → stable page numbers
+      "next_page": int,
+      "max_published_at": datetime,
+      "max_url": str,
+  },
+  "fence": int,                      # highest lease token that wrote here
+}
+
+Writers holding the ingest lease pass its token as `fence`; a write from a
+token lower than the stored one (a holder that has been superseded) is
+refused with LeaseLost instead of clobbering the newer holder's progress.
+"""
+
+from __future__ import annotations
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from pymongo.errors import DuplicateKeyError
+
+from ..extensions import mongo
+from .lease import LeaseLost
+
+CHECKPOINT_ID = "newsapi"
+
+
+def _col():
+    return mongo.db.Ingest_state
+
+
+def load() -> Dict[str, Any]:
+    return _col().find_one({"_id": CHECKPOINT_ID}) or {}
+
+
+def _fenced(query: Dict[str, Any], update: Dict[str, Any], fence: Optional[int]):
+    """Add the fencing condition / stamp to a checkpoint write."""
+    if fence is None:
+        return query, update
+    cond = [{"fence": {"$exists": False}}, {"fence": {"$lte": fence}}]
+    query = dict(query)
+    if "$or" in query:
+        query["$and"] = [{"$or": query.pop("$or")}, {"$or": cond}]
+    else:
+        query["$or"] = cond
+    update.setdefault("$set", {})["fence"] = fence
+    return query, update
+
+
+def _stale(fence: Optional[int]) -> bool:
+    return fence is not None and load().get("fence", fence) > fence
+
+
+def save_watermark(published_at: datetime, url: str, fence: Optional[int] = None) -> None:
+    """Advance (never rewind) the incremental high-watermark."""
+    query, update = _fenced(
+        {
+            "_id": CHECKPOINT_ID,
+            "$or": [
+                {"last_published_at": {"$exists": False}},
+                {"last_published_at": {"$lt": published_at}},
+            ],
+        },
+        {"$set": {"last_published_at": published_at, "last_url": url}},
+        fence,
+    )
+    try:
+        _col().update_one(query, update, upsert=True)
+    except DuplicateKeyError:
+        # checkpoint already holds a newer watermark – or a newer lease holder
+        if _stale(fence):
+            raise LeaseLost(f"checkpoint fenced by a newer lease (ours: {fence})")
+
+
+def start_backfill(before: datetime, fence: Optional[int] = None) -> Dict[str, Any]:
+    state = {"before": before, "next_page": 1}
+    query, update = _fenced({"_id": CHECKPOINT_ID}, {"$set": {"backfill": state}}, fence)
+    try:
+        _col().update_one(query, update, upsert=True)
+    except DuplicateKeyError:
+        raise LeaseLost(f"checkpoint fenced by a newer lease (ours: {fence})")
+    return state
+
+
+def save_backfill_page(
+    page: int,
+    max_published_at: Optional[datetime],
+    max_url: Optional[str],
+    fence: Optional[int] = None,
+) -> None:
+    """Record that `page` is fully written, so a restart resumes after it."""
+    update: Dict[str, Any] = {"backfill.next_page": page + 1}
+    if max_published_at is not None:
+        update["backfill.max_published_at"] = max_published_at
+        update["backfill.max_url"] = max_url
+    query, update = _fenced({"_id": CHECKPOINT_ID}, {"$set": update}, fence)
+    if not _col().update_one(query, update).matched_count and fence is not None:
+        raise LeaseLost(f"checkpoint fenced by a newer lease (ours: {fence})")
+
+
+def finish_backfill(fence: Optional[int] = None) -> None:
+    """
+    Turn the backfill's newest article (or its anchor, if it found nothing)
+    into the incremental watermark.
+    """
+    state = load().get("backfill") or {}
+    query, update = _fenced({"_id": CHECKPOINT_ID}, {"$unset": {"backfill": ""}}, fence)
+    if not _col().update_one(query, update).matched_count and fence is not None:
+        raise LeaseLost(f"checkpoint fenced by a newer lease (ours: {fence})")
+    newest = state.get("max_published_at") or state.get("before")
+    if newest:
+        save_watermark(newest, state.get("max_url") or "", fence)
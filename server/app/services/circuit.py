@@ -0,0 +1,63 @@
+"""
+Thread-safe circuit breaker.
+
+closed     → calls pass; `failure_threshold` consecutive failures open it.
+open       → calls are refused until `reset_timeout` seconds have passed.
+half_open  → one probe call is let through; success closes the circuit,
+             failure re-opens it for another `reset_timeout`.
+"""
+
+from __future__ import annotations
+import logging, threading, time
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 60):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """May a call go through now? (In half-open, only one probe at a time.)"""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = HALF_OPEN
+                self._probing = False
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != CLOSED:
+                logging.info("Circuit %s closed", self.name)
+            self._state, self._failures, self._probing = CLOSED, 0, False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    logging.warning(
+                        "Circuit %s open after %d failures", self.name, self._failures
+                    )
+                self._state, self._opened_at, self._probing = OPEN, time.monotonic(), False
@@ -0,0 +1,148 @@
+"""
+In-process LRU/TTL cache of serialised GET /api/news pages.
+
+News_reserve only changes when ingest (or re-analysis / re-scoring / a bulk
+load) writes, so feed pages are cached per (positivity, category, limit,
+cursor, offset) until the feed *generation* moves. Writers call bump(),
+which $incs one counter document in `Ingest_state`:
+
+{ "_id": "feed", "generation": int }
+
+Every process re-reads that counter at most every FEED_GENERATION_POLL
+seconds and drops its whole cache when it changed, so another worker's
+ingest makes pages stale for at most one poll interval; bump() clears the
+local cache at once. Between polls, a cached page costs no Mongo round
+trip at all.
+
+Entries are bounded both by count (FEED_CACHE_MAX_ENTRIES) and by the size
+of their serialised body (FEED_CACHE_MAX_BYTES), evicting least recently
+used first, and expire after FEED_CACHE_TTL seconds regardless.
+"""
+
+from __future__ import annotations
+import os, threading, time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from ..extensions import mongo
+from . import metrics
+
+GENERATION_ID = "feed"
+
+REQUESTS = metrics.counter(
+    "zenframe_feed_cache_requests_total", "GET /api/news cache lookups", ["result"]
+)
+CACHED_BYTES = metrics.gauge("zenframe_feed_cache_bytes", "Serialised feed pages held in memory")
+
+Page = Tuple[bytes, Dict[str, str]]  # (JSON body, response headers)
+
+
+class FeedCache:
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 32 << 20,
+        ttl: float = 300,
+        poll: float = 5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries, self.max_bytes = max_entries, max_bytes
+        self.ttl, self.poll = ttl, poll
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, int, Page]]" = OrderedDict()
+        self._bytes = 0
+        self._generation: Optional[int] = None
+        self._checked = float("-inf")
+
+    # ── generation ───────────────────────────────────────────
+    def _sync(self) -> None:
+        """Drop everything if the shared generation moved (polled, not per request)."""
+        now = self._clock()
+        if now - self._checked < self.poll:
+            return
+        doc = mongo.db.Ingest_state.find_one({"_id": GENERATION_ID}, {"generation": 1}) or {}
+        with self._lock:
+            self._checked = now
+            generation = doc.get("generation", 0)
+            if generation != self._generation:
+                self._clear()
+                self._generation = generation
+
+    def bump(self) -> None:
+        """Mark every cached page, in every process, stale."""
+        mongo.db.Ingest_state.update_one(
+            {"_id": GENERATION_ID}, {"$inc": {"generation": 1}}, upsert=True
+        )
+        with self._lock:
+            self._clear()
+            self._generation = None  # refuse puts of pages read before the bump
+            self._checked = float("-inf")  # pick the new generation up on the next read
+
+    @property
+    def generation(self) -> Optional[int]:
+        """Pass the value seen before reading Mongo to put()."""
+        return self._generation
+
+    # ── entries ─────────────────────────────────────────────
+    def get(self, key: Hashable) -> Optional[Page]:
+        self._sync()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    self._drop(key)
+                REQUESTS.inc(result="miss")
+                return None
+            self._entries.move_to_end(key)
+        REQUESTS.inc(result="hit")
+        return entry[2]
+
+    def put(self, key: Hashable, page: Page, generation: Optional[int]) -> None:
+        """Store `page` unless the generation moved since it was read."""
+        size = len(page[0]) + sum(len(k) + len(v) for k, v in page[1].items())
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if generation is None or generation != self._generation:
+                return
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (self._clock() + self.ttl, size, page)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+            CACHED_BYTES.set(self._bytes)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def _drop(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+        CACHED_BYTES.set(0)
+
+
+FEED_CACHE = FeedCache(
+    max_entries=int(os.getenv("FEED_CACHE_MAX_ENTRIES", 1024)),
+    max_bytes=int(os.getenv("FEED_CACHE_MAX_BYTES", 32 << 20)),
+    ttl=float(os.getenv("FEED_CACHE_TTL", 300)),
+    poll=float(os.getenv("FEED_GENERATION_POLL", 5)),
+)
+
+
+def bump() -> None:
+    """Called by every News_reserve writer once its writes are done."""
+    FEED_CACHE.bump()
@@ -0,0 +1,145 @@
+"""
+Near-duplicate detection for syndicated stories (SimHash + LSH banding).
+
+Each cleaned body gets a 64-bit SimHash over word 3-shingles. Two bodies
+are near-duplicates when their hashes differ in ≤ NEAR_DUP_DISTANCE bits.
+The hash is split into 4 bands of 16 bits; by pigeonhole, hashes within
+3 bits of each other share at least one band exactly, so a lookup is a
+single multikey-index query on `bands` followed by a Hamming check on the
+few candidates, which stays fast at millions of articles.
+
+Collection `News_fingerprints`:
+{ "_id": source_url, "simhash": int64, "bands": [int ×4], "canonical_url": str }
+canonical_url == _id for an original, else the article it duplicates.
+"""
+
+from __future__ import annotations
+import os, re, hashlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pymongo import UpdateOne
+
+from ..extensions import mongo
+
+BANDS, BAND_BITS = 4, 16
+MAX_DISTANCE = int(os.getenv("NEAR_DUP_DISTANCE", 3))
+SHINGLE = 3
+_WORD = re.compile(r"\w+")
+_MASK64 = (1 << 64) - 1
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash of `text` (0 for text too short to shingle)."""
+    words = _WORD.findall(text.lower())
+    if len(words) < SHINGLE:
+        shingles = [" ".join(words)] if words else []
+    else:
+        shingles = [" ".join(words[i:i + SHINGLE]) for i in range(len(words) - SHINGLE + 1)]
+    if not shingles:
+        return 0
+
+    # Column-wise majority vote over the shingle hashes' bit strings
+    # (zip(*…) transposes in C, ~3× faster than a per-bit Python loop).
+    rows = [
+        format(int.from_bytes(hashlib.blake2b(sh.encode(), digest_size=8).digest(), "big"), "064b")
+        for sh in set(shingles)
+    ]
+    half = len(rows) / 2
+    return int("".join("1" if col.count("1") > half else "0" for col in zip(*rows)), 2)
+
+
+def bands(h: int) -> List[int]:
+    """Band keys (band index in the high bits so bands never collide)."""
+    mask = (1 << BAND_BITS) - 1
+    return [(i << BAND_BITS) | ((h >> (i * BAND_BITS)) & mask) for i in range(BANDS)]
+
+
+def distance(a: int, b: int) -> int:
+    return ((a ^ b) & _MASK64).bit_count()
+
+
+def _to_int64(h: int) -> int:
+    return h - (1 << 64) if h >= 1 << 63 else h
+
+
+def _from_int64(v: int) -> int:
+    return v & _MASK64
+
+
+class NearDupIndex:
+    """
+    In-memory band index for one ingest cycle, backed by `News_fingerprints`
+    for everything seen in earlier cycles.
+    """
+
+    def __init__(self, max_distance: int = MAX_DISTANCE):
+        self.max_distance = max_distance
+        self._local: Dict[int, List[Tuple[int, str]]] = {}
+
+    def add(self, h: int, url: str) -> None:
+        for b in bands(h):
+            self._local.setdefault(b, []).append((h, url))
+
+    def match_many(self, entries: Iterable[Tuple[str, int]]) -> Dict[str, str]:
+        """
+        {url: canonical_url} for every (url, simhash) that near-duplicates a
+        *different* known article. One Mongo query for the whole batch.
+        """
+        entries = [(u, h) for u, h in entries if h]
+        if not entries or self.max_distance < 0:
+            return {}
+        all_bands = {b for _, h in entries for b in bands(h)}
+        stored: Dict[int, List[Tuple[int, str, str]]] = {}
+        known: Dict[str, str] = {}
+        for doc in mongo.db.News_fingerprints.find(
+            {"$or": [{"bands": {"$in": list(all_bands)}}, {"_id": {"$in": [u for u, _ in entries]}}]},
+            {"simhash": 1, "bands": 1, "canonical_url": 1},
+        ):
+            known[doc["_id"]] = doc["canonical_url"]
+            for b in doc["bands"]:
+                stored.setdefault(b, []).append(
+                    (_from_int64(doc["simhash"]), doc["_id"], doc["canonical_url"])
+                )
+
+        out: Dict[str, str] = {}
+        for url, h in entries:
+            if url in known:  # URL seen before: keep whatever it was
+                if known[url] != url:
+                    out[url] = known[url]
+                continue
+            best: Optional[Tuple[int, str]] = None
+            for b in bands(h):
+                for other, other_url, canon in stored.get(b, []):
+                    if other_url != url:
+                        d = distance(h, other)
+                        if d <= self.max_distance and (best is None or d < best[0]):
+                            best = (d, canon)
+                for other, other_url in self._local.get(b, []):
+                    if other_url != url:
+                        d = distance(h, other)
+                        if d <= self.max_distance and (best is None or d < best[0]):
+                            best = (d, other_url)
+            if best:
+                out[url] = best[1]
+            else:
+                self.add(h, url)  # later articles in this cycle can match it
+        return out
+
+
+def store(entries: Iterable[Tuple[str, int, str]]) -> None:
+    """Persist (url, simhash, canonical_url) fingerprints."""
+    ops = [
+        UpdateOne(
+            {"_id": url},
+            {"$set": {"simhash": _to_int64(h), "bands": bands(h), "canonical_url": canon}},
+            upsert=True,
+        )
+        for url, h, canon in entries
+        if h
+    ]
+    if ops:
+        mongo.db.News_fingerprints.bulk_write(ops, ordered=False)
+
+
+def ensure_index() -> None:
+    mongo.db.News_fingerprints.create_index("bands")
@@ -6,25 +6,70 @@ Ingest news → send ONE prompt to Llama‑3 → get:
 • category (one of 10 canonical labels)
 Then upsert into Mongo.
 
+LLM calls for a page are fanned out to a bounded thread pool and throttled
+to LLM_RPS requests/second; results come back in article order. With
+LLM_BATCH_SIZE > 1 several articles share one prompt, and any article the
+batched reply misses is re-done with a single-article call. Articles whose
+(model, prompt version, title, body) hash is in the analysis cache skip the
+LLM entirely, and re-ingesting a known URL keeps its original created_date.
+Writes are collected per page (or every INGEST_WRITE_BATCH articles) and
+flushed as one unordered bulk upsert.
+
+The cycle runs as a pipeline (fetch → clean → analyse → write) over bounded
+queues, so page N+1 downloads while page N is analysed and page N‑1 is
+written; NewsAPI pages are paced by NEWS_API_RPS instead of a fixed sleep.
+
+Fetching is incremental: a checkpoint in `Ingest_state` holds the newest
+published_at/url written, drives `published_after`, and paging stops as soon
+as already-seen articles come back. A cold start (or ingest_once(backfill=
+True)) walks NEWS_BACKFILL_PAGES pages back from a fixed anchor, saving the
+page reached after every write so a crash resumes where it stopped.
+
+Articles that end up with the fallback score are flagged
+`needs_reanalysis` and put on REANALYSIS_QUEUE instead of being retried
+inline; see services/reanalysis.py. Before any of that, a SimHash
+fingerprint (services/fingerprint.py) catches syndicated near-duplicates
+under new URLs: they are linked to the canonical article instead of being
+analysed and shown again. Bodies are normalised in one pass by
+services/normalise.py and can be capped at INGEST_BODY_MAX_CHARS.
+
+Scheduled cycles run only while holding the "news_ingest" lease
+(services/lease.py, services/jobs.py), so one process ingests even with
+many web or worker processes.
+
+If a local scorer has been trained (python -m app.train_scorer), fallback
+scores come from it rather than a flat 50/"other", and with
+LOCAL_SCORER_SHORTCUT > 0 articles it labels at least that confidently
+skip the LLM altogether (stamped llm_model "local:<trained_at>").
+
 Retries, JSON‑parsing guard, and duplicate‑key handling included.
 """
 
 from __future__ import annotations
-import os, logging, time, html, re, json
-from datetime import datetime
-from typing import Tuple, Dict, Any
+import os, logging, time, json, threading
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, Dict, Any, List, Callable, Optional
 
-import requests
 from together import Together
-from pymongo.errors import DuplicateKeyError
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 from bson import ObjectId
 
 from ..extensions import mongo
+from . import analysis_cache, cassette, checkpoint, feed_cache, fingerprint, metrics, scorer
+from .newsapi import DEFAULT_URL, NewsAPIClient
+from .normalise import normalise
+from .circuit import CLOSED, CircuitBreaker
+from .lease import Lease
+from .pipeline import run_pipeline
+from .throttle import RateLimiter
+from .workqueue import MongoQueue
 
 # -----------------------------------------------------------------------------
-NEWS_API   = "https://api.thenewsapi.com/v1/news/all"
-TOGETHER   = Together(api_key=os.getenv("TOGETHER_API_KEY"))
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", 30))  # s per completion call
 LLM_MODEL  = os.getenv("TOGETHER_MODEL", "meta-llama/Llama-3-8b-chat-hf")
+PROMPT_VERSION = "1"  # bump whenever the prompt / parsing changes
 REQUEST_TIMEOUT = 12  # s
 
 ALLOWED_CATEGORIES = [
@@ -32,18 +77,120 @@ ALLOWED_CATEGORIES = [
     "health", "sports", "entertainment", "travel", "lifestyle"
 ]
 
-# unique index (idempotent)
-# mongo.db.News_reserve.create_index("source_url", unique=True, sparse=True)
+# Shared by every ingest thread/cycle in this process: after
+# LLM_BREAKER_THRESHOLD consecutive provider failures, articles skip the LLM
+# for LLM_BREAKER_RESET seconds, then a single probe tests for recovery.
+LLM_BREAKER = CircuitBreaker(
+    "together",
+    failure_threshold=int(os.getenv("LLM_BREAKER_THRESHOLD", 5)),
+    reset_timeout=float(os.getenv("LLM_BREAKER_RESET", 60)),
+)
 
-# -----------------------------------------------------------------------------
-def _clean(text: str | None) -> str:
-    """Strip HTML & collapse whitespace."""
-    if not text:
-        return ""
-    text = re.sub(r"<[^>]+>", "", html.unescape(text))
-    return re.sub(r"\s+", " ", text).strip()
+# Fallback-scored articles wait here for services/reanalysis.py to re-score them.
+REANALYSIS_QUEUE = MongoQueue(
+    "Reanalysis_queue", max_attempts=int(os.getenv("REANALYSIS_MAX_ATTEMPTS", 5))
+)
+# Set while a cycle runs in this process, so background re-analysis backs off.
+INGEST_ACTIVE = threading.Event()
+
+# ── Metrics (GET /metrics) ────────────────────────────────────
+STAGE_SECONDS = metrics.histogram(
+    "zenframe_ingest_stage_seconds", "Time spent per page in each ingest stage", ["stage"]
+)
+NEWSAPI_SECONDS = metrics.histogram(
+    "zenframe_newsapi_request_seconds", "NewsAPI page requests, retries included", ["status"]
+)
+LLM_SECONDS = metrics.histogram(
+    "zenframe_llm_call_seconds", "Together completion calls", ["kind", "outcome"]
+)
+LLM_RETRIES = metrics.counter("zenframe_llm_retries_total", "Single-article LLM retries")
+LLM_TOKENS = metrics.counter("zenframe_llm_tokens_total", "Tokens billed by Together", ["type"])
+ARTICLES = metrics.counter(
+    "zenframe_ingest_articles_total",
+    "Ingested articles by how they were scored (llm, cache, local, fallback, duplicate)",
+    ["source"],
+)
+WRITE_SECONDS = metrics.histogram("zenframe_mongo_write_seconds", "News_reserve bulk writes")
+CYCLE_SECONDS = metrics.histogram(
+    "zenframe_ingest_cycle_seconds", "Whole ingest cycles", ["mode"]
+)
+NEW_DOCS = metrics.counter("zenframe_ingest_new_docs_total", "Articles inserted by ingest")
+LAST_CYCLE = metrics.gauge(
+    "zenframe_ingest_last_success_timestamp_seconds", "Unix time the last cycle finished"
+)
+
+# The unique source_url index the upserts rely on is declared in app/indexes.py.
 
 # -----------------------------------------------------------------------------
+class BadLLMReply(ValueError):
+    """The provider answered, but not with usable JSON (not an outage)."""
+
+
+_JSON_FIELDS = (
+    '  "rewritten_headline": "<headline ≤ 15 words, no quotes>",\n'
+    '  "summary": "<2 sentences, positive tone>",\n'
+    '  "positivity": <integer 1‑100, 100 happiest>,\n'
+    f'  "category": "<one of {ALLOWED_CATEGORIES}>"\n'
+)
+
+
+def _parse_analysis(data: Dict[str, Any]) -> Tuple[str, str, int, str]:
+    """Validate one decoded JSON object → (headline, summary, positivity, category)."""
+    head   = str(data["rewritten_headline"]).strip()
+    summ   = str(data["summary"]).strip()
+    pos    = int(data["positivity"])
+    cat    = str(data["category"]).lower()
+    if cat not in ALLOWED_CATEGORIES:
+        cat = "other"
+    pos = max(1, min(100, pos))
+    return head, summ, pos, cat
+
+
+_CLIENT_LOCK = threading.Lock()
+_TOGETHER: Together | None = None
+
+
+def _together() -> Together:
+    """
+    Process-wide Together client, built on first use so importing this module
+    needs no key. TOGETHER_BASE_URL (read by the SDK) can point it at a stub.
+    """
+    global _TOGETHER
+    with _CLIENT_LOCK:
+        if _TOGETHER is None:
+            # SDK retries off: _analyse_with_retry and the breaker own that.
+            _TOGETHER = Together(
+                api_key=os.getenv("TOGETHER_API_KEY"), timeout=LLM_TIMEOUT, max_retries=0
+            )
+        return _TOGETHER
+
+
+def _complete(prompt: str, kind: str = "single") -> str:
+    start, outcome = time.perf_counter(), "error"
+    try:
+        resp = _together().chat.completions.create(
+            model=LLM_MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.6,
+        )
+        outcome = "ok"
+    finally:
+        LLM_SECONDS.observe(time.perf_counter() - start, kind=kind, outcome=outcome)
+    usage = getattr(resp, "usage", None)
+    tokens = {
+        "prompt_tokens": getattr(usage, "prompt_tokens", 0) or 0,
+        "completion_tokens": getattr(usage, "completion_tokens", 0) or 0,
+    }
+    LLM_TOKENS.inc(tokens["prompt_tokens"], type="prompt")
+    LLM_TOKENS.inc(tokens["completion_tokens"], type="completion")
+    content = resp.choices[0].message.content.strip()
+    cassette.record(
+        "together", cassette.together_key(LLM_MODEL, prompt),
+        {"model": LLM_MODEL, "prompt": prompt}, {"content": content, "usage": tokens},
+    )
+    return content
+
+
 def _llm_analyse(title: str, body: str) -> Tuple[str, str, int, str]:
     """
     Returns (rewritten_headline, summary, positivity, category).
@@ -54,34 +201,62 @@ def _llm_analyse(title: str, body: str) -> Tuple[str, str, int, str]:
         "Given an original headline & article text, produce JSON **exactly** in "
         "this format (no markdown, no commentary):\n\n"
         "{\n"
-        '  "rewritten_headline": "<headline ≤ 15 words, no quotes>",\n'
-        '  "summary": "<2 sentences, positive tone>",\n'
-        '  "positivity": <integer 1‑100, 100 happiest>,\n'
-        f'  "category": "<one of {ALLOWED_CATEGORIES}>"\n'
+        f"{_JSON_FIELDS}"
         "}\n\n"
         f"Original headline: {title}\n"
         f"Article text: {body[:1500]}\n"
     )
+    raw = _complete(prompt)
+
+    try:
+        return _parse_analysis(json.loads(raw))
+    except Exception as exc:
+        raise BadLLMReply(f"Bad LLM JSON: {exc} | Raw: {raw[:120]}")
+
 
-    resp = TOGETHER.chat.completions.create(
-        model=LLM_MODEL,
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.6,
+def _llm_analyse_batch(
+    items: List[Dict[str, Any]]
+) -> List[Tuple[str, str, int, str] | None]:
+    """
+    Analyse several articles with ONE completion.
+    Returns one entry per item (same order); None where the model's answer
+    for that article is missing or malformed. Raises if the call itself fails
+    or the reply is not a JSON array.
+    """
+    articles = "".join(
+        f"[{i}] Original headline: {it['title']}\n"
+        f"[{i}] Article text: {it['body'][:1500]}\n\n"
+        for i, it in enumerate(items)
+    )
+    prompt = (
+        "You are a news rewriter and sentiment analyser. "
+        f"Below are {len(items)} articles, each tagged with an index [i]. "
+        "Produce a JSON array **exactly** in this format, one object per "
+        "article (no markdown, no commentary):\n\n"
+        "[\n{\n"
+        '  "index": <article index>,\n'
+        f"{_JSON_FIELDS}"
+        "},\n...\n]\n\n"
+        f"{articles}"
     )
-    raw = resp.choices[0].message.content.strip()
+    raw = _complete(prompt, "batch")
 
     try:
-        data: Dict[str, Any] = json.loads(raw)
-        head   = str(data["rewritten_headline"]).strip()
-        summ   = str(data["summary"]).strip()
-        pos    = int(data["positivity"])
-        cat    = str(data["category"]).lower()
-        if cat not in ALLOWED_CATEGORIES:
-            cat = "other"
-        pos = max(1, min(100, pos))
-        return head, summ, pos, cat
+        rows = json.loads(raw)
+        if not isinstance(rows, list):
+            raise TypeError("expected a JSON array")
     except Exception as exc:
-        raise ValueError(f"Bad LLM JSON: {exc} | Raw: {raw[:120]}")
+        raise BadLLMReply(f"Bad LLM JSON: {exc} | Raw: {raw[:120]}")
+
+    results: List[Tuple[str, str, int, str] | None] = [None] * len(items)
+    for row in rows:
+        try:
+            idx = int(row["index"])
+            if 0 <= idx < len(items) and results[idx] is None:
+                results[idx] = _parse_analysis(row)
+        except Exception as exc:
+            logging.warning("Bad LLM batch entry: %s", exc)
+    return results
 
 # -----------------------------------------------------------------------------
 def _fallback(title: str, body: str) -> Tuple[str, str, int, str]:
@@ -89,74 +264,430 @@ def _fallback(title: str, body: str) -> Tuple[str, str, int, str]:
     summary = body[:160] + "…" if len(body) > 160 else body
     return title, summary, 50, "other"
 
+
+_SCORER_LOCK = threading.Lock()
+_SCORER: Dict[str, Optional[scorer.LocalScorer]] = {}
+
+
+def _local_scorer() -> Optional[scorer.LocalScorer]:
+    """The trained local scorer (loaded once per process), or None."""
+    with _SCORER_LOCK:
+        if "model" not in _SCORER:
+            _SCORER["model"] = scorer.LocalScorer.load()
+            if _SCORER["model"]:
+                logging.info("Local scorer loaded (%s)", _SCORER["model"].tag)
+        return _SCORER["model"]
+
+
+def _fallback_many(items: List[Dict[str, Any]]) -> List[Tuple[str, str, int, str]]:
+    """Fallback for items the LLM could not score, using the local scorer if any."""
+    base = [_fallback(it["title"], it["body"]) for it in items]
+    model = _local_scorer()
+    if model is None or not items:
+        return base
+    pos, cats, _ = model.predict([scorer.text_of(it["title"], it["body"]) for it in items])
+    return [(head, summ, int(p), c) for (head, summ, _, _), p, c in zip(base, pos, cats)]
+
+# -----------------------------------------------------------------------------
+def _call_llm(fn, *args):
+    """Run one LLM call through the circuit breaker."""
+    try:
+        res = fn(*args)
+    except BadLLMReply:
+        LLM_BREAKER.record_success()  # provider is up, the answer was junk
+        raise
+    except Exception:
+        LLM_BREAKER.record_failure()
+        raise
+    LLM_BREAKER.record_success()
+    return res
+
+
+def _analyse_with_retry(
+    title: str, body: str, limiter: RateLimiter
+) -> Tuple[str, str, int, str] | None:
+    """
+    LLM step with 2 retries; None if every attempt failed or the circuit
+    is open (no waiting on a provider that is known to be down).
+    """
+    for attempt in range(3):
+        if not LLM_BREAKER.allow():
+            return None
+        if attempt:
+            LLM_RETRIES.inc()
+        limiter.acquire()
+        try:
+            return _call_llm(_llm_analyse, title, body)
+        except Exception as exc:
+            logging.warning("LLM attempt %d failed: %s", attempt + 1, exc)
+            if attempt < 2 and LLM_BREAKER.state == CLOSED:
+                time.sleep(2 * (attempt + 1))
+    return None
+
+
+def _analyse_chunk(
+    items: List[Dict[str, Any]], limiter: RateLimiter
+) -> List[Tuple[str, str, int, str] | None]:
+    """One batched call for `items`; anything it misses goes single-article."""
+    results: List[Tuple[str, str, int, str] | None] = [None] * len(items)
+    if len(items) > 1 and LLM_BREAKER.allow():
+        limiter.acquire()
+        try:
+            results = _call_llm(_llm_analyse_batch, items)
+        except Exception as exc:
+            logging.warning("LLM batch of %d failed: %s", len(items), exc)
+    return [
+        res or _analyse_with_retry(it["title"], it["body"], limiter)
+        for it, res in zip(items, results)
+    ]
+
+
+def _analyse_many(
+    items: List[Dict[str, Any]],
+    workers: int,
+    limiter: RateLimiter,
+    batch_size: int = 1,
+) -> List[Tuple[str, str, int, str] | None]:
+    """
+    Analyse `items` concurrently, `batch_size` articles per prompt.
+    Results keep the order of `items`; None marks an article the LLM
+    could not analyse (caller decides on the fallback).
+    """
+    if not items:
+        return []
+    size = max(1, batch_size)
+    chunks = [items[i:i + size] for i in range(0, len(items), size)]
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(chunks)))) as pool:
+        done = pool.map(lambda chunk: _analyse_chunk(chunk, limiter), chunks)
+        return [res for chunk in done for res in chunk]
+
 # -----------------------------------------------------------------------------
-def ingest_once() -> int:
+def _flush_writes(ops: List[UpdateOne]) -> int:
+    """One unordered bulk upsert; returns the number of new docs."""
+    if not ops:
+        return 0
+    try:
+        with WRITE_SECONDS.time():
+            res = mongo.db.News_reserve.bulk_write(ops, ordered=False)
+        inserted, updated, dups = res.upserted_count, res.modified_count, 0
+    except BulkWriteError as exc:
+        details = exc.details
+        errors = details.get("writeErrors", [])
+        dups = sum(1 for e in errors if e.get("code") == 11000)  # race condition dup
+        if dups < len(errors):
+            raise
+        inserted, updated = details.get("nUpserted", 0), details.get("nModified", 0)
+    logging.info(
+        "Ingest write – %d inserted, %d updated, %d duplicates", inserted, updated, dups
+    )
+    return inserted
+
+# -----------------------------------------------------------------------------
+_NEWS_CLIENT: NewsAPIClient | None = None
+
+
+def _news_client() -> NewsAPIClient:
+    """Process-wide client, so its keep-alive pool outlives a single cycle."""
+    global _NEWS_CLIENT
+    if _NEWS_CLIENT is None:
+        _NEWS_CLIENT = NewsAPIClient(
+            os.getenv("NEWS_API_URL", DEFAULT_URL),
+            timeout=REQUEST_TIMEOUT,
+            max_retries=int(os.getenv("NEWS_API_RETRIES", 3)),
+        )
+    return _NEWS_CLIENT
+
+# -----------------------------------------------------------------------------
+# Pipeline stages: fetch → clean → analyse → write (see run_pipeline)
+
+def _published(art: Dict[str, Any]) -> Optional[datetime]:
+    """NewsAPI published_at → naive UTC datetime (None if missing/bad)."""
+    try:
+        dt = datetime.fromisoformat(str(art["published_at"]).replace("Z", "+00:00"))
+    except (KeyError, ValueError):
+        return None
+    return dt.astimezone(timezone.utc).replace(tzinfo=None) if dt.tzinfo else dt
+
+
+def _api_time(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _fetch_pages(
+    params: Dict[str, Any],
+    pages: range,
+    limiter: RateLimiter,
+    progress: Dict[str, bool],
+    seen: Optional[Callable[[Dict[str, Any]], bool]] = None,
+):
+    """
+    Yield (page, articles). Sets progress["exhausted"] once there is nothing
+    left to fetch (short page, last page, or already-seen articles);
+    a failed page ends the cycle's fetching without setting it.
+    """
+    client = _news_client()
+    for page in pages:
+        limiter.acquire()  # polite pacing between pages
+        try:
+            with STAGE_SECONDS.time(stage="fetch"):
+                articles = client.fetch({**params, "page": page}).get("data", [])
+        except Exception as exc:
+            logging.error("NewsAPI page %d failed: %s", page, exc)
+            return
+        finally:
+            t = client.last_timing
+            if t:
+                NEWSAPI_SECONDS.observe(t.elapsed, status=str(t.status))
+                logging.debug(
+                    "NewsAPI page %d – HTTP %s in %.2fs (%d attempts)",
+                    page, t.status, t.elapsed, t.attempts,
+                )
+
+        fresh = [a for a in articles if not (seen and seen(a))]
+        if fresh:
+            yield page, fresh
+        if len(fresh) < len(articles) or len(articles) < params["page_size"]:
+            break
+    progress["exhausted"] = True
+
+
+def _clean_page(batch, max_chars: int = 0) -> Tuple[int, List[Dict[str, Any]]]:
+    page, articles = batch
+    items = []
+    for art in articles:
+        url = art.get("url")
+        if not url:
+            continue
+
+        body = normalise(
+            " ".join(
+                filter(
+                    None,
+                    [art.get("content"), art.get("description"), art.get("snippet")],
+                )
+            ),
+            max_chars=max_chars,
+        )
+        title = art.get("title") or art.get("headline") or ""
+        items.append({
+            "url": url,
+            "title": title,
+            "body": body,
+            "published_at": _published(art),
+            "simhash": fingerprint.simhash(body),
+            "key": analysis_cache.cache_key(LLM_MODEL, PROMPT_VERSION, title, body),
+        })
+    return page, items
+
+
+def _analyse_page(
+    batch,
+    workers: int,
+    limiter: RateLimiter,
+    batch_size: int,
+    dedup: fingerprint.NearDupIndex,
+):
+    """
+    Sets item["analysis"] from the cache, the LLM or the fallback, or
+    item["duplicate_of"] for near-duplicates of an already-known article.
+    """
+    page, items = batch
+
+    # ── Near-duplicates reuse the canonical article; no LLM ──────
+    dups = dedup.match_many((it["url"], it["simhash"]) for it in items)
+    for it in items:
+        if it["url"] in dups:
+            it["duplicate_of"] = dups[it["url"]]
+    originals = [it for it in items if "duplicate_of" not in it]
+
+    # ── Cache lookup; only misses go to the LLM ──────────────
+    cached = analysis_cache.lookup(it["key"] for it in originals)
+    todo = []
+    for it in originals:
+        if it["key"] in cached:
+            it["analysis"] = cached[it["key"]]
+        else:
+            todo.append(it)
+
+    # ── Confident local predictions skip the LLM ────────────
+    threshold = float(os.getenv("LOCAL_SCORER_SHORTCUT", 0))
+    model = _local_scorer() if threshold > 0 and todo else None
+    if model:
+        pos, cats, conf = model.predict([scorer.text_of(it["title"], it["body"]) for it in todo])
+        unsure = []
+        for it, p, c, cf in zip(todo, pos, cats, conf):
+            if cf >= threshold:
+                head, summ, _, _ = _fallback(it["title"], it["body"])
+                it["analysis"] = (head, summ, int(p), c)
+                it["scored_by"] = model.tag
+            else:
+                unsure.append(it)
+        todo = unsure
+
+    # ── LLM step, fanned out over the worker pool ─────────────
+    fresh, failed = {}, []
+    for it, res in zip(todo, _analyse_many(todo, workers, limiter, batch_size)):
+        if res is None:
+            failed.append(it)
+        else:
+            it["analysis"] = fresh[it["key"]] = res
+    for it, res in zip(failed, _fallback_many(failed)):
+        it["analysis"] = res
+        it["fallback"] = True
+    analysis_cache.store(fresh, LLM_MODEL, PROMPT_VERSION)
+
+    ARTICLES.inc(len(items) - len(originals), source="duplicate")
+    ARTICLES.inc(len(cached), source="cache")
+    ARTICLES.inc(len(originals) - len(cached) - len(todo), source="local")
+    ARTICLES.inc(len(todo) - len(failed), source="llm")
+    ARTICLES.inc(len(failed), source="fallback")
+    return page, items
+
+
+def _write_page(batch, write_batch: int) -> int:
+    """
+    Bulk upsert into Mongo (dedupe on source_url); returns new docs.
+    Fallback-scored articles are flagged and queued for re-analysis;
+    near-duplicates are only linked to their canonical article (alt_urls).
+    """
+    page, items = batch
+    inserted, ops, links = 0, [], []
+    for it in items:
+        if "duplicate_of" in it:
+            links.append(UpdateOne(
+                {"source_url": it["duplicate_of"]}, {"$addToSet": {"alt_urls": it["url"]}}
+            ))
+            continue
+        head, summ, pos, cat = it["analysis"]
+        update: Dict[str, Any] = {
+            "$set": {
+                "headline":      head,
+                "excerpt":       summ,
+                "positivity":    pos,
+                "category":      cat,
+                "full_body":     it["body"],
+                "source_url":    it["url"],
+                "orig_headline": it["title"],
+                "content_hash":  it["key"],
+                "published_at":  it["published_at"],
+            },
+            "$setOnInsert": {"created_date": datetime.utcnow()},
+        }
+        if it.get("fallback"):
+            update["$set"]["needs_reanalysis"] = True
+            update["$unset"] = {"llm_model": "", "prompt_version": ""}
+        else:
+            update["$set"]["llm_model"] = it.get("scored_by", LLM_MODEL)
+            update["$set"]["prompt_version"] = PROMPT_VERSION
+            update["$unset"] = {"needs_reanalysis": ""}
+        ops.append(UpdateOne({"source_url": it["url"]}, update, upsert=True))
+        if write_batch and len(ops) >= write_batch:
+            inserted += _flush_writes(ops)
+            ops = []
+    inserted += _flush_writes(ops)
+    if links:  # after the upserts, so same-page canonicals already exist
+        mongo.db.News_reserve.bulk_write(links, ordered=False)
+    fingerprint.store(
+        (it["url"], it["simhash"], it.get("duplicate_of", it["url"])) for it in items
+    )
+
+    REANALYSIS_QUEUE.put_many(
+        (it["url"], {"source_url": it["url"]}, 0) for it in items if it.get("fallback")
+    )
+    return inserted
+
+# -----------------------------------------------------------------------------
+def ingest_once(backfill: bool = False, lease: Optional[Lease] = None) -> int:
+    """
+    One ingest cycle; returns new docs. With `lease`, every page write first
+    checks it is still held and checkpoint writes carry its fencing token.
+    """
     params = {
         "api_token": os.getenv("NEWS_API_TOKEN"),
         "language": os.getenv("NEWS_LANGUAGE", "en"),
         "page_size": int(os.getenv("NEWS_PAGE_SIZE", 50)),
     }
     pages = int(os.getenv("NEWS_MAX_PAGES", 3))
+    batch_size = int(os.getenv("LLM_BATCH_SIZE", 1))
+    workers = int(os.getenv("LLM_WORKERS", 4))
+    limiter = RateLimiter(float(os.getenv("LLM_RPS", 2)))
+    page_limiter = RateLimiter(float(os.getenv("NEWS_API_RPS", 1)))
+    write_batch = int(os.getenv("INGEST_WRITE_BATCH", 0))  # 0 = one flush per page
+    queue_size = int(os.getenv("INGEST_QUEUE_SIZE", 2))    # pages buffered per stage
+    body_chars = int(os.getenv("INGEST_BODY_MAX_CHARS", 0))  # 0 = keep the whole body
 
-    inserted = 0
-    for page in range(1, pages + 1):
-        params["page"] = page
-        try:
-            r = requests.get(NEWS_API, params=params, timeout=REQUEST_TIMEOUT)
-            r.raise_for_status()
-            articles = r.json().get("data", [])
-        except Exception as exc:
-            logging.error("NewsAPI page %d failed: %s", page, exc)
-            break
+    analysis_cache.ensure_index()
+    fingerprint.ensure_index()
+    REANALYSIS_QUEUE.ensure_indexes()
 
-        for art in articles:
-            url = art.get("url")
-            if not url:
-                continue
-
-            body = _clean(
-                " ".join(
-                    filter(
-                        None,
-                        [art.get("content"), art.get("description"), art.get("snippet")],
-                    )
-                )
+    fenced = {"fence": lease.token} if lease else {}
+
+    # ── Incremental vs (resumable) backfill ─────────────────────
+    state = checkpoint.load()
+    bf = state.get("backfill")
+    seen = None
+    if backfill or bf or not state.get("last_published_at"):
+        bf = bf or checkpoint.start_backfill(datetime.utcnow(), **fenced)
+        params["published_before"] = _api_time(bf["before"])
+        page_range = range(bf["next_page"], int(os.getenv("NEWS_BACKFILL_PAGES", 20)) + 1)
+        logging.info("Ingest backfill from page %d", bf["next_page"])
+    else:
+        wm, last_url = state["last_published_at"], state.get("last_url")
+        params["published_after"] = _api_time(wm)
+        page_range = range(1, pages + 1)
+
+        def seen(art: Dict[str, Any]) -> bool:
+            pub = _published(art)
+            return art.get("url") == last_url or (pub is not None and pub < wm)
+
+    inserted, pages_written = 0, 0
+    dedup = fingerprint.NearDupIndex()
+    newest = [bf.get("max_published_at") if bf else None, bf.get("max_url") if bf else None]
+    progress = {"exhausted": False}
+
+    def write(batch) -> None:
+        nonlocal inserted, pages_written
+        if lease:
+            lease.check()
+        with STAGE_SECONDS.time(stage="write"):
+            inserted += _write_page(batch, write_batch)
+        pages_written += 1
+        for it in batch[1]:
+            if it["published_at"] and (newest[0] is None or it["published_at"] > newest[0]):
+                newest[:] = [it["published_at"], it["url"]]
+        if bf:
+            checkpoint.save_backfill_page(batch[0], *newest, **fenced)
+
+    def clean(batch):
+        with STAGE_SECONDS.time(stage="clean"):
+            return _clean_page(batch, body_chars)
+
+    def analyse(batch):
+        with STAGE_SECONDS.time(stage="analyse"):
+            return _analyse_page(batch, workers, limiter, batch_size, dedup)
+
+    INGEST_ACTIVE.set()
+    try:
+        with CYCLE_SECONDS.time(mode="backfill" if bf else "incremental"):
+            run_pipeline(
+                _fetch_pages(params, page_range, page_limiter, progress, seen),
+                [clean, analyse, write],
+                maxsize=queue_size,
             )
-            title = art.get("title") or art.get("headline") or ""
-            # ── LLM step with 2 retries ───────────────────────────────
-            for attempt in range(3):
-                try:
-                    head, summ, pos, cat = _llm_analyse(title, body)
-                    break
-                except Exception as exc:
-                    logging.warning("LLM attempt %d failed: %s", attempt + 1, exc)
-                    if attempt == 2:
-                        head, summ, pos, cat = _fallback(title, body)
-                    else:
-                        time.sleep(2 * (attempt + 1))
-
-            # ── Upsert into Mongo (dedupe on source_url) ─────────────
-            try:
-                res = mongo.db.News_reserve.replace_one(
-                    {"source_url": url},
-                    {
-                        "headline":      head,
-                        "excerpt":       summ,
-                        "positivity":    pos,
-                        "category":      cat,
-                        "full_body":     body,
-                        "created_date":  datetime.utcnow(),
-                        "source_url":    url,
-                        "orig_headline": title,
-                    },
-                    upsert=True,
-                )
-                if res.upserted_id:
-                    inserted += 1
-            except DuplicateKeyError:
-                continue  # race condition dup
+    finally:
+        INGEST_ACTIVE.clear()
+        if pages_written:  # even a failed cycle may have changed the feed
+            feed_cache.bump()
 
-        time.sleep(1)  # polite delay between pages
+    # Only advance once everything newer than the old watermark is written;
+    # otherwise the next cycle re-fetches the gap (the cache makes it cheap).
+    if progress["exhausted"]:
+        if bf:
+            checkpoint.finish_backfill(**fenced)
+        elif newest[0] is not None:
+            checkpoint.save_watermark(*newest, **fenced)
 
+    NEW_DOCS.inc(inserted)
+    LAST_CYCLE.set(time.time())
     logging.info("Ingest cycle done – %d new docs", inserted)
     return inserted
@@ -0,0 +1,55 @@
+"""
+Background jobs (ingest, re-analysis) and the `Jobs` queue that carries them.
+
+With INGEST_MODE=inline (default) the web process's scheduler runs them
+itself. With INGEST_MODE=queue it only enqueues, and `python -m app.worker`
+processes claim, run and ack them (see app/worker.py).
+
+Each task has a fixed job key, so enqueueing one that is already pending or
+running is a no-op – the queue-level equivalent of APScheduler's
+max_instances=1 / coalesce=True.
+"""
+
+from __future__ import annotations
+import os, logging
+from typing import Any, Callable, Dict, Optional
+
+from .ingest import ingest_once
+from .lease import Lease
+from .reanalysis import drain
+from .workqueue import MongoQueue
+
+JOBS = MongoQueue("Jobs", max_attempts=int(os.getenv("JOB_MAX_ATTEMPTS", 3)))
+
+# Only one ingest cycle at a time across every web/worker process.
+INGEST_LEASE = Lease("news_ingest", ttl=float(os.getenv("INGEST_LEASE_TTL", 60)))
+
+
+def run_ingest(backfill: bool = False) -> Optional[int]:
+    """ingest_once() under INGEST_LEASE; None if another process holds it."""
+    if not INGEST_LEASE.acquire():
+        logging.info("Ingest skipped – another process holds the lease")
+        return None
+    try:
+        return ingest_once(backfill=backfill, lease=INGEST_LEASE)
+    finally:
+        INGEST_LEASE.release()
+
+
+TASKS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "ingest": lambda payload: run_ingest(payload.get("backfill", False)),
+    "reanalyse": lambda payload: drain(),
+}
+PRIORITY = {"ingest": 10, "reanalyse": 0}
+
+
+def enqueue(task: str, **payload: Any) -> None:
+    if task not in TASKS:
+        raise ValueError(f"Unknown task {task!r}")
+    JOBS.put(task, {"task": task, **payload}, PRIORITY[task])
+
+
+def run_job(job: Dict[str, Any]) -> Any:
+    """Run a claimed job's task (exceptions propagate to the caller)."""
+    payload = job["payload"]
+    return TASKS[payload["task"]](payload)
@@ -0,0 +1,140 @@
+"""
+Mongo-backed lease (leader election) for jobs that must run in one process.
+
+One document per lease in `Leases`:
+{ "_id": name, "holder": "host:pid:nonce", "token": int, "expires_at": datetime,
+  "acquired_at": datetime }
+
+acquire() is a single find_one_and_update that only matches an expired
+lease (or inserts the first one); a live lease makes the upsert collide on
+_id, so exactly one contender wins. Every acquisition bumps `token` — the
+fencing token — which guarded writes carry so storage can refuse a holder
+that has since been superseded (see checkpoint.py).
+
+While held, a daemon thread renews `expires_at` every ttl/3. If the holder
+dies the heartbeat stops and the lease lapses after `ttl`, so the next
+contender takes over. A holder that fails to renew (Mongo down, or the
+lease was taken over) stops considering itself the holder once its own
+deadline passes; check() raises LeaseLost from then on.
+
+Expiry is compared against each process's clock, so hosts must agree to
+well within `ttl`.
+"""
+
+from __future__ import annotations
+import os, logging, socket, threading, time, uuid
+from datetime import datetime, timedelta
+from typing import Optional
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from ..extensions import mongo
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+class LeaseLost(RuntimeError):
+    """The lease lapsed or was taken over while work was still running."""
+
+
+class Lease:
+    def __init__(self, name: str, ttl: float = 60.0, collection: str = "Leases"):
+        self.name = name
+        self.ttl = ttl
+        self.collection = collection
+        self.holder: Optional[str] = None
+        self.token: Optional[int] = None
+        self._deadline = 0.0  # monotonic; we stop trusting the lease after this
+        self._lost = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def col(self):
+        return mongo.db[self.collection]
+
+    @property
+    def held(self) -> bool:
+        return (
+            self.token is not None
+            and not self._lost.is_set()
+            and time.monotonic() < self._deadline
+        )
+
+    def check(self) -> None:
+        """Raise LeaseLost unless the lease is still ours."""
+        if not self.held:
+            raise LeaseLost(f"lease {self.name!r} (token {self.token}) is no longer held")
+
+    # ── lifecycle ────────────────────────────────────────────
+    def acquire(self) -> bool:
+        """Take the lease if it is free or expired; starts the heartbeat."""
+        holder = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        started, now = time.monotonic(), datetime.utcnow()
+        try:
+            doc = self.col.find_one_and_update(
+                {"_id": self.name, "expires_at": {"$lt": now}},
+                {
+                    "$set": {
+                        "holder": holder,
+                        "expires_at": now + timedelta(seconds=self.ttl),
+                        "acquired_at": now,
+                    },
+                    "$inc": {"token": 1},
+                },
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            return False  # someone else holds a live lease
+
+        self.holder, self.token = holder, doc["token"]
+        self._deadline = started + self.ttl
+        self._lost.clear()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._heartbeat, name=f"lease-{self.name}", daemon=True
+        )
+        self._thread.start()
+        logging.info("Lease %s acquired by %s (token %d)", self.name, holder, self.token)
+        return True
+
+    def renew(self) -> bool:
+        """Push expiry forward; False (and the lease is lost) if it is no longer ours."""
+        started, now = time.monotonic(), datetime.utcnow()
+        res = self.col.update_one(
+            {"_id": self.name, "holder": self.holder, "token": self.token},
+            {"$set": {"expires_at": now + timedelta(seconds=self.ttl)}},
+        )
+        if res.matched_count:
+            self._deadline = started + self.ttl
+            return True
+        self._lost.set()
+        logging.warning("Lease %s (token %s) was taken over", self.name, self.token)
+        return False
+
+    def release(self) -> None:
+        """Stop the heartbeat and expire the lease so the next contender needn't wait."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        if self.token is None:
+            return
+        try:
+            self.col.update_one(
+                {"_id": self.name, "holder": self.holder, "token": self.token},
+                {"$set": {"expires_at": _EPOCH}},
+            )
+        except Exception:
+            logging.exception("Lease %s release failed; it will lapse in %ss", self.name, self.ttl)
+        self.holder = self.token = None
+
+    def _heartbeat(self) -> None:
+        while not self._stop.wait(self.ttl / 3):
+            try:
+                if not self.renew():
+                    return
+            except Exception:  # transient Mongo error: retry until the deadline
+                logging.warning("Lease %s heartbeat failed", self.name, exc_info=True)
@@ -0,0 +1,167 @@
+"""
+Minimal in-process metrics registry rendered in the Prometheus text format.
+
+    STAGE_SECONDS = histogram("zenframe_ingest_stage_seconds", "…", ["stage"])
+    STAGE_SECONDS.observe(0.42, stage="fetch")
+    with STAGE_SECONDS.time(stage="write"): ...
+    render()  # → text for GET /metrics
+
+Metrics are per process: the web app serves its own on /metrics and
+`python -m app.worker --metrics-port` serves the workers'. All updates are
+guarded by one lock, so ingest threads can record concurrently.
+"""
+
+from __future__ import annotations
+import bisect, threading, time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# s – NewsAPI pages / LLM calls / Mongo writes all land between 10 ms and minutes
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300, 1800)
+
+_LOCK = threading.Lock()
+_REGISTRY: Dict[str, "_Metric"] = {}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Sequence[str], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _num(v: float) -> str:
+    if v == float("inf"):
+        return "+Inf"
+    return repr(float(v)) if isinstance(v, float) and not v.is_integer() else str(int(v))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, doc: str, labels: Sequence[str] = ()):
+        self.name, self.doc, self.label_names = name, doc, tuple(labels)
+        self._values: Dict[Tuple[str, ...], object] = {}
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name} takes labels {self.label_names}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.label_names)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with _LOCK:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def lines(self) -> List[str]:
+        return [
+            f"{self.name}{_labels(self.label_names, k)} {_num(v)}"
+            for k, v in sorted(self._values.items())
+        ]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with _LOCK:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, doc, labels=(), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, doc, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with _LOCK:
+            counts, total = self._values.get(key) or ([0] * (len(self.buckets) + 1), 0.0)
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._values[key] = (counts, total + value)
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> int:
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def total(self, **labels: str) -> float:
+        entry = self._values.get(self._key(labels))
+        return entry[1] if entry else 0.0
+
+    def lines(self) -> List[str]:
+        out = []
+        for key, (counts, total) in sorted(self._values.items()):
+            running = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                running += n
+                le = 'le="%s"' % _num(bound)
+                out.append(f"{self.name}_bucket{_labels(self.label_names, key, le)} {running}")
+            out.append(f"{self.name}_sum{_labels(self.label_names, key)} {_num(total)}")
+            out.append(f"{self.name}_count{_labels(self.label_names, key)} {running}")
+        return out
+
+
+def _register(metric: _Metric) -> _Metric:
+    with _LOCK:
+        existing = _REGISTRY.get(metric.name)
+        if existing is not None:
+            return existing
+        _REGISTRY[metric.name] = metric
+        return metric
+
+
+def counter(name: str, doc: str, labels: Sequence[str] = ()) -> Counter:
+    return _register(Counter(name, doc, labels))
+
+
+def gauge(name: str, doc: str, labels: Sequence[str] = ()) -> Gauge:
+    return _register(Gauge(name, doc, labels))
+
+
+def histogram(
+    name: str, doc: str, labels: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+) -> Histogram:
+    return _register(Histogram(name, doc, labels, buckets))
+
+
+def render() -> str:
+    """Every registered metric in the Prometheus text exposition format."""
+    with _LOCK:
+        metrics = sorted(_REGISTRY.values(), key=lambda m: m.name)
+        return "".join(
+            "\n".join(m.header() + m.lines()) + "\n" for m in metrics
+        )
+
+
+def reset() -> None:
+    """Zero every metric (tests)."""
+    with _LOCK:
+        for m in _REGISTRY.values():
+            m._values.clear()
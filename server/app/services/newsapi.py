@@ -0,0 +1,119 @@
+"""
+Pooled thenewsapi.com client.
+
+One keep-alive `requests.Session` per client (connections and TLS sessions
+are reused across pages and cycles). 429 and 5xx answers, connection errors
+and timeouts are retried with full-jitter exponential backoff, honouring a
+`Retry-After` header when the server sends one. Every request's wall time is
+recorded in `timings` / `last_timing`, and with PROVIDER_RECORD set every
+page is captured for replay (see cassette.py).
+"""
+
+from __future__ import annotations
+import random, time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Deque, Dict, NamedTuple, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import cassette
+
+DEFAULT_URL = "https://api.thenewsapi.com/v1/news/all"
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class RequestTiming(NamedTuple):
+    url: str
+    status: Optional[int]   # None → no HTTP answer (connection error/timeout)
+    attempts: int
+    elapsed: float          # s, all attempts incl. backoff sleeps
+
+
+class NewsAPIError(Exception):
+    """Raised once retries are exhausted (or on a non-retryable status)."""
+
+
+def _retry_after(resp: requests.Response) -> Optional[float]:
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class NewsAPIClient:
+    def __init__(
+        self,
+        base_url: str = DEFAULT_URL,
+        timeout: float = 12,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30,
+        pool_size: int = 4,
+        session: Optional[requests.Session] = None,
+    ):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.session = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.timings: Deque[RequestTiming] = deque(maxlen=100)
+
+    @property
+    def last_timing(self) -> Optional[RequestTiming]:
+        return self.timings[-1] if self.timings else None
+
+    def _delay(self, attempt: int, resp: Optional[requests.Response]) -> float:
+        hinted = _retry_after(resp) if resp is not None else None
+        if hinted is not None:
+            return min(hinted, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def fetch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """GET base_url with `params`; returns the decoded JSON body."""
+        start = time.perf_counter()
+        status: Optional[int] = None
+        attempt = 0
+        try:
+            while True:
+                attempt += 1
+                resp = None
+                try:
+                    resp = self.session.get(self.base_url, params=params, timeout=self.timeout)
+                    status = resp.status_code
+                except (requests.ConnectionError, requests.Timeout) as exc:
+                    status = None
+                    error: Exception = exc
+                else:
+                    if status not in RETRY_STATUS:
+                        if status >= 400:
+                            raise NewsAPIError(f"HTTP {status}: {resp.text[:120]}")
+                        data = resp.json()
+                        cassette.record("newsapi", cassette.newsapi_key(params), params, data)
+                        return data
+                    error = NewsAPIError(f"HTTP {status}")
+
+                if attempt > self.max_retries:
+                    raise NewsAPIError(f"gave up after {attempt} attempts: {error}") from error
+                time.sleep(self._delay(attempt - 1, resp))
+        finally:
+            self.timings.append(
+                RequestTiming(self.base_url, status, attempt, time.perf_counter() - start)
+            )
+
+    def close(self) -> None:
+        self.session.close()
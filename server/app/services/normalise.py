@@ -0,0 +1,91 @@
+"""
+Single-pass text normaliser for article bodies (replaces ingest._clean).
+
+One compiled pattern finds the markup in the raw text, left to right, and
+the plain text between matches is copied through as slices:
+• <script>/<style> elements are dropped together with their contents
+  (also when never closed), as are <!-- comments -->;
+• any other tag counts as whitespace, so "<p>a</p><p>b</p>" → "a b";
+• entities are decoded where they stand ("AT&amp;T" → "AT&T", &nbsp; is
+  whitespace) — after tag detection, so "&lt;b&gt;" stays literal text;
+• whitespace runs collapse to one space, leading/trailing space is dropped
+  (on the output only, which is never larger than the budget allows).
+
+With max_chars / max_words the scan stops as soon as the budget is full, so
+the tail of an oversized payload is never looked at.
+"""
+
+from __future__ import annotations
+import functools, html, re
+from typing import List, Optional
+
+# Every alternative starts with "<" or "&", so the engine skips plain text
+# in C between candidates instead of trying each branch at every offset.
+_MARKUP = re.compile(
+    r"<(?:(?P<rawtag>script|style)\b[^>]*>.*?(?:</(?P=rawtag)\s*>|\Z)"  # + contents
+    r"|!--.*?(?:-->|\Z)"                                               # comment
+    r"|/?[A-Za-z][^>]*>|[!?][^>]*>)"                                   # tag / doctype
+    r"|&(?P<entity>#[0-9]{1,7}|#[xX][0-9a-fA-F]{1,6}|[A-Za-z][A-Za-z0-9]{1,31});?",
+    re.S | re.I,
+)
+# Articles repeat a handful of entities (&amp; &nbsp; &#8217; …).
+_unescape = functools.lru_cache(maxsize=1024)(html.unescape)
+
+
+def _squash(parts: List[str]) -> List[str]:
+    """Collapse whitespace, keeping one trailing space if the text had one."""
+    raw = "".join(parts)
+    done = " ".join(raw.split())
+    return [done, " "] if done and raw[-1].isspace() else [done]
+
+
+def normalise(
+    text: Optional[str], max_chars: Optional[int] = None, max_words: Optional[int] = None
+) -> str:
+    """Plain, single-spaced text of an HTML-ish snippet, optionally capped."""
+    if not text:
+        return ""
+    capped = bool(max_chars or max_words)
+    out: List[str] = []
+    size, pos = 0, 0
+    check_at = _room("", max_chars, max_words)
+
+    for m in _MARKUP.finditer(text):
+        start = m.start()
+        out.append(text[pos:start])
+        out.append(_unescape(m.group()) if m.group("entity") else " ")
+        size += start - pos + 1
+        pos = m.end()
+        if capped and size >= check_at:
+            out = _squash(out)
+            room = _room(out[0], max_chars, max_words)
+            if not room:
+                return _cap(out[0], max_chars, max_words)
+            size = len(out[0])
+            check_at = size + room
+    else:
+        out.append(text[pos:])
+
+    return _cap(_squash(out)[0], max_chars, max_words)
+
+
+def _room(done: str, max_chars: Optional[int], max_words: Optional[int]) -> int:
+    """
+    Raw characters that can be appended before the budget might be full
+    (0 = full). A word budget only counts as full once the word after the
+    last one allowed has started, so the last word is never cut short.
+    """
+    room = []
+    if max_chars:
+        room.append(max_chars - len(done))
+    if max_words:
+        room.append(max_words + 1 - (done.count(" ") + 1 if done else 0))
+    return max(0, min(room)) if room else 0
+
+
+def _cap(text: str, max_chars: Optional[int], max_words: Optional[int]) -> str:
+    if max_words:
+        text = " ".join(text.split(" ", max_words)[:max_words])
+    if max_chars and len(text) > max_chars:
+        text = text[:max_chars].rstrip()
+    return text
@@ -0,0 +1,88 @@
+"""
+Minimal threaded pipeline.
+
+A source iterator feeds a chain of stage functions, one thread per stage,
+connected by bounded queues so a slow stage back-pressures the ones before
+it. The first exception in any stage stops every thread; run_pipeline()
+then re-raises it in the caller.
+"""
+
+from __future__ import annotations
+import queue, threading
+from typing import Any, Callable, Iterable, List, Optional, Sequence
+
+_DONE = object()  # end-of-stream marker
+_POLL = 0.1       # s, how often blocked threads re-check the stop flag
+
+
+def run_pipeline(
+    source: Iterable[Any],
+    stages: Sequence[Callable[[Any], Any]],
+    maxsize: int = 2,
+) -> None:
+    """
+    Push every item of `source` through `stages` in order.
+    A stage returning None drops the item; the last stage's return value
+    is discarded.
+    """
+    queues: List[queue.Queue] = [queue.Queue(maxsize=max(1, maxsize)) for _ in stages]
+    stop = threading.Event()
+    errors: List[BaseException] = []
+
+    def put(q: queue.Queue, item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=_POLL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def fail(exc: BaseException) -> None:
+        errors.append(exc)
+        stop.set()
+
+    def feed() -> None:
+        try:
+            for item in source:
+                if not put(queues[0], item):
+                    break
+        except BaseException as exc:
+            fail(exc)
+        finally:
+            put(queues[0], _DONE)
+
+    def work(fn: Callable, inbox: queue.Queue, outbox: Optional[queue.Queue]) -> None:
+        try:
+            while not stop.is_set():
+                try:
+                    item = inbox.get(timeout=_POLL)
+                except queue.Empty:
+                    continue
+                if item is _DONE:
+                    break
+                out = fn(item)
+                if outbox is not None and out is not None:
+                    put(outbox, out)
+        except BaseException as exc:
+            fail(exc)
+        finally:
+            if outbox is not None:
+                put(outbox, _DONE)
+
+    threads = [threading.Thread(target=feed, name="pipeline-source", daemon=True)]
+    for i, fn in enumerate(stages):
+        outbox = queues[i + 1] if i + 1 < len(stages) else None
+        threads.append(threading.Thread(
+            target=work,
+            args=(fn, queues[i], outbox),
+            name=f"pipeline-{getattr(fn, '__name__', i)}",
+            daemon=True,
+        ))
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    if errors:
+        raise errors[0]
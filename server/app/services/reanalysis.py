@@ -0,0 +1,109 @@
+"""
+Background re-analysis of fallback-scored articles.
+
+Ingest flags such articles `needs_reanalysis` and queues their URL on
+ingest.REANALYSIS_QUEUE. drain() leases a batch, re-runs the LLM on the
+stored headline/body and, on success, writes the real scores back and
+clears the flag. Failures are released with exponential backoff until the
+queue's max_attempts is reached.
+
+It only runs while the LLM circuit is closed and no ingest cycle is active
+in this process, so primary ingest never waits on it.
+"""
+
+from __future__ import annotations
+import os, logging, socket
+from typing import Any, Dict, List
+
+from pymongo import UpdateOne
+
+from ..extensions import mongo
+from . import analysis_cache, feed_cache, ingest
+from .circuit import CLOSED
+from .throttle import RateLimiter
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+def drain(batch_size: int | None = None) -> int:
+    """Re-analyse up to `batch_size` queued articles; returns how many were fixed."""
+    if ingest.LLM_BREAKER.state != CLOSED or ingest.INGEST_ACTIVE.is_set():
+        return 0
+
+    batch_size = batch_size or int(os.getenv("REANALYSIS_BATCH", 20))
+    lease = float(os.getenv("REANALYSIS_LEASE", 300))  # s
+    queue = ingest.REANALYSIS_QUEUE
+    queue.ensure_indexes()
+
+    jobs: List[Dict[str, Any]] = []
+    while len(jobs) < batch_size:
+        job = queue.claim(lease, WORKER_ID)
+        if not job:
+            break
+        jobs.append(job)
+    if not jobs:
+        return 0
+
+    urls = [job["payload"]["source_url"] for job in jobs]
+    docs = {
+        d["source_url"]: d
+        for d in mongo.db.News_reserve.find(
+            {"source_url": {"$in": urls}, "needs_reanalysis": True},
+            {"source_url": 1, "orig_headline": 1, "full_body": 1},
+        )
+    }
+
+    todo, pending = [], []
+    for job in jobs:
+        doc = docs.get(job["payload"]["source_url"])
+        if not doc:  # already re-scored (e.g. by a later ingest) or deleted
+            queue.ack(job)
+            continue
+        title, body = doc.get("orig_headline") or "", doc.get("full_body") or ""
+        todo.append({
+            "url": doc["source_url"],
+            "title": title,
+            "body": body,
+            "key": analysis_cache.cache_key(ingest.LLM_MODEL, ingest.PROMPT_VERSION, title, body),
+        })
+        pending.append(job)
+
+    results = ingest._analyse_many(
+        todo,
+        int(os.getenv("LLM_WORKERS", 4)),
+        RateLimiter(float(os.getenv("LLM_RPS", 2))),
+        int(os.getenv("LLM_BATCH_SIZE", 1)),
+    )
+
+    ops, fresh, fixed = [], {}, 0
+    for job, it, res in zip(pending, todo, results):
+        if res is None:
+            delay = 60 * 2 ** job["attempts"]
+            queue.release(job, delay=delay, error="LLM unavailable")
+            continue
+        head, summ, pos, cat = fresh[it["key"]] = res
+        ops.append(UpdateOne(
+            {"source_url": it["url"], "needs_reanalysis": True},
+            {
+                "$set": {
+                    "headline":       head,
+                    "excerpt":        summ,
+                    "positivity":     pos,
+                    "category":       cat,
+                    "content_hash":   it["key"],
+                    "llm_model":      ingest.LLM_MODEL,
+                    "prompt_version": ingest.PROMPT_VERSION,
+                },
+                "$unset": {"needs_reanalysis": ""},
+            },
+        ))
+    if ops:
+        mongo.db.News_reserve.bulk_write(ops, ordered=False)
+        feed_cache.bump()
+    analysis_cache.store(fresh, ingest.LLM_MODEL, ingest.PROMPT_VERSION)
+
+    for job, res in zip(pending, results):
+        if res is not None and queue.ack(job):
+            fixed += 1
+    logging.info("Re-analysis – %d fixed, %d still pending", fixed, len(pending) - fixed)
+    return fixed
@@ -0,0 +1,136 @@
+"""
+Local, CPU-only positivity/category scorer distilled from LLM labels.
+
+Features: word unigrams + bigrams of headline and body, hashed (crc32,
+signed) into N_FEATURES buckets, log-scaled and L2-normalised.
+Models:   softmax regression for category, linear regression for
+          positivity; both trained with vectorised mini-batch gradient
+          descent on the LLM-labelled history in News_reserve.
+
+Ingest uses it for the fallback score (instead of a flat 50/"other") and,
+when LOCAL_SCORER_SHORTCUT is set, to skip the LLM for articles whose
+category confidence reaches that threshold.
+"""
+
+from __future__ import annotations
+import json, os, re, time, zlib
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+N_FEATURES = 2 ** 14
+CATEGORIES = [  # ingest.ALLOWED_CATEGORIES + the fallback label
+    "world", "politics", "business", "tech", "science",
+    "health", "sports", "entertainment", "travel", "lifestyle", "other",
+]
+MODEL_PATH = os.getenv("LOCAL_SCORER_PATH", "models/local_scorer.npz")
+_WORD = re.compile(r"[a-z0-9']+")
+
+
+# ── features ────────────────────────────────────────────────
+def _tokens(text: str) -> List[str]:
+    words = _WORD.findall(text.lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def featurize(texts: Sequence[str]) -> np.ndarray:
+    """(len(texts), N_FEATURES) float32 matrix, rows L2-normalised."""
+    rows, cols, vals = [], [], []
+    for i, text in enumerate(texts):
+        for tok in _tokens(text):
+            h = zlib.crc32(tok.encode())
+            rows.append(i)
+            cols.append(h % N_FEATURES)
+            vals.append(1.0 if h & 0x80000000 else -1.0)
+    X = np.zeros((len(texts), N_FEATURES), dtype=np.float32)
+    if rows:
+        np.add.at(X, (np.array(rows), np.array(cols)), np.array(vals, dtype=np.float32))
+    X = np.sign(X) * np.log1p(np.abs(X))
+    norms = np.linalg.norm(X, axis=1, keepdims=True)
+    return X / np.maximum(norms, 1e-9)
+
+
+def _softmax(z: np.ndarray) -> np.ndarray:
+    z = z - z.max(axis=1, keepdims=True)
+    e = np.exp(z)
+    return e / e.sum(axis=1, keepdims=True)
+
+
+# ── model ───────────────────────────────────────────────────
+class LocalScorer:
+    def __init__(self, W: np.ndarray, b: np.ndarray, w: np.ndarray, c: float, meta: Dict):
+        self.W, self.b, self.w, self.c, self.meta = W, b, w, float(c), meta
+
+    @property
+    def tag(self) -> str:
+        """Stored as llm_model on documents this scorer labelled."""
+        return f"local:{self.meta.get('trained_at', 'unknown')}"
+
+    @classmethod
+    def train(
+        cls,
+        texts: Sequence[str],
+        categories: Sequence[str],
+        positivity: Sequence[int],
+        epochs: int = 8,
+        batch: int = 256,
+        lr: float = 2.0,
+        l2: float = 1e-5,
+        seed: int = 0,
+    ) -> "LocalScorer":
+        X = featurize(texts)
+        y = np.array([CATEGORIES.index(c) if c in CATEGORIES else len(CATEGORIES) - 1 for c in categories])
+        p = np.asarray(positivity, dtype=np.float32) / 100.0
+        n, k = X.shape[0], len(CATEGORIES)
+        W = np.zeros((N_FEATURES, k), dtype=np.float32)
+        b = np.zeros(k, dtype=np.float32)
+        w = np.zeros(N_FEATURES, dtype=np.float32)
+        c = float(p.mean()) if n else 0.5
+        Y = np.eye(k, dtype=np.float32)[y]
+        rng = np.random.default_rng(seed)
+
+        for _ in range(epochs):
+            order = rng.permutation(n)
+            for start in range(0, n, batch):
+                idx = order[start:start + batch]
+                Xb = X[idx]
+                # softmax cross-entropy
+                G = (_softmax(Xb @ W + b) - Y[idx]) / len(idx)
+                W -= lr * (Xb.T @ G + l2 * W)
+                b -= lr * G.sum(axis=0)
+                # squared error
+                r = (Xb @ w + c - p[idx]) / len(idx)
+                w -= lr * (Xb.T @ r + l2 * w)
+                c -= lr * float(r.sum())
+
+        meta = {"trained_at": time.strftime("%Y%m%dT%H%M%S"), "n_train": int(n)}
+        return cls(W, b, w, c, meta)
+
+    def predict(self, texts: Sequence[str]) -> Tuple[np.ndarray, List[str], np.ndarray]:
+        """(positivity 1‑100 ints, categories, category confidence 0‑1)."""
+        if not texts:
+            return np.zeros(0, dtype=int), [], np.zeros(0)
+        X = featurize(texts)
+        probs = _softmax(X @ self.W + self.b)
+        best = probs.argmax(axis=1)
+        pos = np.clip(np.rint((X @ self.w + self.c) * 100), 1, 100).astype(int)
+        return pos, [CATEGORIES[i] for i in best], probs.max(axis=1)
+
+    # ── persistence ─────────────────────────────────────────
+    def save(self, path: str = MODEL_PATH) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        np.savez_compressed(
+            path, W=self.W, b=self.b, w=self.w, c=np.array(self.c),
+            meta=np.array(json.dumps(self.meta)),
+        )
+
+    @classmethod
+    def load(cls, path: str = MODEL_PATH) -> Optional["LocalScorer"]:
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as f:
+            return cls(f["W"], f["b"], f["w"], float(f["c"]), json.loads(str(f["meta"])))
+
+
+def text_of(title: str, body: str) -> str:
+    return f"{title}\n{body[:1500]}"
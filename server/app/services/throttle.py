@@ -0,0 +1,37 @@
+"""
+Thread-safe token-bucket rate limiter shared by the ingest stages.
+"""
+
+from __future__ import annotations
+import threading, time
+
+
+class RateLimiter:
+    """
+    Allow at most `rate` acquisitions per second (bursts up to `burst`).
+    `rate <= 0` disables limiting.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._stamp) * self.rate
+                )
+                self._stamp = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
@@ -0,0 +1,105 @@
+"""
+Mongo-backed work queue with leases.
+
+One document per job:
+{
+  "_id": <caller key>,           # idempotent enqueue
+  "payload": {...},
+  "priority": int,               # higher first
+  "attempts": int,               # bumped on every claim
+  "lease_until": datetime,       # claimable once this is in the past
+  "enqueued_at": datetime,
+  "worker": str, "last_error": str,
+}
+A claim is an atomic find_one_and_update that pushes `lease_until` forward,
+so a crashed worker's job becomes claimable again when the lease runs out.
+Jobs that reach `max_attempts` stay in the collection as dead letters.
+"""
+
+from __future__ import annotations
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from pymongo import ASCENDING, DESCENDING, ReturnDocument, UpdateOne
+
+from ..extensions import mongo
+
+
+class MongoQueue:
+    def __init__(self, name: str, max_attempts: int = 5):
+        self.name = name
+        self.max_attempts = max_attempts
+
+    @property
+    def col(self):
+        return mongo.db[self.name]
+
+    def ensure_indexes(self) -> None:
+        self.col.create_index(
+            [("lease_until", ASCENDING), ("priority", DESCENDING), ("enqueued_at", ASCENDING)]
+        )
+
+    # ── producers ────────────────────────────────────────────
+    def put_many(self, jobs: Iterable[Tuple[Any, Dict[str, Any], int]]) -> None:
+        """Enqueue (key, payload, priority) jobs; re-enqueueing a key only raises its priority."""
+        now = datetime.utcnow()
+        ops = [
+            UpdateOne(
+                {"_id": key},
+                {
+                    "$setOnInsert": {
+                        "payload": payload,
+                        "attempts": 0,
+                        "lease_until": now,
+                        "enqueued_at": now,
+                    },
+                    "$max": {"priority": priority},
+                },
+                upsert=True,
+            )
+            for key, payload, priority in jobs
+        ]
+        if ops:
+            self.col.bulk_write(ops, ordered=False)
+
+    def put(self, key: Any, payload: Dict[str, Any], priority: int = 0) -> None:
+        self.put_many([(key, payload, priority)])
+
+    # ── consumers ────────────────────────────────────────────
+    def claim(self, lease_seconds: float, worker: str = "") -> Optional[Dict[str, Any]]:
+        """Lease the highest-priority, oldest claimable job (or None)."""
+        now = datetime.utcnow()
+        return self.col.find_one_and_update(
+            {"lease_until": {"$lte": now}, "attempts": {"$lt": self.max_attempts}},
+            {
+                "$set": {"lease_until": now + timedelta(seconds=lease_seconds), "worker": worker},
+                "$inc": {"attempts": 1},
+            },
+            sort=[("priority", DESCENDING), ("enqueued_at", ASCENDING)],
+            return_document=ReturnDocument.AFTER,
+        )
+
+    def touch(self, job: Dict[str, Any], lease_seconds: float) -> bool:
+        """Still working: extend the lease; False if the job was re-claimed."""
+        res = self.col.update_one(
+            {"_id": job["_id"], "attempts": job["attempts"]},
+            {"$set": {"lease_until": datetime.utcnow() + timedelta(seconds=lease_seconds)}},
+        )
+        return res.matched_count == 1
+
+    def ack(self, job: Dict[str, Any]) -> bool:
+        """Done: delete the job, unless someone else has re-claimed it since."""
+        res = self.col.delete_one({"_id": job["_id"], "attempts": job["attempts"]})
+        return res.deleted_count == 1
+
+    def release(self, job: Dict[str, Any], delay: float = 0, error: str = "") -> None:
+        """Failed: make the job claimable again after `delay` seconds."""
+        self.col.update_one(
+            {"_id": job["_id"], "attempts": job["attempts"]},
+            {
+                "$set": {
+                    "lease_until": datetime.utcnow() + timedelta(seconds=delay),
+                    "last_error": error[:500],
+                }
+            },
+        )
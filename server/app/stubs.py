@@ -0,0 +1,265 @@
+"""
+Local stand-ins for thenewsapi.com and Together, for offline benchmarks and
+load tests.
+
+    python -m app.stubs [--news-port 8801] [--llm-port 8802] [--articles 500]
+                        [--news-latency 0.2] [--llm-latency 1.0] [--jitter 0.25]
+                        [--error-rate 0.02] [--news-rps 5] [--llm-rps 10]
+                        [--cassette recorded.jsonl] [--seed 1]
+
+then point the app at them:
+
+    NEWS_API_URL=http://127.0.0.1:8801/v1/news/all
+    TOGETHER_BASE_URL=http://127.0.0.1:8802/v1   TOGETHER_API_KEY=stub
+
+NewsAPI serves a fixed, seeded set of articles (newest first) and honours
+page, limit/page_size, published_after and published_before. Together
+answers chat completions for the ingest prompts, single or batched, with
+deterministic scores. With --cassette, requests recorded earlier (see
+services/cassette.py) get their recorded answer instead.
+
+Each server adds latency ± jitter, fails --error-rate of requests with a
+503, and answers 429 + Retry-After above its --*-rps.
+"""
+
+from __future__ import annotations
+import argparse, hashlib, json, random, re, threading, time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from .services import cassette
+from .services.ingest import ALLOWED_CATEGORIES
+
+_WORDS = (
+    "council library funding volunteers record harvest community garden "
+    "researchers discover treatment team wins championship city opens park "
+    "students build robot festival returns rescue dog adopted solar project"
+).split()
+
+
+class Behaviour:
+    """Latency, random failures and a rate limit shared by one stub server."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rps: float = 0.0,
+        seed: int = 1,
+    ):
+        self.latency, self.jitter = latency, jitter
+        self.error_rate, self.rps = error_rate, rps
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens, self._last = max(1.0, rps), time.monotonic()
+        self.stats = {"requests": 0, "errors": 0, "throttled": 0}
+
+    def gate(self) -> Optional[Tuple[int, Dict[str, str]]]:
+        """(status, headers) to fail this request with, or None to serve it."""
+        with self._lock:
+            self.stats["requests"] += 1
+            if self.rps > 0:
+                now = time.monotonic()
+                self._tokens = min(max(1.0, self.rps), self._tokens + (now - self._last) * self.rps)
+                self._last = now
+                if self._tokens < 1:
+                    self.stats["throttled"] += 1
+                    wait = (1 - self._tokens) / self.rps
+                    return 429, {"Retry-After": f"{max(1, round(wait))}"}
+                self._tokens -= 1
+            fail = self._rng.random() < self.error_rate
+            delay = max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter))
+            if fail:
+                self.stats["errors"] += 1
+        time.sleep(delay)
+        return (503, {}) if fail else None
+
+
+def _json_handler(route):
+    """BaseHTTPRequestHandler that passes (method, path, query, body) to `route`."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, like the real APIs
+
+        def _serve(self, method: str) -> None:
+            url = urlparse(self.path)
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length) or b"{}") if length else {}
+            status, headers, payload = route(method, url.path, parse_qs(url.query), body)
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for k, v in headers.items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self) -> None:
+            self._serve("GET")
+
+        def do_POST(self) -> None:
+            self._serve("POST")
+
+        def log_message(self, *args) -> None:
+            pass
+
+    return Handler
+
+
+# ── NewsAPI ─────────────────────────────────────────────────
+def make_articles(n: int, seed: int = 1, newest: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """`n` seeded articles, newest first, one every 5 minutes."""
+    rng = random.Random(seed)
+    newest = newest or datetime(2024, 6, 1, 12, 0, 0)
+    out = []
+    for i in range(n):
+        words = rng.choices(_WORDS, k=rng.randint(60, 140))
+        title = " ".join(rng.choices(_WORDS, k=8)).capitalize()
+        out.append({
+            "uuid": f"stub-{seed}-{i}",
+            "title": title,
+            "description": " ".join(words[:25]),
+            "snippet": "<p>" + " ".join(words[25:]) + " &amp; more</p>",
+            "url": f"https://stub.news/{seed}/{i}",
+            "published_at": (newest - timedelta(minutes=5 * i)).strftime("%Y-%m-%dT%H:%M:%S.000000Z"),
+            "source": "stub.news",
+        })
+    return out
+
+
+class NewsAPIStub:
+    def __init__(self, articles: List[Dict[str, Any]], behaviour: Behaviour, recorded=None):
+        self.articles = articles
+        self.behaviour = behaviour
+        self.recorded = recorded or {}
+
+    def route(self, method, path, query, body):
+        if method != "GET" or not path.rstrip("/").endswith("/news/all"):
+            return 404, {}, {"error": "not found"}
+        failed = self.behaviour.gate()
+        if failed:
+            return failed[0], failed[1], {"error": {"code": "stub_failure"}}
+
+        params = {k: v[0] for k, v in query.items()}
+        hit = self.recorded.get(("newsapi", cassette.newsapi_key(params)))
+        if hit is not None:
+            return 200, {}, hit
+
+        page = int(params.get("page", 1))
+        size = int(params.get("limit") or params.get("page_size") or 3)
+        after, before = params.get("published_after"), params.get("published_before")
+        rows = [
+            a for a in self.articles
+            if (not after or a["published_at"][:19] > after)
+            and (not before or a["published_at"][:19] < before)
+        ]
+        data = rows[(page - 1) * size: page * size]
+        meta = {"found": len(rows), "returned": len(data), "limit": size, "page": page}
+        return 200, {}, {"meta": meta, "data": data}
+
+
+# ── Together ────────────────────────────────────────────────
+_BATCH_TITLE = re.compile(r"^\[(\d+)\] Original headline: (.*)$", re.M)
+_SINGLE_TITLE = re.compile(r"^Original headline: (.*)$", re.M)
+
+
+def _score(title: str) -> Dict[str, Any]:
+    h = int(hashlib.sha256(title.encode()).hexdigest(), 16)
+    return {
+        "rewritten_headline": f"Good news: {title}"[:120],
+        "summary": "A stub summary. It reads pleasantly.",
+        "positivity": 1 + h % 100,
+        "category": ALLOWED_CATEGORIES[h % len(ALLOWED_CATEGORIES)],
+    }
+
+
+class TogetherStub:
+    def __init__(self, behaviour: Behaviour, recorded=None):
+        self.behaviour = behaviour
+        self.recorded = recorded or {}
+
+    def route(self, method, path, query, body):
+        if method != "POST" or not path.endswith("/chat/completions"):
+            return 404, {}, {"error": {"message": "not found"}}
+        failed = self.behaviour.gate()
+        if failed:
+            return failed[0], failed[1], {"error": {"message": "stub failure"}}
+
+        model = body.get("model", "")
+        prompt = body["messages"][-1]["content"]
+        hit = self.recorded.get(("together", cassette.together_key(model, prompt)))
+        if hit is not None:
+            content, usage = hit["content"], hit.get("usage") or {}
+        else:
+            batch = _BATCH_TITLE.findall(prompt)
+            if batch:
+                content = json.dumps([{"index": int(i), **_score(t)} for i, t in batch])
+            else:
+                m = _SINGLE_TITLE.search(prompt)
+                content = json.dumps(_score(m.group(1) if m else prompt[:80]))
+            usage = {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(content) // 4}
+        usage["total_tokens"] = usage.get("prompt_tokens", 0) + usage.get("completion_tokens", 0)
+        return 200, {}, {
+            "id": f"stub-{hashlib.md5(prompt.encode()).hexdigest()[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": usage,
+        }
+
+
+# ── servers ─────────────────────────────────────────────────
+def serve(stub, port: int = 0, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Start `stub` on a daemon thread; port 0 picks a free port (server.server_port)."""
+    server = ThreadingHTTPServer((host, port), _json_handler(stub.route))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="stub-http", daemon=True).start()
+    return server
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--news-port", type=int, default=8801)
+    parser.add_argument("--llm-port", type=int, default=8802)
+    parser.add_argument("--articles", type=int, default=500)
+    parser.add_argument("--news-latency", type=float, default=0.2, help="s per NewsAPI page")
+    parser.add_argument("--llm-latency", type=float, default=1.0, help="s per completion")
+    parser.add_argument("--jitter", type=float, default=0.25, help="± fraction of the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 503 answers")
+    parser.add_argument("--news-rps", type=float, default=0, help="429 above this (0 = off)")
+    parser.add_argument("--llm-rps", type=float, default=0, help="429 above this (0 = off)")
+    parser.add_argument("--cassette", default=None, help="replay responses recorded with PROVIDER_RECORD")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    recorded = cassette.load(args.cassette) if args.cassette else {}
+    news = serve(NewsAPIStub(
+        make_articles(args.articles, args.seed),
+        Behaviour(args.news_latency, args.news_latency * args.jitter, args.error_rate,
+                  args.news_rps, args.seed),
+        recorded,
+    ), args.news_port)
+    llm = serve(TogetherStub(
+        Behaviour(args.llm_latency, args.llm_latency * args.jitter, args.error_rate,
+                  args.llm_rps, args.seed + 1),
+        recorded,
+    ), args.llm_port)
+    print(f"NEWS_API_URL=http://127.0.0.1:{news.server_port}/v1/news/all")
+    print(f"TOGETHER_BASE_URL=http://127.0.0.1:{llm.server_port}/v1")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
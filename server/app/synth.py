@@ -0,0 +1,349 @@
+"""
+Seeded synthetic dataset at production scale, for performance work.
+
+    python -m app.synth --out data/synth [--news 1000000] [--users 200000]
+                        [--comments 10000000] [--reactions 50000000]
+                        [--days 365] [--end 2025-01-01] [--seed 1] [--procs 8]
+    python -m app.synth --mongo [same options]     (writes to MONGO_URI)
+
+Generates Users, News_reserve, Comments and Reactions shaped like the
+app's own documents. Every value is a pure function of (seed, kind, row),
+so the output is identical whatever --procs is, and rows reference each
+other without lookups:
+
+* news are spread evenly over --days ending at --end (ObjectIds follow
+  created_date, as real inserts do); categories are weighted towards
+  world/politics/business, positivity leans upbeat (mean ≈ 60);
+* comments and reactions pick their article with a power law favouring
+  recent stories – the newest 10% of articles get roughly half the
+  traffic, and most articles get almost none; commenters are skewed the
+  same way (a few heavy users);
+* reaction types (1 happy, 2 neutral, 3 sad) follow the article's
+  positivity; comments land within hours of their article.
+
+Work is split into chunks of CHUNK rows run on --procs processes. With
+--out, each chunk becomes <kind>-<chunk>.jsonl.gz, ready for
+`python -m app.loader <kind> data/synth/<kind>-*.jsonl.gz`; with --mongo,
+chunks go straight in with unordered insert_many (re-running skips rows
+already there). All users share the password "synthetic".
+"""
+
+from __future__ import annotations
+import argparse, gzip, json, logging, os, struct, time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from bson import ObjectId
+
+from .services.ingest import ALLOWED_CATEGORIES
+
+KINDS = ("users", "news", "comments", "reactions")
+COLLECTIONS = {"users": "Users", "news": "News_reserve", "comments": "Comments", "reactions": "Reactions"}
+CHUNK = 50_000
+
+# share of each ALLOWED_CATEGORIES entry, in the same order
+_CATEGORY_CDF = np.cumsum([0.16, 0.14, 0.13, 0.11, 0.07, 0.08, 0.12, 0.09, 0.04, 0.06])
+POPULARITY_SKEW = 3.0  # P(newest fraction f of articles) = f ** (1 / skew)
+PASSWORD_HASH = "$2b$12$NooZ/QUZjYKOXocbHd1vseywPRhuwBhNhkkB5T/GxVg.vG.rrM/na"  # "synthetic"
+
+_WORDS = (
+    "council city community team researchers students volunteers local new record "
+    "season park school hospital garden festival project library river solar market "
+    "opens wins builds discovers launches restores celebrates raises funds plans "
+    "after years first major small growing historic annual regional national "
+    "support families children health climate energy water food music art"
+).split()
+# ~1 kB article bodies are assembled from a fixed pool of sentences
+_SENTENCES = [
+    " ".join(np.random.default_rng(i).choice(_WORDS, 8 + i % 11)).capitalize() + "."
+    for i in range(256)
+]
+_FIRST = "Amal Ben Chen Dana Elif Farah Gus Hana Ivan Jin Kofi Lena Musa Nia Omar Priya Quinn Rosa Sam Tariq".split()
+_LAST = "Ahmed Brown Costa Diaz Evans Fischer Garcia Haddad Ito Jones Kim Lopez Mensah Nguyen Okafor Patel Rossi Singh".split()
+
+
+class Scale(NamedTuple):
+    users: int
+    news: int
+    comments: int
+    reactions: int
+    days: int
+    end: datetime
+    seed: int = 1
+
+
+# ── deterministic randomness ───────────────────────────────
+_SALTS = {name: i + 1 for i, name in enumerate(
+    ("positivity", "category", "words", "pick", "user", "delay", "reaction", "length", "name")
+)}
+
+
+def _epoch(dt: datetime) -> int:
+    return int((dt - datetime(1970, 1, 1)).total_seconds())
+
+
+def _uniform(rows: np.ndarray, salt: str, seed: int) -> np.ndarray:
+    """splitmix64(row, salt, seed) → floats in [0, 1), vectorised."""
+    x = rows.astype(np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+    x ^= np.uint64((seed * 0x100000001B3 + _SALTS[salt] * 0xC2B2AE3D27D4EB4F) & 0xFFFFFFFFFFFFFFFF)
+    x ^= x >> np.uint64(30)
+    x *= np.uint64(0xBF58476D1CE4E5B9)
+    x ^= x >> np.uint64(27)
+    x *= np.uint64(0x94D049BB133111EB)
+    x ^= x >> np.uint64(31)
+    return (x >> np.uint64(11)).astype(np.float64) / float(1 << 53)
+
+
+def _oid(ts: int, row: int) -> ObjectId:
+    return ObjectId(struct.pack(">IQ", ts, row))
+
+
+def _news_ts(rows: np.ndarray, scale: Scale) -> np.ndarray:
+    """Creation time (epoch s) of news rows: evenly spread, oldest first."""
+    span = scale.days * 86400
+    start = _epoch(scale.end) - span
+    return start + (rows.astype(np.int64) * span) // max(1, scale.news)
+
+
+def positivity(rows: np.ndarray, seed: int) -> np.ndarray:
+    u = _uniform(rows, "positivity", seed)
+    return (1 + np.floor(99 * (1 - (1 - u) ** 1.6))).astype(np.int64)
+
+
+def category(rows: np.ndarray, seed: int) -> np.ndarray:
+    idx = np.searchsorted(_CATEGORY_CDF, _uniform(rows, "category", seed) * _CATEGORY_CDF[-1], side="right")
+    return np.minimum(idx, len(ALLOWED_CATEGORIES) - 1)
+
+
+def _popular(rows: np.ndarray, n: int, salt: str, seed: int) -> np.ndarray:
+    """Power-law pick in [0, n): index n-1 (newest / heaviest) is the likeliest."""
+    u = _uniform(rows, salt, seed)
+    return (n - 1 - np.floor(n * u ** POPULARITY_SKEW)).astype(np.int64).clip(0, n - 1)
+
+
+def _text(rows: np.ndarray, salt_offset: int, lo: int, hi: int, seed: int,
+          vocab: List[str] = _WORDS) -> List[str]:
+    """lo..hi items of `vocab` per row, space-joined."""
+    n = len(rows)
+    lengths = lo + np.floor(_uniform(rows + salt_offset, "length", seed) * (hi - lo + 1)).astype(np.int64)
+    picks = np.floor(
+        _uniform(np.repeat(rows, hi) * hi + np.tile(np.arange(hi), n) + salt_offset, "words", seed)
+        * len(vocab)
+    ).astype(np.int64).reshape(n, hi)
+    return [" ".join(vocab[w] for w in picks[i, :lengths[i]]) for i in range(n)]
+
+
+def _dt(ts: int) -> datetime:
+    return datetime.utcfromtimestamp(int(ts))
+
+
+# ── generators: one chunk of rows → documents ─────────────
+def gen_users(rows: np.ndarray, scale: Scale) -> Iterator[Dict[str, Any]]:
+    start = _epoch(scale.end) - scale.days * 86400
+    name = np.floor(_uniform(rows, "name", scale.seed) * len(_FIRST) * len(_LAST)).astype(np.int64)
+    for r, nm in zip(rows.tolist(), name.tolist()):
+        ts = start + (r * scale.days * 86400) // max(1, scale.users)
+        yield {
+            "_id": _oid(ts, r),
+            "first_name": _FIRST[nm % len(_FIRST)],
+            "last_name": _LAST[nm // len(_FIRST)],
+            "email": f"user{r}@synthetic.zenframe",
+            "password": PASSWORD_HASH,
+            "created_date": _dt(ts),
+        }
+
+
+def news_id(rows: np.ndarray, scale: Scale) -> List[str]:
+    return [str(_oid(ts, r)) for ts, r in zip(_news_ts(rows, scale).tolist(), rows.tolist())]
+
+
+def gen_news(rows: np.ndarray, scale: Scale) -> Iterator[Dict[str, Any]]:
+    ts = _news_ts(rows, scale)
+    pos, cat = positivity(rows, scale.seed), category(rows, scale.seed)
+    titles = _text(rows, 0, 6, 12, scale.seed)
+    bodies = _text(rows, 1 << 40, 6, 20, scale.seed, _SENTENCES)
+    lag = np.floor(_uniform(rows, "delay", scale.seed) * 7200).astype(np.int64)
+    for i, r in enumerate(rows.tolist()):
+        title = titles[i].capitalize()
+        yield {
+            "_id": _oid(int(ts[i]), r),
+            "headline": title,
+            "excerpt": bodies[i][:160],
+            "positivity": int(pos[i]),
+            "category": ALLOWED_CATEGORIES[cat[i]],
+            "full_body": bodies[i],
+            "source_url": f"https://synthetic.zenframe/news/{r}",
+            "orig_headline": title,
+            "published_at": _dt(ts[i] - lag[i]),
+            "created_date": _dt(ts[i]),
+        }
+
+
+def gen_comments(rows: np.ndarray, scale: Scale) -> Iterator[Dict[str, Any]]:
+    art = _popular(rows, scale.news, "pick", scale.seed)
+    user = _popular(rows, scale.users, "user", scale.seed)
+    end = _epoch(scale.end)
+    delay = -np.log1p(-_uniform(rows, "delay", scale.seed)) * 6 * 3600  # mean 6 h
+    ts = np.minimum(_news_ts(art, scale) + delay.astype(np.int64), end - 1)
+    user_ts = (end - scale.days * 86400) + (user * scale.days * 86400) // max(1, scale.users)
+    texts = _text(rows, 1 << 41, 3, 40, scale.seed)
+    ids = news_id(art, scale)
+    for i, r in enumerate(rows.tolist()):
+        yield {
+            "_id": _oid(int(ts[i]), r),
+            "user_id": str(_oid(int(user_ts[i]), int(user[i]))),
+            "news_id": ids[i],
+            "comment_content": texts[i].capitalize() + ".",
+            "created_date": _dt(ts[i]),
+        }
+
+
+def gen_reactions(rows: np.ndarray, scale: Scale) -> Iterator[Dict[str, Any]]:
+    art = _popular(rows, scale.news, "pick", scale.seed + 1)
+    p = positivity(art, scale.seed) / 100.0
+    u = _uniform(rows, "reaction", scale.seed)
+    kind = np.where(u < 0.1 + 0.7 * p, 1, np.where(u < 0.4 + 0.5 * p, 2, 3))  # happy / neutral / sad
+    ts = _news_ts(art, scale)
+    ids = news_id(art, scale)
+    for i, r in enumerate(rows.tolist()):
+        yield {"_id": _oid(int(ts[i]), r), "news_id": ids[i], "reaction_type": str(kind[i])}
+
+
+GENERATORS = {"users": gen_users, "news": gen_news, "comments": gen_comments, "reactions": gen_reactions}
+
+
+# ── sinks ──────────────────────────────────────────────────
+def _jsonl(doc: Dict[str, Any]) -> str:
+    out = {}
+    for k, v in doc.items():
+        if isinstance(v, ObjectId):
+            out[k] = {"$oid": str(v)}
+        elif isinstance(v, datetime):
+            out[k] = v.isoformat() + "Z"
+        else:
+            out[k] = v
+    return json.dumps(out, ensure_ascii=False)
+
+
+_DB = None
+
+
+def _mongo_db(uri: str):
+    """One client per worker process."""
+    global _DB
+    if _DB is None:
+        from pymongo import MongoClient
+
+        _DB = MongoClient(uri).get_default_database()
+    return _DB
+
+
+def _insert(col, docs: List[Dict[str, Any]]) -> int:
+    from pymongo.errors import BulkWriteError
+
+    try:
+        return len(col.insert_many(docs, ordered=False).inserted_ids)
+    except BulkWriteError as exc:  # re-run: rows already there are skipped
+        if any(e.get("code") != 11000 for e in exc.details.get("writeErrors", [])):
+            raise
+        return exc.details.get("nInserted", 0)
+
+
+def run_chunk(task: Tuple[str, int, Scale, Dict[str, Any]]) -> int:
+    """Generate chunk `chunk` of `kind` into the sink; returns rows written."""
+    kind, chunk, scale, sink = task
+    total = getattr(scale, kind)
+    rows = np.arange(chunk * CHUNK, min(total, (chunk + 1) * CHUNK), dtype=np.int64)
+    docs = GENERATORS[kind](rows, scale)
+
+    if "out" in sink:
+        path = os.path.join(sink["out"], f"{kind}-{chunk:05d}.jsonl.gz")
+        with gzip.open(path + ".part", "wt", encoding="utf-8", compresslevel=1) as fh:
+            for doc in docs:
+                fh.write(_jsonl(doc) + "\n")
+        os.replace(path + ".part", path)
+        return len(rows)
+
+    col = sink["db"][COLLECTIONS[kind]] if "db" in sink else _mongo_db(sink["uri"])[COLLECTIONS[kind]]
+    written, batch = 0, []
+    for doc in docs:
+        batch.append(doc)
+        if len(batch) >= sink.get("batch", 5000):
+            written += _insert(col, batch)
+            batch = []
+    if batch:
+        written += _insert(col, batch)
+    return written
+
+
+def generate(scale: Scale, sink: Dict[str, Any], procs: int = 1,
+             kinds: Tuple[str, ...] = KINDS) -> Dict[str, int]:
+    """
+    Run every chunk of every kind; procs <= 1 runs in-process.
+    `sink` is {"out": dir}, {"uri": mongo_uri} or {"db": database}.
+    """
+    if (scale.comments or scale.reactions) and not scale.news:
+        raise ValueError("comments and reactions need at least one news article")
+    if scale.comments and not scale.users:
+        raise ValueError("comments need at least one user")
+    if "out" in sink:
+        os.makedirs(sink["out"], exist_ok=True)
+    tasks = [
+        (kind, c, scale, sink)
+        for kind in kinds
+        for c in range(-(-getattr(scale, kind) // CHUNK))
+    ]
+    counts = {kind: 0 for kind in kinds}
+    start = time.monotonic()
+    if procs <= 1:
+        results = map(run_chunk, tasks)
+    else:
+        pool = ProcessPoolExecutor(procs)
+        results = pool.map(run_chunk, tasks)
+    try:
+        for (kind, chunk, _, _), n in zip(tasks, results):
+            counts[kind] += n
+            logging.info("%s chunk %d: %d rows (%.0f rows/s overall)", kind, chunk, n,
+                         sum(counts.values()) / max(time.monotonic() - start, 1e-9))
+    finally:
+        if procs > 1:
+            pool.shutdown()
+    return counts
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    where = parser.add_mutually_exclusive_group(required=True)
+    where.add_argument("--out", help="directory for <kind>-NNNNN.jsonl.gz files")
+    where.add_argument("--mongo", action="store_true", help="insert into MONGO_URI directly")
+    parser.add_argument("--users", type=int, default=200_000)
+    parser.add_argument("--news", type=int, default=1_000_000)
+    parser.add_argument("--comments", type=int, default=10_000_000)
+    parser.add_argument("--reactions", type=int, default=50_000_000)
+    parser.add_argument("--days", type=int, default=365, help="time range covered by the news")
+    parser.add_argument("--end", default=None, help="newest date, YYYY-MM-DD (default: today)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--procs", type=int, default=os.cpu_count())
+    parser.add_argument("--batch", type=int, default=5000, help="insert_many size with --mongo")
+    parser.add_argument("--only", nargs="+", choices=KINDS, default=list(KINDS))
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    end = datetime.strptime(args.end, "%Y-%m-%d") if args.end else \
+        datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    scale = Scale(args.users, args.news, args.comments, args.reactions, args.days, end, args.seed)
+    if args.mongo:
+        from .config import Config
+
+        sink: Dict[str, Any] = {"uri": Config.MONGO_URI, "batch": args.batch}
+    else:
+        sink = {"out": args.out}
+    start = time.monotonic()
+    counts = generate(scale, sink, args.procs, tuple(args.only))
+    logging.info("Generated %s in %.0fs", counts, time.monotonic() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Train the local positivity/category scorer on LLM-labelled News_reserve
+articles and report how well it agrees with the LLM.
+
+    python -m app.train_scorer [--holdout 0.2] [--limit N] [--probe 20] [--no-save]
+
+Trains on (1 - holdout) of the labelled articles and evaluates on the rest:
+category agreement, positivity MAE and, for each confidence threshold, the
+share of articles the LOCAL_SCORER_SHORTCUT would keep away from the LLM and
+how often those agree with it. LLM time per article is taken from the
+configured rate (LLM_RPS / LLM_WORKERS / LLM_BATCH_SIZE) or, with --probe N,
+measured on N held-out articles. The final model is re-fit on every labelled
+article and written to LOCAL_SCORER_PATH.
+"""
+
+from __future__ import annotations
+import argparse, logging, os, time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .extensions import mongo
+from .services import ingest
+from .services.scorer import MODEL_PATH, LocalScorer, text_of
+
+THRESHOLDS = (0.5, 0.7, 0.8, 0.9, 0.95)
+
+
+def _labelled(limit: Optional[int]) -> List[Dict[str, Any]]:
+    """Articles whose scores came from the LLM (not the fallback or this scorer)."""
+    cursor = mongo.db.News_reserve.find(
+        {"llm_model": {"$exists": True, "$not": {"$regex": "^local:"}},
+         "needs_reanalysis": {"$ne": True}},
+        {"orig_headline": 1, "full_body": 1, "positivity": 1, "category": 1},
+    )
+    if limit:
+        cursor = cursor.limit(limit)
+    return [d for d in cursor if d.get("category") and d.get("positivity") is not None]
+
+
+def _llm_seconds(holdout: List[Dict[str, Any]], probe: int) -> float:
+    """Wall-clock LLM seconds per article during ingest."""
+    if probe:
+        start = time.perf_counter()
+        for d in holdout[:probe]:
+            ingest._llm_analyse(d.get("orig_headline") or "", d.get("full_body") or "")
+        return (time.perf_counter() - start) / min(probe, len(holdout))
+    rps = float(os.getenv("LLM_RPS", 2))
+    workers = int(os.getenv("LLM_WORKERS", 4))
+    per_call = 1 / rps if rps > 0 else float(os.getenv("LLM_TIMEOUT", 30)) / workers
+    return per_call / max(1, int(os.getenv("LLM_BATCH_SIZE", 1)))
+
+
+def evaluate(
+    model: LocalScorer, docs: List[Dict[str, Any]], llm_seconds: float
+) -> Dict[str, Any]:
+    texts = [text_of(d.get("orig_headline") or "", d.get("full_body") or "") for d in docs]
+    start = time.perf_counter()
+    pos, cats, conf = model.predict(texts)
+    local_seconds = (time.perf_counter() - start) / max(1, len(docs))
+
+    agree = np.array([c == d["category"] for c, d in zip(cats, docs)])
+    err = np.abs(pos - np.array([int(d["positivity"]) for d in docs]))
+    per_cycle = int(os.getenv("NEWS_MAX_PAGES", 3)) * int(os.getenv("NEWS_PAGE_SIZE", 50))
+    report: Dict[str, Any] = {
+        "n": len(docs),
+        "category_agreement": float(agree.mean()) if len(docs) else 0.0,
+        "positivity_mae": float(err.mean()) if len(docs) else 0.0,
+        "positivity_within_10": float((err <= 10).mean()) if len(docs) else 0.0,
+        "local_ms_per_article": local_seconds * 1000,
+        "llm_ms_per_article": llm_seconds * 1000,
+        "articles_per_cycle": per_cycle,
+        "thresholds": [],
+    }
+    for t in THRESHOLDS:
+        mask = conf >= t
+        covered = float(mask.mean()) if len(docs) else 0.0
+        report["thresholds"].append({
+            "threshold": t,
+            "coverage": covered,
+            "category_agreement": float(agree[mask].mean()) if mask.any() else None,
+            "positivity_mae": float(err[mask].mean()) if mask.any() else None,
+            "seconds_saved_per_cycle": covered * per_cycle * max(0.0, llm_seconds - local_seconds),
+        })
+    return report
+
+
+def _fmt(v: Optional[float], pct: bool = True) -> str:
+    if v is None:
+        return "–"
+    return f"{v:.1%}" if pct else f"{v:.1f}"
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"Held-out articles:      {report['n']}")
+    print(f"Category agreement:     {_fmt(report['category_agreement'])}")
+    print(f"Positivity MAE:         {report['positivity_mae']:.1f} "
+          f"({_fmt(report['positivity_within_10'])} within ±10)")
+    print(f"Latency per article:    local {report['local_ms_per_article']:.2f} ms, "
+          f"LLM {report['llm_ms_per_article']:.0f} ms")
+    print(f"\nShortcut at {report['articles_per_cycle']} articles/cycle:")
+    print("  threshold  coverage  agreement  pos MAE  LLM s saved/cycle")
+    for row in report["thresholds"]:
+        print(f"  {row['threshold']:>9.2f}  {_fmt(row['coverage']):>8}  "
+              f"{_fmt(row['category_agreement']):>9}  {_fmt(row['positivity_mae'], False):>7}  "
+              f"{row['seconds_saved_per_cycle']:>17.1f}")
+
+
+def run(
+    holdout: float = 0.2,
+    limit: Optional[int] = None,
+    probe: int = 0,
+    save: bool = True,
+    path: str = MODEL_PATH,
+) -> Dict[str, Any]:
+    docs = _labelled(limit)
+    if len(docs) < 10:
+        raise RuntimeError(f"Only {len(docs)} LLM-labelled articles – need at least 10")
+
+    order = np.random.default_rng(0).permutation(len(docs))
+    cut = max(1, int(len(docs) * holdout))
+    test = [docs[i] for i in order[:cut]]
+    train = [docs[i] for i in order[cut:]]
+
+    def fit(rows):
+        return LocalScorer.train(
+            [text_of(d.get("orig_headline") or "", d.get("full_body") or "") for d in rows],
+            [d["category"] for d in rows],
+            [int(d["positivity"]) for d in rows],
+        )
+
+    start = time.perf_counter()
+    model = fit(train)
+    logging.info("Trained on %d articles in %.1fs", len(train), time.perf_counter() - start)
+
+    report = evaluate(model, test, _llm_seconds(test, probe))
+
+    if save:
+        final = fit(docs)
+        final.meta["holdout_agreement"] = report["category_agreement"]
+        final.save(path)
+        report["saved"] = path
+        logging.info("Saved %s to %s", final.tag, path)
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--holdout", type=float, default=0.2, help="share kept for evaluation")
+    parser.add_argument("--limit", type=int, default=None, help="use at most N articles")
+    parser.add_argument("--probe", type=int, default=0, help="time N real LLM calls")
+    parser.add_argument("--no-save", action="store_true", help="evaluate only")
+    parser.add_argument("--out", default=MODEL_PATH, help="model path")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    from . import create_app
+
+    app = create_app(start_scheduler=False)
+    with app.app_context():
+        print_report(run(args.holdout, args.limit, args.probe, not args.no_save, args.out))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,15 @@
 """
 Small helpers reused across blueprints.
 """
-from typing import Dict, List
+import base64
+import binascii
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
 from flask import abort
 from bson import ObjectId
+from bson.errors import InvalidId
+
+_EPOCH = datetime(1970, 1, 1)
 
 
 def obj_id(value: str) -> ObjectId:
@@ -19,3 +25,19 @@ def required(data: Dict, fields: List[str]):
     miss = [f for f in fields if f not in data]
     if miss:
         abort(400, description=f"Missing fields: {', '.join(miss)}")
+
+
+def encode_cursor(created: datetime, oid: ObjectId) -> str:
+    """Opaque feed continuation token for (created_date, _id)."""
+    ms = (created - _EPOCH) // timedelta(milliseconds=1)  # Mongo dates are ms-precise
+    return base64.urlsafe_b64encode(f"{ms}.{oid}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Tuple[datetime, ObjectId]:
+    """Inverse of encode_cursor; abort 400 on a malformed token."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        ms, oid = raw.split(".")
+        return _EPOCH + timedelta(milliseconds=int(ms)), ObjectId(oid)
+    except (ValueError, binascii.Error, InvalidId, UnicodeDecodeError):
+        abort(400, description="Invalid cursor")
@@ -0,0 +1,155 @@
+"""
+Standalone job worker: runs ingest / re-analysis jobs from the `Jobs` queue,
+so the web app (with INGEST_MODE=queue) only enqueues them.
+
+    python -m app.worker [--procs 2] [--poll 5] [--lease 300] [--once]
+                         [--metrics-port 9100]
+
+Starts --procs worker processes (each with its own app and Mongo client)
+and restarts any that die. A worker claims the highest-priority job, keeps
+its visibility lease alive while it runs, then acks it – or releases it
+with exponential backoff if the task raised. A job whose worker died
+becomes claimable again once its lease runs out. Run it on as many hosts as
+needed; the ingest lease still keeps ingest cycles from overlapping.
+SIGTERM/SIGINT let running jobs finish before exiting. With --metrics-port
+P, worker i serves its Prometheus metrics on port P + i.
+"""
+
+from __future__ import annotations
+import argparse, logging, multiprocessing, os, signal, socket, threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+from .services import metrics
+from .services.jobs import JOBS, run_job
+
+
+def work_one(worker_id: str, lease: float) -> bool:
+    """Claim and run one job; False if the queue was empty."""
+    job = JOBS.claim(lease, worker_id)
+    if not job:
+        return False
+
+    done = threading.Event()
+
+    def keepalive() -> None:
+        while not done.wait(lease / 3):
+            if not JOBS.touch(job, lease):
+                logging.warning("Job %s was re-claimed by another worker", job["_id"])
+                return
+
+    beat = threading.Thread(target=keepalive, name="job-keepalive", daemon=True)
+    beat.start()
+    start = time.monotonic()
+    try:
+        result = run_job(job)
+    except Exception as exc:
+        logging.exception("Job %s failed (attempt %d)", job["_id"], job["attempts"])
+        JOBS.release(job, delay=60 * 2 ** job["attempts"], error=repr(exc))
+    else:
+        JOBS.ack(job)
+        logging.info("Job %s done in %.1fs – %s", job["_id"], time.monotonic() - start, result)
+    finally:
+        done.set()
+        beat.join()
+    return True
+
+
+def _serve(poll: float, lease: float, once: bool = False) -> None:
+    """One worker process: its own app context, claim → run → ack until told to stop."""
+    stop = threading.Event()
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+        signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+    from . import create_app
+
+    app = create_app(start_scheduler=False)
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    with app.app_context():
+        JOBS.ensure_indexes()
+        logging.info("Worker %s polling %s", worker_id, JOBS.name)
+        while not stop.is_set():
+            if not work_one(worker_id, lease):
+                if once:
+                    return
+                stop.wait(poll)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        body = metrics.render().encode()
+        self.send_response(200 if self.path == "/metrics" else 404)
+        self.send_header("Content-Type", metrics.CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:  # scrapes are not worth a log line
+        pass
+
+
+def _serve_metrics(port: int) -> None:
+    server = ThreadingHTTPServer(("0.0.0.0", port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    logging.info("Metrics on :%d/metrics", port)
+
+
+def _child(poll: float, lease: float, metrics_port: Optional[int]) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(processName)s %(message)s")
+    if metrics_port:
+        _serve_metrics(metrics_port)
+    _serve(poll, lease)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--procs", type=int, default=int(os.getenv("WORKER_PROCS", 2)))
+    parser.add_argument("--poll", type=float, default=5, help="s between polls of an empty queue")
+    parser.add_argument(
+        "--lease", type=float, default=float(os.getenv("JOB_LEASE", 300)),
+        help="visibility timeout in s (renewed while a job runs)",
+    )
+    parser.add_argument("--once", action="store_true", help="run queued jobs in-process, then exit")
+    parser.add_argument("--metrics-port", type=int, default=None, help="first /metrics port")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(processName)s %(message)s")
+    if args.once:
+        _serve(args.poll, args.lease, once=True)
+        return
+
+    # spawn: children never inherit the parent's sockets or threads
+    ctx = multiprocessing.get_context("spawn")
+    stopping = threading.Event()
+
+    def start(i: int):
+        port = args.metrics_port + i if args.metrics_port else None
+        p = ctx.Process(target=_child, args=(args.poll, args.lease, port), name=f"worker-{i}")
+        p.start()
+        return p
+
+    def shutdown(*_) -> None:
+        stopping.set()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    procs = [start(i) for i in range(args.procs)]
+    while not stopping.wait(1):
+        for i, p in enumerate(procs):
+            if not p.is_alive():
+                logging.warning("%s exited with %s – restarting", p.name, p.exitcode)
+                procs[i] = start(i)
+
+    for p in procs:
+        if p.is_alive():
+            p.terminate()  # SIGTERM: finish the current job, then exit
+    for p in procs:
+        p.join(timeout=args.lease)
+        if p.is_alive():
+            p.kill()
+
+
+if __name__ == "__main__":
+    main()
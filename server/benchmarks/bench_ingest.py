@@ -0,0 +1,103 @@
+"""
+Offline ingest throughput benchmark against the local provider stand-ins.
+
+    python benchmarks/bench_ingest.py [--articles 300] [--page-size 50]
+        [--llm-latency 0.2] [--news-latency 0.05] [--error-rate 0]
+        [--workers 4] [--batch 1] [--llm-rps 0] [--cassette FILE] [--seed 1]
+        [--mongo mongodb://localhost:27017/bench]              (from server/)
+
+Starts app.stubs' NewsAPI and Together servers on free ports, points ingest
+at them, and runs one backfill cycle over every page. Storage is an
+in-memory mongomock database unless --mongo is given. Reports end-to-end
+cycle time, articles/s and the time spent in each pipeline stage (from the
+/metrics histograms). The stubs are seeded, so runs are reproducible.
+"""
+
+from __future__ import annotations
+import argparse, logging, os, sys, time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+def _mongomock_db():
+    import mongomock
+
+    # pymongo ≥ 4.11 passes `sort=` to bulk builders, which mongomock
+    # doesn't know about yet (same shim as tests/conftest.py).
+    builder = mongomock.collection.BulkOperationBuilder
+    for name in ("add_update", "add_replace"):
+        orig = getattr(builder, name)
+        setattr(builder, name, lambda self, *a, _orig=orig, sort=None, **kw: _orig(self, *a, **kw))
+    return mongomock.MongoClient().db
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--articles", type=int, default=300)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--news-latency", type=float, default=0.05)
+    parser.add_argument("--llm-latency", type=float, default=0.2)
+    parser.add_argument("--jitter", type=float, default=0.25)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--llm-rps", type=float, default=0, help="stub-side 429 limit")
+    parser.add_argument("--workers", type=int, default=4, help="LLM_WORKERS")
+    parser.add_argument("--batch", type=int, default=1, help="LLM_BATCH_SIZE")
+    parser.add_argument("--cassette", default=None)
+    parser.add_argument("--mongo", default=None, help="real Mongo URI instead of mongomock")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    from app import stubs
+    from app.extensions import mongo
+    from app.services import cassette, ingest, metrics
+
+    recorded = cassette.load(args.cassette) if args.cassette else {}
+    news = stubs.serve(stubs.NewsAPIStub(
+        stubs.make_articles(args.articles, args.seed),
+        stubs.Behaviour(args.news_latency, args.news_latency * args.jitter, args.error_rate, 0, args.seed),
+        recorded,
+    ))
+    llm_behaviour = stubs.Behaviour(
+        args.llm_latency, args.llm_latency * args.jitter, args.error_rate, args.llm_rps, args.seed + 1
+    )
+    llm = stubs.serve(stubs.TogetherStub(llm_behaviour, recorded))
+
+    pages = -(-args.articles // args.page_size)
+    os.environ.update({
+        "NEWS_API_URL": f"http://127.0.0.1:{news.server_port}/v1/news/all",
+        "TOGETHER_BASE_URL": f"http://127.0.0.1:{llm.server_port}/v1",
+        "TOGETHER_API_KEY": "stub",
+        "NEWS_PAGE_SIZE": str(args.page_size),
+        "NEWS_BACKFILL_PAGES": str(pages),
+        "NEWS_API_RPS": "0",
+        "LLM_RPS": "0",
+        "LLM_WORKERS": str(args.workers),
+        "LLM_BATCH_SIZE": str(args.batch),
+    })
+    if args.mongo:
+        from pymongo import MongoClient
+
+        mongo.db = MongoClient(args.mongo).get_default_database()
+    else:
+        mongo.db = _mongomock_db()
+
+    metrics.reset()
+    start = time.perf_counter()
+    inserted = ingest.ingest_once(backfill=True)
+    elapsed = time.perf_counter() - start
+
+    print(f"articles: {args.articles} in {pages} pages, {inserted} inserted")
+    print(f"cycle:    {elapsed:.2f}s  →  {args.articles / elapsed:.1f} articles/s")
+    print(f"LLM:      {llm_behaviour.stats}")
+    print("\nstage      pages   total s   mean s")
+    for stage in ("fetch", "clean", "analyse", "write"):
+        n = ingest.STAGE_SECONDS.count(stage=stage)
+        total = ingest.STAGE_SECONDS.total(stage=stage)
+        print(f"{stage:<9}{n:>6}{total:>10.2f}{(total / n if n else 0):>9.3f}")
+    outcomes = {s: ingest.ARTICLES.value(source=s) for s in ("llm", "cache", "local", "fallback", "duplicate")}
+    print(f"\noutcomes: {outcomes}")
+
+
+if __name__ == "__main__":
+    main()
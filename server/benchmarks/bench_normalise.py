@@ -0,0 +1,104 @@
+"""
+Micro-benchmark: services/normalise.normalise vs the old ingest._clean.
+
+    python benchmarks/bench_normalise.py [--repeat 5]      (from server/)
+
+Payloads mimic what ingest joins per article (content + description +
+snippet): a plain API snippet, and article HTML of ~5 KB, ~50 KB and
+~250 KB with paragraphs, links, entities, inline <script>/<style> and
+comments. Reports the best-of-N time per call and the output size, and
+checks both implementations agree on script-free input.
+"""
+
+from __future__ import annotations
+import argparse, html, os, random, re, sys, timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("TOGETHER_API_KEY", "bench")  # app import builds the client
+
+from app.services.normalise import normalise  # noqa: E402
+
+
+def legacy_clean(text):
+    """ingest._clean before the normaliser (unescape → strip tags → squash)."""
+    if not text:
+        return ""
+    text = re.sub(r"<[^>]+>", "", html.unescape(text))
+    return re.sub(r"\s+", " ", text).strip()
+
+
+_WORDS = (
+    "the city council approved new funding for the local library after "
+    "residents rallied in support of longer opening hours and more programs"
+).split()
+
+
+def _paragraph(rng: random.Random) -> str:
+    words = rng.choices(_WORDS, k=rng.randint(40, 90))
+    words[rng.randrange(len(words))] = '<a href="https://example.com/x?a=1&amp;b=2">link</a>'
+    words[rng.randrange(len(words))] = "AT&amp;T&nbsp;&#8212;&quot;quoted&quot;"
+    return "<p>" + " ".join(words) + "</p>\n"
+
+
+def article(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    parts = [
+        "<style>.ad{display:none}</style>",
+        "<script>window.dataLayer=[];function t(){return '<p>tracking</p>'}</script>",
+        "<!-- story body -->",
+    ]
+    n = sum(map(len, parts))
+    while n < size:
+        p = _paragraph(rng)
+        parts.append(p)
+        n += len(p)
+        if rng.random() < 0.1:
+            parts.append("<script>ads.push({slot: 'mid'});</script>")
+    return "".join(parts)
+
+
+PAYLOADS = {
+    "api snippet (~0.6 KB)": (
+        "Residents rallied &amp; the council approved new funding… "
+        + " ".join(_WORDS * 4)
+    ),
+    "article ~5 KB": article(5_000),
+    "article ~50 KB": article(50_000),
+    "article ~250 KB": article(250_000),
+}
+
+
+def best(fn, payload, repeat: int) -> float:
+    t = timeit.Timer(lambda: fn(payload))
+    loops, _ = t.autorange()
+    return min(t.repeat(repeat, loops)) / loops
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=int, default=1500, help="max_chars for the capped run")
+    args = parser.parse_args(argv)
+
+    cases = [
+        ("legacy _clean", legacy_clean),
+        ("normalise", normalise),
+        (f"normalise ≤{args.budget} chars", lambda s: normalise(s, max_chars=args.budget)),
+    ]
+    print(f"{'payload':<24}{'implementation':<26}{'µs/call':>12}{'out chars':>11}")
+    for name, payload in PAYLOADS.items():
+        base = None
+        for label, fn in cases:
+            secs = best(fn, payload, args.repeat)
+            base = base or secs
+            print(f"{name:<24}{label:<26}{secs * 1e6:>12.1f}{len(fn(payload)):>11}"
+                  f"{'' if secs is base else f'  ×{base / secs:.1f}'}")
+        print()
+
+    plain = re.sub(r"<(script|style)\b.*?</\1>", "", PAYLOADS["article ~5 KB"], flags=re.S)
+    plain = plain.replace("<!-- story body -->", "").replace("</p>\n<p>", " ")
+    assert normalise(plain) == legacy_clean(plain), "implementations disagree on plain HTML"
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,12 @@
 import os
 import sys
+
+# before app.config is imported: no index builds against a real server, and
+# every feed request reaches list_news
+os.environ.setdefault("ENSURE_INDEXES", "False")
+os.environ.setdefault("FEED_CACHE_ENABLED", "False")
+
+import mongomock
 import pytest
 from pymongo import MongoClient
 from unittest.mock import patch
@@ -39,4 +46,19 @@ def mongodb():
     db = client.test_db
     yield db
     client.drop_database('test_db')
-    client.close() 
\ No newline at end of file
+    client.close()
+
+
+@pytest.fixture
+def mock_mongo(monkeypatch):
+    """In-memory mongomock database (for tests that need real query semantics)."""
+    # pymongo ≥ 4.11 passes `sort=` to bulk builders, which mongomock
+    # doesn't know about yet.
+    builder = mongomock.collection.BulkOperationBuilder
+    for name in ("add_update", "add_replace"):
+        orig = getattr(builder, name)
+        monkeypatch.setattr(
+            builder, name,
+            lambda self, *a, _orig=orig, sort=None, **kw: _orig(self, *a, **kw),
+        )
+    return mongomock.MongoClient().db
@@ -0,0 +1,75 @@
+"""
+Tests for indexes.py (index bootstrap and COLLSCAN check)
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pymongo.errors import OperationFailure
+
+from app import indexes
+
+
+@pytest.fixture
+def db(mock_mongo, monkeypatch):
+    monkeypatch.setattr(indexes.mongo, "db", mock_mongo)
+    return mock_mongo
+
+
+def _plan(*stages):
+    """Nested classic-explain plan: stages[0] on top."""
+    plan = {}
+    for stage in reversed(stages):
+        plan = {"stage": stage, "inputStage": plan} if plan else {"stage": stage}
+    return {"queryPlanner": {"winningPlan": plan}}
+
+
+def test_builds_declared_indexes_idempotently(db):
+    assert indexes.ensure_indexes() == {}
+    assert indexes.ensure_indexes() == {}
+
+    news = db.News_reserve.index_information()
+    assert news["source_url"]["unique"] is True
+    assert list(news["category_feed"]["key"]) == [("category", 1), ("created_date", -1), ("_id", -1), ("positivity", 1)]
+    assert db.Users.index_information()["email"]["unique"] is True
+    assert "news_comments" in db.Comments.index_information()
+    assert "news_reactions" in db.Reactions.index_information()
+
+
+def test_a_conflicting_index_is_reported_not_fatal(db, monkeypatch):
+    """One index that cannot be built does not stop the others."""
+    real = db.News_reserve.create_indexes
+
+    def create(models):
+        if models[0].document["name"] == "source_url":
+            raise OperationFailure("Index already exists with different options", code=85)
+        return real(models)
+
+    monkeypatch.setattr(db.News_reserve, "create_indexes", create)
+    assert indexes.build("News_reserve") == ["source_url"]
+    assert "feed" in db.News_reserve.index_information()
+
+
+def test_check_flags_collection_scans(monkeypatch):
+    """Any COLLSCAN in a winning plan (however deep) fails the check."""
+    plans = {
+        "News_reserve": _plan("LIMIT", "FETCH", "IXSCAN"),
+        "Comments": _plan("SORT", "COLLSCAN"),
+        "Reactions": {"queryPlanner": {"winningPlan": {"queryPlan": {"stage": "COUNT_SCAN"}}}},
+        "Users": _plan("EOF"),
+    }
+    fake = MagicMock()
+    fake.__getitem__.side_effect = lambda name: MagicMock(**{
+        "find.return_value.limit.return_value.explain.return_value": plans[name],
+        "find.return_value.limit.return_value.sort.return_value.explain.return_value": plans[name],
+    })
+    monkeypatch.setattr(indexes.mongo, "db", fake)
+    assert indexes.check() == ["list_comments"]
+
+
+def test_create_app_builds_in_background_when_enabled():
+    from app import create_app
+
+    with patch("app.ensure_in_background") as bootstrap, \
+         patch("app.config.Config.ENSURE_INDEXES", True):
+        create_app(start_scheduler=False)
+    bootstrap.assert_called_once()
@@ -0,0 +1,425 @@
+"""
+Tests for services/ingest.py
+"""
+import time
+import pytest
+from datetime import datetime
+from unittest.mock import patch, MagicMock
+
+from pymongo.errors import BulkWriteError
+
+from app.services import ingest, fingerprint, metrics
+from app.services.circuit import CircuitBreaker, CLOSED, OPEN, HALF_OPEN
+from app.services.lease import LeaseLost
+from app.services.throttle import RateLimiter
+
+
+@pytest.fixture(autouse=True)
+def fresh_breaker(monkeypatch):
+    """Every test starts with a closed circuit."""
+    breaker = CircuitBreaker("test", failure_threshold=5, reset_timeout=60)
+    monkeypatch.setattr(ingest, "LLM_BREAKER", breaker)
+    return breaker
+
+
+def _article(i, published_at=None):
+    return {
+        "url": f"https://example.com/{i}",
+        "title": f"Title {i}",
+        "description": f"<p>Body {i}</p>",
+        "published_at": published_at,
+    }
+
+
+def _fake_analyse(title, body):
+    time.sleep(0.01)
+    return f"New {title}", body, 70, "tech"
+
+
+# ---- Analysis stage ----
+class TestAnalyseMany:
+    def test_results_keep_input_order(self):
+        """Concurrent analysis returns results in article order."""
+        items = [{"title": f"T{i}", "body": f"B{i}"} for i in range(20)]
+        with patch("app.services.ingest._llm_analyse", side_effect=_fake_analyse):
+            results = ingest._analyse_many(items, workers=8, limiter=RateLimiter(0))
+        assert [r[0] for r in results] == [f"New T{i}" for i in range(20)]
+
+    def test_none_after_retries(self):
+        """Three failed attempts leave the article unanalysed."""
+        items = [{"title": "T", "body": "B"}]
+        with patch("app.services.ingest._llm_analyse", side_effect=ValueError("boom")) as llm, \
+             patch("app.services.ingest.time.sleep"):
+            results = ingest._analyse_many(items, workers=2, limiter=RateLimiter(0))
+        assert llm.call_count == 3
+        assert results == [None]
+
+
+# ---- Batched prompts ----
+class TestBatchedAnalysis:
+    def test_batch_reply_parsed_by_index(self):
+        """A JSON array reply is matched back to articles by index."""
+        items = [{"title": "A", "body": "a"}, {"title": "B", "body": "b"}]
+        reply = (
+            '[{"index": 1, "rewritten_headline": "hB", "summary": "sB", "positivity": 80, "category": "tech"},'
+            ' {"index": 0, "rewritten_headline": "hA", "summary": "sA", "positivity": 500, "category": "weird"}]'
+        )
+        with patch("app.services.ingest._complete", return_value=reply):
+            results = ingest._llm_analyse_batch(items)
+        assert results == [("hA", "sA", 100, "other"), ("hB", "sB", 80, "tech")]
+
+    def test_missing_entries_fall_back_to_single_calls(self):
+        """Articles absent from the batch reply are analysed one by one."""
+        items = [{"title": f"T{i}", "body": f"B{i}"} for i in range(3)]
+        reply = '[{"index": 0, "rewritten_headline": "h0", "summary": "s0", "positivity": 60, "category": "tech"}]'
+        with patch("app.services.ingest._complete", return_value=reply) as complete, \
+             patch("app.services.ingest._llm_analyse", side_effect=_fake_analyse) as single:
+            results = ingest._analyse_many(items, workers=2, limiter=RateLimiter(0), batch_size=3)
+        assert complete.call_count == 1
+        assert single.call_count == 2
+        assert [r[0] for r in results] == ["h0", "New T1", "New T2"]
+
+    def test_unparseable_batch_falls_back_entirely(self):
+        """A non-array reply sends the whole batch down the single path."""
+        items = [{"title": f"T{i}", "body": f"B{i}"} for i in range(2)]
+        with patch("app.services.ingest._complete", return_value="not json"), \
+             patch("app.services.ingest._llm_analyse", side_effect=_fake_analyse) as single:
+            results = ingest._analyse_many(items, workers=1, limiter=RateLimiter(0), batch_size=2)
+        assert single.call_count == 2
+        assert [r[0] for r in results] == ["New T0", "New T1"]
+
+
+# ---- Circuit breaker ----
+class TestCircuitBreaker:
+    def test_opens_after_threshold_and_probes_after_reset(self):
+        """Consecutive failures open it; one half-open probe decides."""
+        breaker = CircuitBreaker("t", failure_threshold=2, reset_timeout=0.05)
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == OPEN and not breaker.allow()
+
+        time.sleep(0.06)
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow()          # the probe
+        assert not breaker.allow()      # only one at a time
+        breaker.record_failure()
+        assert breaker.state == OPEN
+
+        time.sleep(0.06)
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CLOSED and breaker.allow()
+
+    def test_open_circuit_skips_llm_and_sleeps(self, fresh_breaker):
+        """Once open, articles go straight to the fallback path."""
+        items = [{"title": f"T{i}", "body": "B"} for i in range(10)]
+        with patch("app.services.ingest._llm_analyse", side_effect=ConnectionError("down")) as llm, \
+             patch("app.services.ingest.time.sleep") as sleep:
+            results = ingest._analyse_many(items, workers=1, limiter=RateLimiter(0))
+        assert results == [None] * 10
+        assert llm.call_count == 5
+        assert fresh_breaker.state == OPEN
+        assert sleep.call_count < 5
+
+    def test_bad_json_does_not_trip_breaker(self, fresh_breaker):
+        """Malformed replies mean the provider is up; only outages count."""
+        items = [{"title": f"T{i}", "body": "B"} for i in range(4)]
+        with patch("app.services.ingest._complete", return_value="not json"), \
+             patch("app.services.ingest.time.sleep"):
+            ingest._analyse_many(items, workers=1, limiter=RateLimiter(0))
+        assert fresh_breaker.state == CLOSED
+
+
+# ---- Rate limiter ----
+def test_rate_limiter_spaces_calls():
+    """A 20 rps limiter needs ~0.1 s for three back-to-back tokens."""
+    limiter = RateLimiter(20)
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.09
+
+
+# ---- Full cycle ----
+WATERMARK = datetime(2024, 5, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def checkpoint():
+    """Checkpoint module mocked with an existing watermark (incremental mode)."""
+    with patch("app.services.ingest.checkpoint") as cp:
+        cp.load.return_value = {"_id": "newsapi", "last_published_at": WATERMARK, "last_url": "old"}
+        yield cp
+
+
+@pytest.fixture
+def news_get(monkeypatch):
+    """NewsAPIClient.fetch mock; set .pages to the list of article lists to serve."""
+    monkeypatch.setenv("NEWS_API_RPS", "0")
+    get = MagicMock()
+    get.pages = []
+
+    def serve(params):
+        page = params["page"]
+        return {"data": get.pages[page - 1] if page <= len(get.pages) else []}
+
+    get.side_effect = serve
+    client = MagicMock(fetch=get, last_timing=None)
+    with patch("app.services.ingest._news_client", return_value=client):
+        yield get
+
+
+@pytest.fixture
+def mongo_db():
+    with patch("app.services.ingest.mongo") as mongo, \
+         patch("app.services.analysis_cache.mongo", mongo), \
+         patch("app.services.workqueue.mongo", mongo), \
+         patch("app.services.fingerprint.mongo", mongo), \
+         patch("app.services.ingest.time.sleep"):
+        mongo.db.Analysis_cache.find.return_value = []
+        mongo.db.News_fingerprints.find.return_value = []
+        yield mongo.db
+
+
+@pytest.fixture
+def one_page(monkeypatch, checkpoint, news_get, mongo_db):
+    """NewsAPI returning a single page of five articles, Mongo mocked."""
+    monkeypatch.setenv("NEWS_MAX_PAGES", "1")
+    monkeypatch.setenv("LLM_RPS", "0")
+    news_get.pages = [[_article(i) for i in range(5)]]
+    yield mongo_db
+
+
+def _updates(collection):
+    """(filter, update) of every op sent through bulk_write."""
+    return [
+        (op._filter, op._doc)
+        for c in collection.bulk_write.call_args_list
+        for op in c.args[0]
+    ]
+
+
+def test_ingest_once_upserts_every_article(one_page):
+    """Each article is analysed and upserted on its source_url."""
+    with patch("app.services.ingest._llm_analyse", side_effect=_fake_analyse):
+        ingest.ingest_once()
+
+    updates = _updates(one_page.News_reserve)
+    assert [f["source_url"] for f, _ in updates] == [f"https://example.com/{i}" for i in range(5)]
+    doc = updates[0][1]
+    assert doc["$set"]["headline"] == "New Title 0"
+    assert doc["$set"]["full_body"] == "Body 0"
+    assert "created_date" in doc["$setOnInsert"]
+    stored = one_page.Analysis_cache.bulk_write.call_args.args[0]
+    assert len(stored) == 5
+
+
+def test_cached_articles_skip_llm(one_page):
+    """Articles already in the analysis cache never reach the LLM."""
+    key = ingest.analysis_cache.cache_key(ingest.LLM_MODEL, ingest.PROMPT_VERSION, "Title 0", "Body 0")
+    one_page.Analysis_cache.find.return_value = [
+        {"_id": key, "headline": "Cached", "excerpt": "s", "positivity": 90, "category": "world"}
+    ]
+    with patch("app.services.ingest._llm_analyse", side_effect=_fake_analyse) as llm:
+        ingest.ingest_once()
+
+    assert llm.call_count == 4
+    assert _updates(one_page.News_reserve)[0][1]["$set"]["headline"] == "Cached"
+
+
+def test_fallback_results_are_not_cached_but_queued(one_page):
+    """A failed LLM call is stored with the fallback, flagged and queued, never cached."""
+    with patch("app.services.ingest._llm_analyse", side_effect=ValueError("down")):
+        ingest.ingest_once()
+
+    doc = _updates(one_page.News_reserve)[0][1]["$set"]
+    assert (doc["positivity"], doc["category"]) == (50, "other")
+    assert doc["needs_reanalysis"] is True
+    one_page.Analysis_cache.bulk_write.assert_not_called()
+    queued = one_page["Reanalysis_queue"].bulk_write.call_args.args[0]
+    assert [op._filter["_id"] for op in queued] == [f"https://example.com/{i}" for i in range(5)]
+
+
+def test_cycle_records_stage_metrics(one_page):
+    """Every stage, the article outcome mix and the cycle itself are measured."""
+    metrics.reset()
+    def flaky(title, body):  # the first article falls back after 3 attempts
+        if title == "Title 0":
+            raise ValueError("down")
+        return _fake_analyse(title, body)
+
+    with patch("app.services.ingest._llm_analyse", side_effect=flaky):
+        ingest.ingest_once()
+
+    for stage in ("fetch", "clean", "analyse", "write"):
+        assert ingest.STAGE_SECONDS.count(stage=stage) == 1
+    assert ingest.ARTICLES.value(source="llm") == 4
+    assert ingest.ARTICLES.value(source="fallback") == 1
+    assert ingest.LLM_RETRIES.value() == 2
+    assert ingest.WRITE_SECONDS.count() == 1
+    assert ingest.CYCLE_SECONDS.count(mode="incremental") == 1
+
+
+def test_writes_flushed_in_configured_batches(one_page, monkeypatch):
+    """INGEST_WRITE_BATCH splits a page into several unordered bulk writes."""
+    monkeypatch.setenv("INGEST_WRITE_BATCH", "2")
+    with patch("app.services.ingest._llm_analyse", side_effect=_fake_analyse):
+        ingest.ingest_once()
+
+    calls = one_page.News_reserve.bulk_write.call_args_list
+    assert [len(c.args[0]) for c in calls] == [2, 2, 1]
+    assert all(c.kwargs["ordered"] is False for c in calls)
+
+
+def test_duplicate_key_errors_are_counted_not_raised(one_page):
+    """Per-item duplicate errors come from the BulkWriteError details."""
+    one_page.News_reserve.bulk_write.side_effect = BulkWriteError(
+        {"writeErrors": [{"index": 1, "code": 11000}], "nUpserted": 4, "nModified": 0}
+    )
+    with patch("app.services.ingest._llm_analyse", side_effect=_fake_analyse):
+        assert ingest.ingest_once() == 4
+
+
+def test_other_write_errors_propagate(one_page):
+    """Anything other than a duplicate key still aborts the cycle."""
+    one_page.News_reserve.bulk_write.side_effect = BulkWriteError(
+        {"writeErrors": [{"index": 0, "code": 121}], "nUpserted": 0}
+    )
+    with patch("app.services.ingest._llm_analyse", side_effect=_fake_analyse):
+        with pytest.raises(BulkWriteError):
+            ingest.ingest_once()
+
+
+# ---- Incremental checkpoint ----
+class TestCheckpoint:
+    @pytest.fixture(autouse=True)
+    def _env(self, monkeypatch):
+        monkeypatch.setenv("NEWS_PAGE_SIZE", "2")
+        monkeypatch.setenv("NEWS_MAX_PAGES", "5")
+        monkeypatch.setenv("LLM_RPS", "0")
+
+    def test_incremental_stops_at_seen_articles(self, checkpoint, news_get, mongo_db):
+        """Paging stops once articles older than the watermark come back."""
+        news_get.pages = [
+            [_article(1, "2024-05-01T15:00:00Z"), _article(2, "2024-05-01T14:00:00Z")],
+            [_article(3, "2024-05-01T13:00:00Z"), _article(4, "2024-05-01T11:00:00Z")],
+            [_article(5, "2024-05-01T10:00:00Z"), _article(6, "2024-05-01T09:00:00Z")],
+        ]
+        with patch("app.services.ingest._llm_analyse", side_effect=_fake_analyse):
+            ingest.ingest_once()
+
+        assert news_get.call_count == 2
+        assert news_get.call_args.args[0]["published_after"] == "2024-05-01T12:00:00"
+        urls = [f["source_url"] for f, _ in _updates(mongo_db.News_reserve)]
+        assert urls == [f"https://example.com/{i}" for i in (1, 2, 3)]
+        checkpoint.save_watermark.assert_called_once_with(
+            datetime(2024, 5, 1, 15, 0, 0), "https://example.com/1"
+        )
+
+    def test_lost_lease_stops_writes(self, checkpoint, news_get, mongo_db):
+        """A holder that lost the lease writes nothing and leaves the watermark alone."""
+        news_get.pages = [[_article(1, "2024-05-01T15:00:00Z")]]
+        lease = MagicMock(token=7)
+        lease.check.side_effect = LeaseLost("gone")
+        with patch("app.services.ingest._llm_analyse", side_effect=_fake_analyse):
+            with pytest.raises(LeaseLost):
+                ingest.ingest_once(lease=lease)
+
+        mongo_db.News_reserve.bulk_write.assert_not_called()
+        checkpoint.save_watermark.assert_not_called()
+
+    def test_failed_fetch_does_not_advance_watermark(self, checkpoint, news_get, mongo_db):
+        """A gap left by a NewsAPI error is re-fetched next cycle."""
+        news_get.pages = [[_article(1, "2024-05-01T15:00:00Z"), _article(2, "2024-05-01T14:00:00Z")]]
+        serve = news_get.side_effect
+
+        def flaky(params):
+            if params["page"] > 1:
+                raise IOError("503")
+            return serve(params)
+
+        news_get.side_effect = flaky
+        with patch("app.services.ingest._llm_analyse", side_effect=_fake_analyse):
+            ingest.ingest_once()
+
+        assert len(_updates(mongo_db.News_reserve)) == 2
+        checkpoint.save_watermark.assert_not_called()
+
+    def test_cold_start_runs_resumable_backfill(self, checkpoint, news_get, mongo_db, monkeypatch):
+        """Without a watermark, ingest backfills and records each finished page."""
+        monkeypatch.setenv("NEWS_BACKFILL_PAGES", "10")
+        anchor = datetime(2024, 6, 1)
+        checkpoint.load.return_value = {
+            "_id": "newsapi",
+            "backfill": {"before": anchor, "next_page": 2},
+        }
+        news_get.pages = [
+            None,
+            [_article(3, "2024-05-01T13:00:00Z"), _article(4, "2024-05-01T11:00:00Z")],
+            [_article(5, "2024-05-01T10:00:00Z")],
+        ]
+        with patch("app.services.ingest._llm_analyse", side_effect=_fake_analyse):
+            ingest.ingest_once()
+
+        pages = [c.args[0]["page"] for c in news_get.call_args_list]
+        assert pages == [2, 3]
+        assert news_get.call_args.args[0]["published_before"] == "2024-06-01T00:00:00"
+        assert [c.args[0] for c in checkpoint.save_backfill_page.call_args_list] == [2, 3]
+        checkpoint.finish_backfill.assert_called_once()
+        checkpoint.start_backfill.assert_not_called()
+
+
+# ---- Near-duplicate detection ----
+WIRE = (
+    "The city council approved a new plan on Tuesday to expand the public "
+    "library network with twelve new branches, extended weekend hours and a "
+    "free digital lending service for every resident over the next three years."
+)
+
+
+class TestNearDuplicates:
+    def test_simhash_distance(self):
+        """Small edits stay within the threshold; unrelated text does not."""
+        edited = WIRE.replace("Tuesday", "Wednesday")
+        other = "Scientists discovered a new species of frog in the rainforest canopy last spring."
+        assert fingerprint.distance(fingerprint.simhash(WIRE), fingerprint.simhash(WIRE)) == 0
+        assert fingerprint.distance(fingerprint.simhash(WIRE), fingerprint.simhash(edited)) <= 12
+        assert fingerprint.distance(fingerprint.simhash(WIRE), fingerprint.simhash(other)) > 12
+
+    def test_band_match_guaranteed_within_three_bits(self):
+        """Hashes ≤ 3 bits apart always share a band."""
+        h = fingerprint.simhash(WIRE)
+        near = h ^ (1 << 3) ^ (1 << 20) ^ (1 << 40)
+        assert set(fingerprint.bands(h)) & set(fingerprint.bands(near))
+
+    def test_syndicated_copy_is_linked_not_analysed(self, one_page, news_get):
+        """A second URL with the same body reuses the first article."""
+        a = dict(_article(1), description=WIRE)
+        b = dict(_article(2), description=WIRE)
+        news_get.pages = [[a, b, _article(3)]]
+        with patch("app.services.ingest._llm_analyse", side_effect=_fake_analyse) as llm:
+            ingest.ingest_once()
+
+        assert llm.call_count == 2
+        upserts = [f["source_url"] for f, u in _updates(one_page.News_reserve) if "$set" in u]
+        assert upserts == ["https://example.com/1", "https://example.com/3"]
+        links = [(f, u) for f, u in _updates(one_page.News_reserve) if "$addToSet" in u]
+        assert links == [({"source_url": "https://example.com/1"}, {"$addToSet": {"alt_urls": "https://example.com/2"}})]
+
+    def test_known_fingerprint_matches_across_cycles(self, one_page, news_get):
+        """A copy of an article stored in an earlier cycle is caught via Mongo."""
+        h = fingerprint.simhash(WIRE)
+        one_page.News_fingerprints.find.return_value = [{
+            "_id": "https://wire.com/original",
+            "simhash": fingerprint._to_int64(h),
+            "bands": fingerprint.bands(h),
+            "canonical_url": "https://wire.com/original",
+        }]
+        news_get.pages = [[dict(_article(1), description=WIRE)]]
+        with patch("app.services.ingest._llm_analyse", side_effect=_fake_analyse) as llm:
+            ingest.ingest_once()
+
+        llm.assert_not_called()
+        stored = one_page.News_fingerprints.bulk_write.call_args.args[0]
+        assert stored[0]._doc["$set"]["canonical_url"] == "https://wire.com/original"
@@ -0,0 +1,100 @@
+"""
+Tests for the ingest lease (services/lease.py) and checkpoint fencing (mongomock-backed)
+"""
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app import scheduler
+from app.services import jobs
+from app.services import checkpoint
+from app.services.lease import Lease, LeaseLost
+
+
+@pytest.fixture
+def db(monkeypatch, mock_mongo):
+    fake = MagicMock(db=mock_mongo)
+    for target in ("app.services.lease.mongo", "app.services.checkpoint.mongo"):
+        monkeypatch.setattr(target, fake)
+    return mock_mongo
+
+
+def _die(lease):
+    """Simulate a crashed holder: the heartbeat stops, nothing is released."""
+    lease._stop.set()
+    lease._thread.join()
+
+
+def test_only_one_holder(db):
+    a, b = Lease("job", ttl=30), Lease("job", ttl=30)
+    assert a.acquire()
+    try:
+        assert not b.acquire()
+        assert a.held and a.token == 1
+        assert db.Leases.find_one({"_id": "job"})["holder"] == a.holder
+    finally:
+        a.release()
+
+
+def test_release_hands_over_with_a_new_token(db):
+    a, b = Lease("job", ttl=30), Lease("job", ttl=30)
+    assert a.acquire()
+    a.release()
+    assert b.acquire() and b.token == 2
+    b.release()
+
+
+def test_failover_after_holder_dies(db):
+    a, b = Lease("job", ttl=0.3), Lease("job", ttl=0.3)
+    assert a.acquire()
+    _die(a)
+    assert not b.acquire()          # still within the TTL
+    time.sleep(0.35)
+    assert b.acquire() and b.token == 2
+    try:
+        with pytest.raises(LeaseLost):
+            a.check()               # own deadline passed
+        assert not a.renew()        # …and the lease now belongs to b
+    finally:
+        b.release()
+
+
+def test_heartbeat_keeps_lease_alive(db):
+    a, b = Lease("job", ttl=0.3), Lease("job", ttl=0.3)
+    assert a.acquire()
+    try:
+        time.sleep(0.5)
+        a.check()
+        assert not b.acquire()
+    finally:
+        a.release()
+
+
+def test_checkpoint_refuses_superseded_token(db):
+    checkpoint.start_backfill(checkpoint.datetime(2024, 1, 1), fence=2)
+    checkpoint.save_backfill_page(1, None, None, fence=2)
+    with pytest.raises(LeaseLost):
+        checkpoint.save_backfill_page(5, None, None, fence=1)
+    assert checkpoint.load()["backfill"]["next_page"] == 2
+
+
+def test_fetch_news_skips_without_lease(db, monkeypatch):
+    monkeypatch.setattr(jobs, "INGEST_LEASE", Lease("news_ingest", ttl=30))
+    other = Lease("news_ingest", ttl=30)
+    assert other.acquire()
+    try:
+        with patch("app.services.jobs.ingest_once") as ingest:
+            scheduler.fetch_news()
+        ingest.assert_not_called()
+    finally:
+        other.release()
+
+    tokens = []
+    with patch(
+        "app.services.jobs.ingest_once",
+        side_effect=lambda backfill, lease: tokens.append(lease.token) or 0,
+    ):
+        scheduler.fetch_news()
+    assert tokens == [2]
+    assert not jobs.INGEST_LEASE.held
@@ -0,0 +1,90 @@
+"""
+Tests for loader.py (bulk JSONL loads)
+"""
+import gzip
+import json
+from datetime import datetime
+
+import pytest
+
+from app import loader
+
+
+@pytest.fixture
+def db(mock_mongo, monkeypatch):
+    monkeypatch.setattr(loader.mongo, "db", mock_mongo)
+    monkeypatch.setattr(loader, "_hash", lambda args: f"$2b$hashed:{args[0]}")
+    return mock_mongo
+
+
+def _jsonl(path, rows, gz=False):
+    opener = gzip.open if gz else open
+    with opener(path, "wt", encoding="utf-8") as fh:
+        for row in rows:
+            fh.write(json.dumps(row) + "\n\n")
+    return str(path)
+
+
+def _news(i, **extra):
+    return {"headline": f"H{i}", "source_url": f"https://example.com/{i}", "positivity": 70, **extra}
+
+
+def test_streams_gzip_in_batches(db, tmp_path):
+    """Gzipped files load in --batch sized chunks; ISO dates become datetimes."""
+    path = _jsonl(tmp_path / "news.jsonl.gz", [
+        _news(i, published_at="2024-06-01T12:00:00Z") for i in range(7)
+    ], gz=True)
+    stats = loader.load("news", [path], batch_size=3)
+
+    assert (stats["read"], stats["inserted"], stats["updated"]) == (7, 7, 0)
+    doc = db.News_reserve.find_one({"source_url": "https://example.com/3"})
+    assert doc["published_at"] == datetime(2024, 6, 1, 12, 0)
+    assert isinstance(doc["created_date"], datetime)
+
+
+def test_reload_updates_on_source_url(db, tmp_path):
+    """Re-loading a file updates existing articles instead of duplicating them."""
+    loader.load("news", [_jsonl(tmp_path / "a.jsonl", [_news(i) for i in range(4)])])
+    first = db.News_reserve.find_one({"source_url": "https://example.com/1"})
+
+    rows = [_news(i, positivity=10) for i in range(1, 6)] + [{"headline": "no url"}]
+    stats = loader.load("news", [_jsonl(tmp_path / "b.jsonl", rows)], batch_size=100)
+
+    assert (stats["inserted"], stats["updated"]) == (3, 3)
+    assert db.News_reserve.count_documents({}) == 7
+    again = db.News_reserve.find_one({"source_url": "https://example.com/1"})
+    assert again["_id"] == first["_id"] and again["positivity"] == 10
+    assert again["created_date"] == first["created_date"]
+
+
+def test_users_hashed_and_keyed_on_email(db, tmp_path):
+    """Plain passwords are hashed, existing hashes kept, emails lower-cased."""
+    path = _jsonl(tmp_path / "users.jsonl", [
+        {"first_name": "A", "email": "A@Example.com", "password": "pw"},
+        {"first_name": "B", "email": "b@example.com", "password": "$2b$12$already"},
+    ])
+    loader.load("users", [path], hash_workers=0)
+    loader.load("users", [path], hash_workers=0)
+
+    users = {u["email"]: u for u in db.Users.find()}
+    assert set(users) == {"a@example.com", "b@example.com"}
+    assert users["a@example.com"]["password"] == "$2b$hashed:pw"
+    assert users["b@example.com"]["password"] == "$2b$12$already"
+
+
+def test_comments_keep_extended_json_ids(db, tmp_path):
+    """{"$oid"} ids are honoured, so a re-load does not duplicate comments."""
+    rows = [{"_id": {"$oid": "64b000000000000000000001"}, "news_id": "n1", "comment_content": "hi"},
+            {"news_id": "n1", "comment_content": "new"}]
+    path = _jsonl(tmp_path / "c.jsonl", rows)
+    loader.load("comments", [path])
+    loader.load("comments", [path])
+    assert db.Comments.count_documents({"comment_content": "hi"}) == 1
+    assert db.Comments.count_documents({"comment_content": "new"}) == 2
+
+
+def test_bad_line_reports_position(db, tmp_path):
+    path = tmp_path / "bad.jsonl"
+    path.write_text('{"headline": "ok"}\n{nope\n')
+    with pytest.raises(ValueError, match="bad.jsonl:2"):
+        loader.load("news", [str(path)])
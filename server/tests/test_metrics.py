@@ -0,0 +1,50 @@
+"""
+Tests for services/metrics.py and the /metrics endpoint
+"""
+import pytest
+
+from app.services import metrics
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def test_prometheus_text_format():
+    c = metrics.counter("test_events_total", "Events", ["kind"])
+    h = metrics.histogram("test_latency_seconds", "Latency", buckets=(0.1, 1))
+    g = metrics.gauge("test_last_seconds", "Last run")
+    c.inc(kind='a"b')
+    c.inc(2, kind='a"b')
+    for v in (0.05, 0.5, 5):
+        h.observe(v)
+    g.set(12.5)
+
+    text = metrics.render()
+    assert "# TYPE test_events_total counter" in text
+    assert 'test_events_total{kind="a\\"b"} 3' in text
+    assert 'test_latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'test_latency_seconds_bucket{le="1"} 2' in text
+    assert 'test_latency_seconds_bucket{le="+Inf"} 3' in text
+    assert "test_latency_seconds_sum 5.55" in text
+    assert "test_latency_seconds_count 3" in text
+    assert "test_last_seconds 12.5" in text
+
+
+def test_registration_is_idempotent_and_labels_checked():
+    a = metrics.counter("test_once_total", "x")
+    assert metrics.counter("test_once_total", "x") is a
+    with pytest.raises(ValueError):
+        a.inc(kind="unexpected")
+
+
+def test_metrics_endpoint(app):
+    metrics.counter("test_hits_total", "Hits").inc()
+    resp = app.test_client().get("/metrics")
+    assert resp.status_code == 200
+    assert resp.content_type.startswith("text/plain; version=0.0.4")
+    assert b"test_hits_total 1" in resp.data
+    assert b"# TYPE zenframe_ingest_stage_seconds histogram" in resp.data
@@ -16,6 +16,10 @@ from app.models import (
     create_news,
     list_news,
     get_news,
+    news_exists,
+    CARD,
+    DETAIL,
+    EXISTENCE,
     add_comment,
     list_comments,
 )
@@ -229,13 +233,13 @@ class TestNewsModels:
                 assert len(result) == 2
                 assert result[0]["news_id"] == "507f1f77bcf86cd799439011"
                 assert result[1]["news_id"] == "507f1f77bcf86cd799439012"
-                assert "full_body" not in result[0]
-                assert "full_body" not in result[1]
                 
-                mock_collection.find.assert_called_once_with({})
+                # the body never leaves the server: a card projection is applied
+                mock_collection.find.assert_called_once_with({}, CARD)
+                assert "full_body" not in CARD
                 mock_cursor.skip.assert_called_once_with(0)
                 mock_cursor.limit.assert_called_once_with(20)
-                mock_cursor.sort.assert_called_once_with("created_date", -1)
+                mock_cursor.sort.assert_called_once_with([("created_date", -1), ("_id", -1)])
 
     def test_list_news_with_filters(self, app):
         """Test listing news with all possible filters."""
@@ -254,19 +258,19 @@ class TestNewsModels:
                 mock_collection.find.assert_called_with({
                     "positivity": {"$gte": 50},
                     "category": "tech"
-                })
+                }, CARD)
                 
                 # Test with only positivity
                 list_news(positivity=50)
                 mock_collection.find.assert_called_with({
                     "positivity": {"$gte": 50}
-                })
+                }, CARD)
                 
                 # Test with only category
                 list_news(category="tech")
                 mock_collection.find.assert_called_with({
                     "category": "tech"
-                })
+                }, CARD)
 
     # def test_get_news_with_invalid_id(self, app):
     #     """Test getting news with invalid ID format."""
@@ -301,7 +305,7 @@ class TestNewsModels:
                 assert "_id" not in result
                 
                 mock_collection.find_one.assert_called_once_with(
-                    {"_id": ObjectId(test_id)}
+                    {"_id": ObjectId(test_id)}, DETAIL
                 )
 
     def test_get_news_not_found(self, app):
@@ -314,6 +318,22 @@ class TestNewsModels:
                 result = get_news("507f1f77bcf86cd799439011")
                 assert result is None
 
+    def test_news_exists_fetches_only_the_id(self, app):
+        """Existence checks project to _id, so the body is never read."""
+        with app.app_context():
+            mock_collection = MagicMock()
+            mock_collection.find_one.return_value = {"_id": ObjectId("507f1f77bcf86cd799439011")}
+
+            with patch('app.models.mongo.db.News_reserve', mock_collection):
+                assert news_exists("507f1f77bcf86cd799439011") is True
+                mock_collection.find_one.assert_called_once_with(
+                    {"_id": ObjectId("507f1f77bcf86cd799439011")}, EXISTENCE
+                )
+                mock_collection.find_one.return_value = None
+                assert news_exists("507f1f77bcf86cd799439011") is False
+                assert news_exists("not-an-id") is False
+                assert mock_collection.find_one.call_count == 2
+
 # ---- Comments Model Tests ----
 class TestCommentModels:
     def test_add_comment(self, app):
@@ -9,7 +9,7 @@ from bson import ObjectId
 from bson.errors import InvalidId
 
 from app import create_app
-from app.models import create_news, list_news, get_news, list_comments
+from app.models import create_news, list_news, get_news, list_comments, CARD, DETAIL
 from app.utils import obj_id, required
 
 # ---- Fixtures ----
@@ -76,7 +76,8 @@ class TestNewsList:
                 positivity=None,
                 category=None,
                 limit=20,
-                offset=0
+                offset=0,
+                after=None
             )
 
     def test_news_list_with_filters(self, client, mock_db):
@@ -91,7 +92,8 @@ class TestNewsList:
                 positivity=50,
                 category='tech',
                 limit=10,
-                offset=5
+                offset=5,
+                after=None
             )
 
     def test_news_list_invalid_params(self, client):
@@ -106,7 +108,8 @@ class TestNewsList:
                 positivity=None,
                 category=None,
                 limit=20,
-                offset=0
+                offset=0,
+                after=None
             )
 
     def test_news_list_boundary_limits(self, client):
@@ -121,7 +124,8 @@ class TestNewsList:
                 positivity=None,
                 category=None,
                 limit=1,
-                offset=0
+                offset=0,
+                after=None
             )
             
             # Test with limit above maximum (should be set to 100)
@@ -131,7 +135,8 @@ class TestNewsList:
                 positivity=None,
                 category=None,
                 limit=100,
-                offset=0
+                offset=0,
+                after=None
             )
 
     def test_news_list_negative_offset(self, client):
@@ -144,9 +149,70 @@ class TestNewsList:
                 positivity=None,
                 category=None,
                 limit=20,
-                offset=0
+                offset=0,
+                after=None
             )
 
+# ---- Test Keyset Pagination ----
+@pytest.fixture
+def feed(app, mock_mongo):
+    """25 articles in mongomock; five share each created_date."""
+    base = datetime(2025, 1, 1)
+    mock_mongo.News_reserve.insert_many([
+        {
+            "_id": ObjectId(f"{i:024x}"),
+            "headline": f"H{i}",
+            "category": "tech" if i % 2 else "world",
+            "positivity": 10 * (i % 10),
+            "created_date": base.replace(hour=i // 5),
+        }
+        for i in range(25)
+    ])
+    with patch('app.models.mongo.db', mock_mongo):
+        yield mock_mongo
+
+
+class TestNewsKeyset:
+    def _walk(self, client, query):
+        ids, cursor, pages = [], None, 0
+        while True:
+            url = f"/api/news?{query}" + (f"&cursor={cursor}" if cursor else "")
+            response = client.get(url)
+            assert response.status_code == 200
+            ids += [d["news_id"] for d in response.get_json()]
+            pages += 1
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                return ids, pages
+
+    def test_cursor_walks_every_article_once(self, client, feed):
+        """Following X-Next-Cursor visits the whole feed in order, ties included."""
+        ids, pages = self._walk(client, "limit=4")
+        expected = [str(d["_id"]) for d in feed.News_reserve.find().sort([("created_date", -1), ("_id", -1)])]
+        assert ids == expected
+        assert pages == 7
+
+    def test_cursor_keeps_filters(self, client, feed):
+        ids, _ = self._walk(client, "limit=3&category=tech&positivity=50")
+        docs = [feed.News_reserve.find_one({"_id": ObjectId(i)}) for i in ids]
+        assert len(docs) == 6
+        assert all(d["category"] == "tech" and d["positivity"] >= 50 for d in docs)
+
+    def test_pages_stay_stable_while_articles_arrive(self, client, feed):
+        """A newer insert does not shift the next page (it would with offset)."""
+        first = client.get("/api/news?limit=5")
+        feed.News_reserve.insert_one({"headline": "new", "created_date": datetime(2026, 1, 1)})
+        second = client.get(f"/api/news?limit=5&cursor={first.headers['X-Next-Cursor']}")
+        seen = {d["news_id"] for d in first.get_json()}
+        assert not seen & {d["news_id"] for d in second.get_json()}
+        assert second.get_json()[0]["headline"] == "H19"
+
+    def test_invalid_cursor(self, client):
+        response = client.get("/api/news?cursor=not-a-cursor")
+        assert response.status_code == 400
+        assert response.get_json()["error"] == "Invalid cursor"
+
+
 # ---- Test News Detail Endpoint ----
 class TestNewsDetail:
     def test_news_detail_success(self, client, mock_db):
@@ -207,12 +273,12 @@ class TestNewsModels:
                     "positivity": {"$gte": 50},
                     "category": "tech"
                 }
-                mock_collection.find.assert_called_once_with(expected_query)
+                mock_collection.find.assert_called_once_with(expected_query, CARD)
 
                 # Verify cursor operations
                 mock_cursor.skip.assert_called_once_with(5)
                 mock_cursor.limit.assert_called_once_with(10)
-                mock_cursor.sort.assert_called_once_with("created_date", -1)
+                mock_cursor.sort.assert_called_once_with([("created_date", -1), ("_id", -1)])
 
     def test_get_news_by_id(self, app):
         """Test get_news model function."""
@@ -239,7 +305,7 @@ class TestNewsModels:
                 assert "headline" in result
                 
                 # Verify the query
-                mock_collection.find_one.assert_called_once_with({"_id": ObjectId(test_id)})
+                mock_collection.find_one.assert_called_once_with({"_id": ObjectId(test_id)}, DETAIL)
 
 # ---- Test Utils ----
 class TestUtils:
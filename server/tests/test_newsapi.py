@@ -0,0 +1,95 @@
+"""
+Tests for services/newsapi.py against a local stub HTTP server
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from app.services.newsapi import NewsAPIClient, NewsAPIError
+
+
+class _Stub(BaseHTTPRequestHandler):
+    """Serves the scripted (status, headers) list, then 200s."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        server = self.server
+        server.ports.add(self.client_address[1])
+        server.hits += 1
+        status, headers = server.script.pop(0) if server.script else (200, {})
+        body = json.dumps({"data": [{"url": "https://example.com/1"}]}).encode()
+        self.send_response(status)
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Stub)
+    server.script, server.hits, server.ports = [], 0, set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/v1/news/all"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_returns_json_and_records_timing(stub):
+    """Decoded JSON comes back with a timing record."""
+    client = NewsAPIClient(stub.url)
+    data = client.fetch({"page": 1})
+    assert data["data"][0]["url"] == "https://example.com/1"
+    assert client.last_timing.status == 200
+    assert client.last_timing.attempts == 1
+    assert client.last_timing.elapsed > 0
+
+
+def test_connection_is_reused(stub):
+    """Keep-alive: several pages travel over one pooled connection."""
+    client = NewsAPIClient(stub.url)
+    for page in range(3):
+        client.fetch({"page": page})
+    assert stub.hits == 3
+    assert len(stub.ports) == 1
+
+
+def test_retries_5xx_and_429_honouring_retry_after(stub):
+    """503 and 429 are retried; Retry-After sets the delay."""
+    stub.script = [(503, {}), (429, {"Retry-After": "0"})]
+    client = NewsAPIClient(stub.url, backoff=0.01)
+    with patch("app.services.newsapi.time.sleep") as sleep:
+        client.fetch({"page": 1})
+    assert stub.hits == 3
+    assert client.last_timing.attempts == 3
+    assert sleep.call_args_list[1].args[0] == 0.0  # Retry-After wins over backoff
+
+
+def test_gives_up_after_max_retries(stub):
+    """Persistent 5xx raises after max_retries + 1 attempts."""
+    stub.script = [(500, {})] * 5
+    client = NewsAPIClient(stub.url, max_retries=2, backoff=0.001)
+    with pytest.raises(NewsAPIError):
+        client.fetch({"page": 1})
+    assert stub.hits == 3
+    assert client.last_timing.status == 500
+
+
+def test_client_errors_are_not_retried(stub):
+    """A 4xx other than 429 fails immediately."""
+    stub.script = [(401, {})]
+    client = NewsAPIClient(stub.url)
+    with pytest.raises(NewsAPIError, match="401"):
+        client.fetch({"page": 1})
+    assert stub.hits == 1
@@ -0,0 +1,34 @@
+"""
+Tests for services/normalise.py
+"""
+import pytest
+
+from app.services.normalise import normalise
+
+
+@pytest.mark.parametrize("raw, expected", [
+    (None, ""),
+    ("  \n\t ", ""),
+    ("<p>Hello</p><p>world</p>", "Hello world"),
+    ("AT&amp;T&nbsp;&#8212; &quot;ok&quot;", "AT&T — \"ok\""),
+    ("&lt;b&gt;literal&lt;/b&gt;", "<b>literal</b>"),
+    ("a < b and c > d", "a < b and c > d"),
+    ("x<script type='t'>var s = '<p>no</p>';</script>y", "x y"),
+    ("x<STYLE>p { color: red }</STYLE>y", "x y"),
+    ("x<!-- hidden <b>markup</b> -->y", "x y"),
+    ("kept<script>never closed <p>", "kept"),
+])
+def test_normalise(raw, expected):
+    assert normalise(raw) == expected
+
+
+def test_char_budget_stops_early():
+    body = "<p>" + "word " * 10_000 + "</p>" * 5_000
+    out = normalise(body, max_chars=100)
+    assert len(out) <= 100 and out.startswith("word word") and not out.endswith(" ")
+
+
+def test_word_budget_keeps_whole_words():
+    text = "<b>one</b> AT&amp;T <i>three</i> four"
+    assert normalise(text, max_words=2) == "one AT&T"
+    assert normalise(text, max_words=10) == "one AT&T three four"
@@ -0,0 +1,85 @@
+"""
+Tests for services/pipeline.py
+"""
+import threading
+import time
+import pytest
+
+from app.services.pipeline import run_pipeline
+
+
+def test_items_flow_through_stages_in_order():
+    """Every item passes each stage once, in source order."""
+    out = []
+    run_pipeline(range(10), [lambda x: x * 2, lambda x: x + 1, out.append])
+    assert out == [i * 2 + 1 for i in range(10)]
+
+
+def test_none_drops_item():
+    """A stage returning None filters the item out."""
+    out = []
+    run_pipeline(range(6), [lambda x: x if x % 2 else None, out.append])
+    assert out == [1, 3, 5]
+
+
+def test_stages_overlap():
+    """Two slow stages run concurrently rather than back to back."""
+    def slow(x):
+        time.sleep(0.05)
+        return x
+
+    start = time.monotonic()
+    run_pipeline(range(6), [slow, slow, lambda x: None])
+    # serial would be 6 × 2 × 0.05 = 0.6 s; pipelined ≈ 7 × 0.05
+    assert time.monotonic() - start < 0.5
+
+
+def test_bounded_queues_apply_backpressure():
+    """The source cannot run far ahead of a blocked stage."""
+    produced = []
+    gate = threading.Event()
+
+    def source():
+        for i in range(50):
+            produced.append(i)
+            yield i
+
+    def blocked(x):
+        gate.wait(2)
+
+    t = threading.Thread(target=run_pipeline, args=(source(), [blocked]), kwargs={"maxsize": 2})
+    t.start()
+    time.sleep(0.3)
+    assert len(produced) <= 4
+    gate.set()
+    t.join()
+    assert len(produced) == 50
+
+
+def test_stage_failure_stops_pipeline_and_reraises():
+    """A failing stage shuts every thread down and surfaces its error."""
+    seen = []
+
+    def source():
+        for i in range(1000):
+            yield i
+
+    def boom(x):
+        if x == 3:
+            raise RuntimeError("stage failed")
+        return x
+
+    with pytest.raises(RuntimeError, match="stage failed"):
+        run_pipeline(source(), [boom, seen.append])
+    assert all(x < 3 for x in seen)
+    assert not [t for t in threading.enumerate() if t.name.startswith("pipeline-")]
+
+
+def test_source_failure_reraises():
+    """An exception raised by the source iterator is surfaced too."""
+    def source():
+        yield 1
+        raise ValueError("fetch failed")
+
+    with pytest.raises(ValueError, match="fetch failed"):
+        run_pipeline(source(), [lambda x: x])
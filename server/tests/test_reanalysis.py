@@ -0,0 +1,113 @@
+"""
+Tests for services/workqueue.py and services/reanalysis.py (mongomock-backed)
+"""
+from datetime import datetime, timedelta
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from app.services import ingest, reanalysis
+from app.services.circuit import CircuitBreaker
+from app.services.workqueue import MongoQueue
+
+
+@pytest.fixture
+def db(monkeypatch, mock_mongo):
+    """One in-memory database behind every module's `mongo`."""
+    database = mock_mongo
+    fake = MagicMock(db=database)
+    for mod in ("reanalysis", "workqueue", "analysis_cache", "ingest"):
+        monkeypatch.setattr(f"app.services.{mod}.mongo", fake)
+    monkeypatch.setattr(ingest, "LLM_BREAKER", CircuitBreaker("test"))
+    monkeypatch.setenv("LLM_RPS", "0")
+    return database
+
+
+def _flag(db, n):
+    for i in range(n):
+        url = f"https://example.com/{i}"
+        db.News_reserve.insert_one({
+            "source_url": url, "orig_headline": f"T{i}", "full_body": f"B{i}",
+            "headline": f"T{i}", "positivity": 50, "category": "other",
+            "needs_reanalysis": True,
+        })
+        ingest.REANALYSIS_QUEUE.put(url, {"source_url": url})
+
+
+# ---- Queue ----
+class TestMongoQueue:
+    def test_claim_order_lease_and_ack(self, db):
+        """Highest priority first; a leased job is invisible until acked or expired."""
+        q = MongoQueue("Jobs")
+        q.put("low", {"n": 1}, priority=0)
+        q.put("high", {"n": 2}, priority=5)
+
+        job = q.claim(lease_seconds=60)
+        assert job["_id"] == "high" and job["attempts"] == 1
+        assert q.claim(lease_seconds=60)["_id"] == "low"
+        assert q.claim(lease_seconds=60) is None
+
+        assert q.ack(job)
+        assert db.Jobs.count_documents({}) == 1
+
+    def test_release_and_dead_letter(self, db):
+        """Released jobs come back; after max_attempts they stay parked."""
+        q = MongoQueue("Jobs", max_attempts=2)
+        q.put("k", {})
+        q.release(q.claim(60), delay=0, error="boom")
+        job = q.claim(60)
+        assert job["attempts"] == 2 and job["last_error"] == "boom"
+        q.release(job)
+        assert q.claim(60) is None
+        assert db.Jobs.find_one({"_id": "k"})["attempts"] == 2
+
+    def test_stale_ack_is_ignored(self, db):
+        """A worker whose lease expired cannot ack the re-claimed job."""
+        q = MongoQueue("Jobs")
+        q.put("k", {})
+        stale = q.claim(60)
+        db.Jobs.update_one({"_id": "k"}, {"$set": {"lease_until": datetime.utcnow() - timedelta(seconds=1)}})
+        q.claim(60)
+        assert not q.ack(stale)
+
+
+# ---- Drain ----
+def test_drain_rescores_flagged_articles(db):
+    """Queued articles get real scores, lose the flag and leave the queue."""
+    _flag(db, 3)
+    with patch("app.services.ingest._llm_analyse", side_effect=lambda t, b: (f"New {t}", b, 88, "science")):
+        assert reanalysis.drain(batch_size=10) == 3
+
+    doc = db.News_reserve.find_one({"source_url": "https://example.com/1"})
+    assert (doc["headline"], doc["positivity"], doc["category"]) == ("New T1", 88, "science")
+    assert "needs_reanalysis" not in doc
+    assert db.Reanalysis_queue.count_documents({}) == 0
+    assert db.Analysis_cache.count_documents({}) == 3
+
+
+def test_drain_releases_with_backoff_when_llm_fails(db):
+    """An LLM outage releases the job with a growing delay."""
+    _flag(db, 1)
+    with patch("app.services.ingest._llm_analyse", side_effect=ConnectionError("down")), \
+         patch("app.services.ingest.time.sleep"):
+        assert reanalysis.drain() == 0
+
+    job = db.Reanalysis_queue.find_one()
+    assert job["attempts"] == 1
+    assert job["lease_until"] > datetime.utcnow() + timedelta(seconds=60)
+    assert db.News_reserve.find_one()["needs_reanalysis"] is True
+
+
+def test_drain_waits_while_ingest_runs_or_circuit_open(db):
+    """No claims while ingest is active or the circuit is open."""
+    _flag(db, 1)
+    ingest.INGEST_ACTIVE.set()
+    try:
+        assert reanalysis.drain() == 0
+    finally:
+        ingest.INGEST_ACTIVE.clear()
+
+    for _ in range(5):
+        ingest.LLM_BREAKER.record_failure()
+    assert reanalysis.drain() == 0
+    assert db.Reanalysis_queue.find_one()["attempts"] == 0
@@ -0,0 +1,83 @@
+"""
+Tests for rescore.py (mongomock-backed)
+"""
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from app import rescore
+from app.services import ingest
+from app.services.circuit import CircuitBreaker
+
+
+@pytest.fixture
+def db(monkeypatch, mock_mongo):
+    fake = MagicMock(db=mock_mongo)
+    for target in ("app.rescore.mongo", "app.services.analysis_cache.mongo"):
+        monkeypatch.setattr(target, fake)
+    monkeypatch.setattr(ingest, "LLM_BREAKER", CircuitBreaker("test"))
+    monkeypatch.setenv("LLM_RPS", "0")
+    for i in range(7):
+        mock_mongo.News_reserve.insert_one({
+            "orig_headline": f"T{i}", "full_body": f"B{i}", "headline": f"T{i}",
+            "positivity": 50, "category": "other", "llm_model": "old-model",
+            "prompt_version": "0",
+        })
+    return mock_mongo
+
+
+def _llm(title, body):
+    return f"New {title}", body, 77, "science"
+
+
+def test_rescores_every_stale_doc_and_stamps_version(db):
+    """Every doc ends up scored by the current model/prompt."""
+    with patch("app.services.ingest._llm_analyse", side_effect=_llm):
+        stats = rescore.run(batch_size=3)
+
+    assert stats["rescored"] == 7 and stats["failed"] == 0
+    assert db.News_reserve.count_documents({
+        "llm_model": ingest.LLM_MODEL, "prompt_version": ingest.PROMPT_VERSION, "positivity": 77,
+    }) == 7
+    assert db.Ingest_state.find_one({"_id": "rescore"})["done"] is True
+
+
+def test_dry_run_writes_nothing(db):
+    """--dry-run only counts and estimates."""
+    with patch("app.services.ingest._llm_analyse", side_effect=_llm) as llm:
+        stats = rescore.run(dry_run=True)
+    assert stats["total"] == 7
+    llm.assert_not_called()
+    assert db.News_reserve.count_documents({"positivity": 77}) == 0
+
+
+def test_resumes_after_crash_without_redoing_work(db):
+    """A crash mid-run resumes from the checkpoint; no article is analysed twice."""
+    real_write, calls = rescore._write, []
+
+    def crash_on_second(items):
+        calls.append(len(items))
+        if len(calls) == 2:
+            raise RuntimeError("killed")
+        return real_write(items)
+
+    with patch("app.services.ingest._llm_analyse", side_effect=_llm) as llm:
+        with patch("app.rescore._write", side_effect=crash_on_second):
+            with pytest.raises(RuntimeError):
+                rescore.run(batch_size=3)
+        assert db.News_reserve.count_documents({"positivity": 77}) == 3
+
+        stats = rescore.run(batch_size=3)
+
+    assert stats["total"] == 4
+    assert llm.call_count == 7  # analysed-but-unwritten batches come from the cache
+    assert db.News_reserve.count_documents({"positivity": 77}) == 7
+
+
+def test_failed_docs_are_left_untouched(db):
+    """Docs the LLM cannot score keep their old values and version."""
+    with patch("app.services.ingest._llm_analyse", side_effect=ingest.BadLLMReply("bad")), \
+         patch("app.services.ingest.time.sleep"):
+        stats = rescore.run(batch_size=10, limit=2)
+    assert stats["failed"] == 2
+    assert db.News_reserve.count_documents({"llm_model": "old-model"}) == 7
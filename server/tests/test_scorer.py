@@ -0,0 +1,103 @@
+"""
+Tests for the local scorer (services/scorer.py) and train_scorer.py
+"""
+import random
+from unittest.mock import MagicMock
+
+import pytest
+
+from app import train_scorer
+from app.services import ingest, scorer
+
+
+def _corpus(n=200, seed=1):
+    rng = random.Random(seed)
+    vocab = {
+        "sports": ["match", "goal", "league", "coach", "season", "striker"],
+        "tech": ["software", "chip", "startup", "cloud", "app", "developer"],
+    }
+    mood = {90: ["celebrates", "record", "triumph"], 15: ["crisis", "injury", "collapse"]}
+    rows = []
+    for i in range(n):
+        cat = "sports" if i % 2 else "tech"
+        pos = 90 if (i // 2) % 2 else 15
+        words = rng.choices(vocab[cat], k=8) + rng.choices(mood[pos], k=3)
+        rows.append({
+            "orig_headline": " ".join(words[:4]), "full_body": " ".join(words),
+            "category": cat, "positivity": pos,
+        })
+    return rows
+
+
+@pytest.fixture(scope="module")
+def model():
+    rows = _corpus()
+    return scorer.LocalScorer.train(
+        [scorer.text_of(r["orig_headline"], r["full_body"]) for r in rows],
+        [r["category"] for r in rows],
+        [r["positivity"] for r in rows],
+    )
+
+
+def test_learns_category_and_positivity(model):
+    """Held-out synthetic articles are labelled like the 'LLM' did."""
+    test = _corpus(40, seed=2)
+    pos, cats, conf = model.predict([scorer.text_of(r["orig_headline"], r["full_body"]) for r in test])
+    assert sum(c == r["category"] for c, r in zip(cats, test)) >= 38
+    assert sum(abs(p - r["positivity"]) <= 25 for p, r in zip(pos, test)) >= 36
+    assert all(1 <= p <= 100 for p in pos) and all(0 < c <= 1 for c in conf)
+
+
+def test_save_load_roundtrip(model, tmp_path):
+    path = str(tmp_path / "m.npz")
+    model.save(path)
+    loaded = scorer.LocalScorer.load(path)
+    texts = ["coach celebrates goal", "cloud startup crisis"]
+    assert loaded.tag == model.tag
+    assert loaded.predict(texts)[1] == model.predict(texts)[1]
+    assert scorer.LocalScorer.load(str(tmp_path / "missing.npz")) is None
+
+
+def test_fallback_uses_local_scorer(model, monkeypatch):
+    """LLM failures get the scorer's labels instead of 50/'other'."""
+    monkeypatch.setattr(ingest, "_SCORER", {"model": model})
+    (head, _, pos, cat), = ingest._fallback_many([{"title": "T", "body": "goal league striker triumph"}])
+    assert head == "T" and cat == "sports" and pos > 50
+
+    monkeypatch.setattr(ingest, "_SCORER", {"model": None})
+    assert ingest._fallback_many([{"title": "T", "body": "x"}])[0][2:] == (50, "other")
+
+
+def test_shortcut_skips_llm_for_confident_predictions(model, monkeypatch):
+    monkeypatch.setattr(ingest, "_SCORER", {"model": model})
+    monkeypatch.setenv("LOCAL_SCORER_SHORTCUT", "0.6")
+    monkeypatch.setattr(ingest.analysis_cache, "lookup", lambda keys: {})
+    monkeypatch.setattr(ingest.analysis_cache, "store", lambda *a: None)
+    dedup = MagicMock(match_many=lambda entries: {})
+    llm = MagicMock(return_value=[])
+    monkeypatch.setattr(ingest, "_analyse_many", llm)
+
+    item = {"url": "u", "simhash": 0, "key": "k", "title": "coach", "body": "goal league striker season match"}
+    ingest._analyse_page((1, [item]), 1, None, 1, dedup)
+
+    assert item["scored_by"] == model.tag and item["analysis"][3] == "sports"
+    assert llm.call_args[0][0] == []
+
+
+def test_report_on_labelled_history(mock_mongo, monkeypatch, tmp_path):
+    monkeypatch.setattr("app.train_scorer.mongo", MagicMock(db=mock_mongo))
+    rows = _corpus(100)
+    for r in rows:
+        r["llm_model"] = "llama"
+    rows[0]["llm_model"] = "local:x"         # scored by an earlier local model
+    rows[1]["needs_reanalysis"] = True       # fallback score
+    mock_mongo.News_reserve.insert_many(rows)
+
+    path = str(tmp_path / "m.npz")
+    report = train_scorer.run(holdout=0.2, path=path)
+
+    assert report["n"] == 19
+    assert report["category_agreement"] > 0.9
+    assert [t["threshold"] for t in report["thresholds"]] == list(train_scorer.THRESHOLDS)
+    assert report["thresholds"][0]["seconds_saved_per_cycle"] > 0
+    assert scorer.LocalScorer.load(path).meta["n_train"] == 98
@@ -0,0 +1,87 @@
+"""
+Tests for the provider stand-ins (stubs.py) and record/replay (services/cassette.py)
+"""
+import json
+
+import pytest
+
+from app import stubs
+from app.services import cassette, ingest
+from app.services.newsapi import NewsAPIClient, NewsAPIError
+
+
+@pytest.fixture
+def servers(monkeypatch):
+    news = stubs.serve(stubs.NewsAPIStub(stubs.make_articles(7), stubs.Behaviour()))
+    llm = stubs.serve(stubs.TogetherStub(stubs.Behaviour()))
+    monkeypatch.setenv("TOGETHER_BASE_URL", f"http://127.0.0.1:{llm.server_port}/v1")
+    monkeypatch.setenv("TOGETHER_API_KEY", "stub")
+    monkeypatch.setattr(ingest, "_TOGETHER", None)
+    yield f"http://127.0.0.1:{news.server_port}/v1/news/all"
+    news.shutdown()
+    llm.shutdown()
+    ingest._TOGETHER = None
+
+
+def test_newsapi_stub_pages_and_filters(servers):
+    client = NewsAPIClient(servers)
+    page = client.fetch({"page": 2, "page_size": 3})
+    assert page["meta"]["found"] == 7
+    assert [a["uuid"] for a in page["data"]] == ["stub-1-3", "stub-1-4", "stub-1-5"]
+    newer = client.fetch({"page": 1, "page_size": 10, "published_after": "2024-06-01T11:50:00"})
+    assert len(newer["data"]) == 2
+
+
+def test_together_stub_answers_single_and_batch_prompts(servers):
+    head, _, pos, cat = ingest._llm_analyse("Park opens", "body")
+    assert head == "Good news: Park opens" and 1 <= pos <= 100 and cat in ingest.ALLOWED_CATEGORIES
+    batch = ingest._llm_analyse_batch([{"title": "A", "body": "a"}, {"title": "B", "body": "b"}])
+    assert [r[0] for r in batch] == ["Good news: A", "Good news: B"]
+
+
+def test_failures_and_rate_limit():
+    assert stubs.Behaviour(error_rate=1).gate() == (503, {})
+    limited = stubs.Behaviour(rps=1)
+    assert limited.gate() is None
+    status, headers = limited.gate()
+    assert status == 429 and "Retry-After" in headers
+
+    news = stubs.serve(stubs.NewsAPIStub([], stubs.Behaviour(error_rate=1)))
+    try:
+        with pytest.raises(NewsAPIError):
+            NewsAPIClient(f"http://127.0.0.1:{news.server_port}/v1/news/all", max_retries=1, backoff=0).fetch({})
+    finally:
+        news.shutdown()
+
+
+def test_record_then_replay(servers, monkeypatch, tmp_path):
+    tape = tmp_path / "tape.jsonl"
+    monkeypatch.setenv("PROVIDER_RECORD", str(tape))
+    NewsAPIClient(servers).fetch({"page": 1, "page_size": 2, "api_token": "secret"})
+    ingest._llm_analyse("Park opens", "body")
+
+    lines = tape.read_text()
+    assert "secret" not in lines
+    recorded = cassette.load(str(tape))
+    assert {p for p, _ in recorded} == {"newsapi", "together"}
+
+    # Edit the recording: replay must serve it verbatim, whatever the window.
+    for (provider, key), resp in recorded.items():
+        if provider == "together":
+            resp["content"] = json.dumps({
+                "rewritten_headline": "Replayed", "summary": "s", "positivity": 7, "category": "tech",
+            })
+    news = stubs.serve(stubs.NewsAPIStub([], stubs.Behaviour(), recorded))
+    llm = stubs.serve(stubs.TogetherStub(stubs.Behaviour(), recorded))
+    monkeypatch.delenv("PROVIDER_RECORD")
+    monkeypatch.setenv("TOGETHER_BASE_URL", f"http://127.0.0.1:{llm.server_port}/v1")
+    monkeypatch.setattr(ingest, "_TOGETHER", None)
+    try:
+        page = NewsAPIClient(f"http://127.0.0.1:{news.server_port}/v1/news/all").fetch(
+            {"page": 1, "page_size": 2, "published_after": "2030-01-01T00:00:00"}
+        )
+        assert len(page["data"]) == 2
+        assert ingest._llm_analyse("Park opens", "body") == ("Replayed", "s", 7, "tech")
+    finally:
+        news.shutdown()
+        llm.shutdown()
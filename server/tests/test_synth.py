@@ -0,0 +1,65 @@
+"""
+Tests for synth.py (synthetic dataset generator)
+"""
+import glob
+from datetime import datetime
+
+import numpy as np
+
+from app import loader, synth
+
+SCALE = synth.Scale(users=50, news=400, comments=600, reactions=1500, days=30,
+                    end=datetime(2025, 1, 1), seed=7)
+
+
+def test_same_seed_same_rows_whatever_the_split():
+    """Rows are a pure function of (seed, row): chunking does not change them."""
+    rows = np.arange(100, 140)
+    whole = list(synth.gen_news(rows, SCALE))
+    parts = list(synth.gen_news(rows[:15], SCALE)) + list(synth.gen_news(rows[15:], SCALE))
+    assert whole == parts
+    other = list(synth.gen_news(rows, SCALE._replace(seed=8)))
+    assert [d["positivity"] for d in other] != [d["positivity"] for d in whole]
+
+
+def test_shapes_and_references(mock_mongo):
+    """Documents look like the app's and comments/reactions point at real rows."""
+    counts = synth.generate(SCALE, {"db": mock_mongo})
+    assert counts == {"users": 50, "news": 400, "comments": 600, "reactions": 1500}
+
+    news = {str(d["_id"]): d for d in mock_mongo.News_reserve.find()}
+    users = {str(d["_id"]) for d in mock_mongo.Users.find()}
+    newest = max(d["created_date"] for d in news.values())
+    assert newest < SCALE.end and min(d["created_date"] for d in news.values()) >= datetime(2024, 12, 2)
+    assert all(1 <= d["positivity"] <= 100 for d in news.values())
+
+    comments = list(mock_mongo.Comments.find())
+    assert all(c["news_id"] in news and c["user_id"] in users for c in comments)
+    assert all(c["created_date"] >= news[c["news_id"]]["created_date"] for c in comments)
+    reactions = list(mock_mongo.Reactions.find())
+    assert {r["reaction_type"] for r in reactions} == {"1", "2", "3"}
+
+    # skew: the newest tenth of the articles draws a large share of the traffic
+    recent = sorted(news, key=lambda k: news[k]["created_date"])[-40:]
+    share = sum(r["news_id"] in set(recent) for r in reactions) / len(reactions)
+    assert share > 0.35
+
+    # re-running is a no-op rather than a duplicate load
+    synth.generate(SCALE, {"db": mock_mongo}, kinds=("reactions",))
+    assert mock_mongo.Reactions.count_documents({}) == 1500
+
+
+def test_jsonl_output_loads_with_loader(mock_mongo, monkeypatch, tmp_path):
+    """--out writes gzipped chunks that app.loader reads back unchanged."""
+    monkeypatch.setattr(synth, "CHUNK", 150)
+    monkeypatch.setattr(loader.mongo, "db", mock_mongo)
+    synth.generate(SCALE, {"out": str(tmp_path)}, kinds=("news", "comments"))
+
+    files = sorted(glob.glob(str(tmp_path / "news-*.jsonl.gz")))
+    assert len(files) == 3
+    loader.load("news", files)
+    loader.load("comments", sorted(glob.glob(str(tmp_path / "comments-*.jsonl.gz"))))
+
+    expected = next(synth.gen_news(np.arange(5, 6), SCALE))
+    assert mock_mongo.News_reserve.find_one({"_id": expected["_id"]}) == expected
+    assert mock_mongo.Comments.count_documents({}) == 600
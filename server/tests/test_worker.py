@@ -0,0 +1,58 @@
+"""
+Tests for the Jobs queue (services/jobs.py) and worker.py (mongomock-backed)
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app import scheduler, worker
+from app.services import jobs
+
+
+@pytest.fixture
+def db(monkeypatch, mock_mongo):
+    monkeypatch.setattr("app.services.workqueue.mongo", MagicMock(db=mock_mongo))
+    return mock_mongo
+
+
+def test_enqueue_is_idempotent_per_task(db):
+    jobs.enqueue("ingest")
+    jobs.enqueue("ingest")
+    jobs.enqueue("reanalyse")
+    assert db.Jobs.count_documents({}) == 2
+    with pytest.raises(ValueError):
+        jobs.enqueue("nope")
+
+
+def test_work_one_runs_highest_priority_and_acks(db):
+    jobs.enqueue("reanalyse")
+    jobs.enqueue("ingest", backfill=True)
+    with patch("app.services.jobs.run_ingest", return_value=3) as ingest, \
+         patch("app.services.jobs.drain", return_value=0) as drain:
+        assert worker.work_one("w1", lease=60)
+        ingest.assert_called_once_with(True)
+        drain.assert_not_called()
+        assert worker.work_one("w1", lease=60)
+        drain.assert_called_once()
+        assert not worker.work_one("w1", lease=60)
+    assert db.Jobs.count_documents({}) == 0
+
+
+def test_failed_job_is_released_with_backoff(db):
+    jobs.enqueue("reanalyse")
+    with patch("app.services.jobs.drain", side_effect=RuntimeError("boom")):
+        assert worker.work_one("w1", lease=60)
+    job = db.Jobs.find_one({"_id": "reanalyse"})
+    assert job["attempts"] == 1 and "boom" in job["last_error"]
+    assert not worker.work_one("w2", lease=60)  # invisible until the backoff ends
+
+
+def test_queue_mode_scheduler_only_enqueues(db):
+    sched = MagicMock()
+    scheduler.register_jobs(sched, mode="queue")
+    funcs = {c.kwargs["id"]: c.kwargs["func"] for c in sched.add_job.call_args_list}
+    with patch("app.services.jobs.run_ingest") as ingest:
+        funcs["news_ingest_job"]()
+        funcs["news_reanalysis_job"]()
+    ingest.assert_not_called()
+    assert sorted(d["_id"] for d in db.Jobs.find()) == ["ingest", "reanalyse"]